@@ -109,6 +109,12 @@ ROLE_BINDINGS_DELETED = Counter(
     ['namespace', 'kind']
 )
 
+BINDING_APPLIES = Counter(
+    'k8s_iam_operator_binding_applies_total',
+    'Binding create-or-update outcomes',
+    ['kind', 'result']  # result: skipped, created, patched, replaced
+)
+
 # ==================== Namespace Metrics ====================
 
 NAMESPACES_CREATED = Counter(
@@ -135,6 +141,11 @@ KUBECONFIGS_GENERATED = Counter(
     ['namespace']
 )
 
+KUBECONFIG_WRITES_SKIPPED = Counter(
+    'k8s_iam_operator_kubeconfig_writes_skipped_total',
+    'Kubeconfig secret writes skipped because the content hash matched'
+)
+
 # ==================== Handler Metrics ====================
 
 HANDLER_DURATION = Histogram(
@@ -165,6 +176,75 @@ RECONCILIATION_DURATION = Histogram(
     buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
 )
 
+RECONCILE_PHASE_DURATION = Histogram(
+    'k8s_iam_operator_reconcile_phase_duration_seconds',
+    'Duration of one phase of a reconciliation in seconds',
+    ['resource_type', 'phase'],  # phase: validate, service_account, namespace, rbac, kubeconfig
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+)
+
+RECONCILE_API_CALLS = Histogram(
+    'k8s_iam_operator_reconcile_api_calls',
+    'Kubernetes API calls made by one reconciliation',
+    ['resource_type', 'action'],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500]
+)
+
+# ==================== Kubernetes API Metrics ====================
+
+KUBE_API_REQUEST_DURATION = Histogram(
+    'k8s_iam_operator_kube_api_request_duration_seconds',
+    'Kubernetes API call latency in seconds',
+    ['verb', 'resource', 'code'],  # code: 2xx or the HTTP status of the error
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+)
+
+# ==================== Cache Metrics ====================
+
+EXISTENCE_CACHE_LOOKUPS = Counter(
+    'k8s_iam_operator_existence_cache_lookups_total',
+    'Existence check lookups served from or missed by the cache',
+    ['cache', 'result']  # result: hit, miss
+)
+
+# ==================== Work Queue Metrics ====================
+
+WORK_QUEUE_DEPTH = Gauge(
+    'k8s_iam_operator_work_queue_depth',
+    'Number of keys waiting in a work queue',
+    ['queue']
+)
+
+WORK_QUEUE_ENQUEUES = Counter(
+    'k8s_iam_operator_work_queue_enqueues_total',
+    'Work queue enqueues; coalesced / total is the coalesce ratio',
+    ['queue', 'result']  # result: queued, coalesced
+)
+
+# ==================== Audit Metrics ====================
+
+AUDIT_QUEUE_DEPTH = Gauge(
+    'k8s_iam_operator_audit_queue_depth',
+    'Number of audit events waiting to be written'
+)
+
+AUDIT_EVENTS_WRITTEN = Counter(
+    'k8s_iam_operator_audit_events_written_total',
+    'Audit events written to a sink',
+    ['sink']
+)
+
+AUDIT_EVENTS_DROPPED = Counter(
+    'k8s_iam_operator_audit_events_dropped_total',
+    'Audit events lost before reaching a sink',
+    ['reason']  # reason: queue_full, sink_error, retention
+)
+
+AUDIT_SPOOL_BACKLOG = Gauge(
+    'k8s_iam_operator_audit_spool_backlog_bytes',
+    'Bytes of spooled audit events not yet replayed to the sink'
+)
+
 # ==================== Legacy Gauges (for compatibility) ====================
 
 ACTIVE_USERS = Gauge(
@@ -244,6 +324,11 @@ def set_users_total(namespace: str, user_type: str, count: int) -> None:
     USERS_TOTAL.labels(namespace=namespace, user_type=user_type).set(count)
 
 
+def remove_users_total(namespace: str, user_type: str) -> None:
+    """Remove a total users series."""
+    USERS_TOTAL.remove(namespace, user_type)
+
+
 # Group metrics
 def record_group_created(namespace: str) -> None:
     """Record a group creation."""
@@ -260,11 +345,21 @@ def set_groups_total(namespace: str, count: int) -> None:
     GROUPS_TOTAL.labels(namespace=namespace).set(count)
 
 
+def remove_groups_total(namespace: str) -> None:
+    """Remove a total groups series."""
+    GROUPS_TOTAL.remove(namespace)
+
+
 def set_roles_total(namespace: str, kind: str, count: int) -> None:
     """Set total roles gauge."""
     ROLES_TOTAL.labels(namespace=namespace, kind=kind).set(count)
 
 
+def remove_roles_total(namespace: str, kind: str) -> None:
+    """Remove a total roles series."""
+    ROLES_TOTAL.remove(namespace, kind)
+
+
 # Role metrics
 def record_role_created(namespace: str, kind: str) -> None:
     """Record a role creation."""
@@ -287,6 +382,11 @@ def record_role_binding_deleted(namespace: str, kind: str) -> None:
     ROLE_BINDINGS_DELETED.labels(namespace=namespace, kind=kind).inc()
 
 
+def record_binding_apply(kind: str, result: str) -> None:
+    """Record the outcome of a binding create-or-update."""
+    BINDING_APPLIES.labels(kind=kind, result=result).inc()
+
+
 # Namespace metrics
 def record_namespace_created(network_policy: str = "none") -> None:
     """Record a namespace creation."""
@@ -309,6 +409,11 @@ def record_kubeconfig_generated(namespace: str) -> None:
     KUBECONFIGS_GENERATED.labels(namespace=namespace).inc()
 
 
+def record_kubeconfig_write_skipped() -> None:
+    """Record a kubeconfig secret write skipped as unchanged."""
+    KUBECONFIG_WRITES_SKIPPED.inc()
+
+
 # Handler metrics
 def record_handler_error(handler: str, error_type: str) -> None:
     """Record a handler error."""
@@ -331,3 +436,59 @@ def record_reconciliation(
     RECONCILIATION_DURATION.labels(
         resource_type=resource_type, action=action
     ).observe(duration)
+
+
+def observe_reconcile_phase(resource_type: str, phase: str, duration: float) -> None:
+    """Record the duration of one reconciliation phase."""
+    RECONCILE_PHASE_DURATION.labels(resource_type=resource_type, phase=phase).observe(duration)
+
+
+def observe_reconcile_api_calls(resource_type: str, action: str, calls: int) -> None:
+    """Record the number of API calls made by one reconciliation."""
+    RECONCILE_API_CALLS.labels(resource_type=resource_type, action=action).observe(calls)
+
+
+# Kubernetes API metrics
+def observe_kube_api_request(verb: str, resource: str, code: str, duration: float) -> None:
+    """Record the latency of one Kubernetes API call."""
+    KUBE_API_REQUEST_DURATION.labels(verb=verb, resource=resource, code=code).observe(duration)
+
+
+# Cache metrics
+def record_existence_cache_lookup(cache: str, hit: bool) -> None:
+    """Record an existence cache hit or miss."""
+    EXISTENCE_CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+# Work queue metrics
+def record_queue_enqueue(queue: str, coalesced: bool) -> None:
+    """Record a work queue enqueue and whether it was merged."""
+    WORK_QUEUE_ENQUEUES.labels(
+        queue=queue, result="coalesced" if coalesced else "queued"
+    ).inc()
+
+
+def set_queue_depth(queue: str, depth: int) -> None:
+    """Set the work queue depth gauge."""
+    WORK_QUEUE_DEPTH.labels(queue=queue).set(depth)
+
+
+# Audit metrics
+def set_audit_queue_depth(depth: int) -> None:
+    """Set the audit queue depth gauge."""
+    AUDIT_QUEUE_DEPTH.set(depth)
+
+
+def record_audit_events_written(sink: str, count: int = 1) -> None:
+    """Record audit events written to a sink."""
+    AUDIT_EVENTS_WRITTEN.labels(sink=sink).inc(count)
+
+
+def record_audit_events_dropped(reason: str, count: int = 1) -> None:
+    """Record audit events lost before reaching a sink."""
+    AUDIT_EVENTS_DROPPED.labels(reason=reason).inc(count)
+
+
+def set_audit_spool_backlog(size: int) -> None:
+    """Set the size of the audit spool not yet replayed."""
+    AUDIT_SPOOL_BACKLOG.set(size)
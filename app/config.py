@@ -30,6 +30,45 @@ class OperatorConfig:
 
     # Operator settings
     audit_enabled: bool = os.environ.get('AUDIT_ENABLED', 'True').lower() == 'true'
+    audit_sink: str = os.environ.get('AUDIT_SINK', 'log')  # log, stdout, file, http
+    audit_file_path: str = os.environ.get('AUDIT_FILE_PATH', '')
+    audit_http_url: str = os.environ.get('AUDIT_HTTP_URL', '')
+    audit_queue_size: int = int(os.environ.get('AUDIT_QUEUE_SIZE', '10000'))
+    audit_batch_size: int = int(os.environ.get('AUDIT_BATCH_SIZE', '200'))
+    audit_flush_interval_seconds: float = float(os.environ.get('AUDIT_FLUSH_INTERVAL_SECONDS', '1'))
+    audit_overflow_policy: str = os.environ.get('AUDIT_OVERFLOW_POLICY', 'drop')  # drop, block
+    audit_binding_events: str = os.environ.get('AUDIT_BINDING_EVENTS', 'aggregate')  # aggregate, full
+    audit_spool_dir: str = os.environ.get('AUDIT_SPOOL_DIR', '')
+    audit_spool_segment_bytes: int = int(os.environ.get('AUDIT_SPOOL_SEGMENT_BYTES', str(16 * 1024 * 1024)))
+    audit_spool_segment_seconds: float = float(os.environ.get('AUDIT_SPOOL_SEGMENT_SECONDS', '300'))
+    audit_spool_max_bytes: int = int(os.environ.get('AUDIT_SPOOL_MAX_BYTES', str(1024 * 1024 * 1024)))
+    audit_spool_retention_seconds: float = float(os.environ.get('AUDIT_SPOOL_RETENTION_SECONDS', '604800'))
+    audit_spool_fsync_interval_seconds: float = float(os.environ.get('AUDIT_SPOOL_FSYNC_INTERVAL_SECONDS', '1'))
+
+    # Cache settings
+    rolebinding_cache_enabled: bool = os.environ.get('ROLEBINDING_CACHE_ENABLED', 'True').lower() == 'true'
+    existence_cache_ttl_seconds: float = float(os.environ.get('EXISTENCE_CACHE_TTL_SECONDS', '30'))
+    cluster_identity_cache_enabled: bool = os.environ.get(
+        'CLUSTER_IDENTITY_CACHE_ENABLED', 'True'
+    ).lower() == 'true'
+
+    # Metrics settings
+    metrics_resync_seconds: float = float(os.environ.get('METRICS_RESYNC_SECONDS', '600'))
+    metrics_max_series: int = int(os.environ.get('METRICS_MAX_SERIES', '500'))
+
+    # Credential settings
+    token_mode: str = os.environ.get('TOKEN_MODE', 'secret')  # secret, request
+    token_expiration_seconds: int = int(os.environ.get('TOKEN_EXPIRATION_SECONDS', '86400'))
+    token_wait_seconds: int = int(os.environ.get('TOKEN_WAIT_SECONDS', '10'))
+    token_refresh_interval_seconds: float = float(os.environ.get('TOKEN_REFRESH_INTERVAL_SECONDS', '300'))
+
+    # Ownership label settings
+    adopt_unlabelled_bindings: bool = os.environ.get('ADOPT_UNLABELLED_BINDINGS', 'False').lower() == 'true'
+
+    # Concurrency settings
+    rbac_max_concurrency: int = int(os.environ.get('RBAC_MAX_CONCURRENCY', '10'))
+    handler_max_workers: int = int(os.environ.get('HANDLER_MAX_WORKERS', '20'))
+    reconcile_debounce_seconds: float = float(os.environ.get('RECONCILE_DEBOUNCE_SECONDS', '2'))
 
 
 # Backwards compatible Config class
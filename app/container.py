@@ -4,14 +4,23 @@ This module provides a simple service container that wires up all
 dependencies for the operator services.
 """
 
-from typing import Optional
+from typing import Any, Hashable, Optional
 
+from kubernetes import client
+
+from app.config import get_config
 from app.repositories import (
+    BaseRepository,
     NamespaceRepository,
     ServiceAccountRepository,
     SecretRepository,
     RBACRepository,
+    RoleBindingIndex,
+    ExistenceCache,
+    ClusterIdentityCache,
 )
+from app.models.group import Group
+from app.models.user import User
 from app.repositories.resource_quota_repository import ResourceQuotaRepository
 from app.repositories.network_policy_repository import NetworkPolicyRepository
 from app.services import (
@@ -20,8 +29,10 @@ from app.services import (
     RoleService,
     RBACService,
     KubeconfigService,
+    TokenRefresher,
 )
-from app.utils.audit import AuditLogger, get_audit_logger
+from app.utils.audit import AuditLogger, get_audit_logger, shutdown_audit_logger
+from app.utils.work_queue import CoalescingQueue
 
 
 class ServiceContainer:
@@ -40,6 +51,16 @@ class ServiceContainer:
         """
         self._audit_enabled = audit_enabled
         self._audit_logger: Optional[AuditLogger] = None
+        self._config = get_config()
+
+        # Caches
+        self._rolebinding_index: Optional[RoleBindingIndex] = None
+        self._namespace_cache: Optional[ExistenceCache] = None
+        self._rbac_cache: Optional[ExistenceCache] = None
+        self._cluster_identity: Optional[ClusterIdentityCache] = None
+
+        # Work queues
+        self._reconcile_queue: Optional[CoalescingQueue] = None
 
         # Repositories
         self._ns_repo: Optional[NamespaceRepository] = None
@@ -55,6 +76,7 @@ class ServiceContainer:
         self._user_service: Optional[UserService] = None
         self._group_service: Optional[GroupService] = None
         self._role_service: Optional[RoleService] = None
+        self._token_refresher: Optional[TokenRefresher] = None
 
     @classmethod
     def get_instance(cls, audit_enabled: bool = True) -> "ServiceContainer":
@@ -86,13 +108,118 @@ class ServiceContainer:
             self._audit_logger = get_audit_logger()
         return self._audit_logger
 
+    # ==================== Caches ====================
+
+    @property
+    def rolebinding_index(self) -> Optional[RoleBindingIndex]:
+        """Get the watch-fed RoleBinding index if enabled.
+
+        The index is started on first access and is only consulted by the
+        RBAC repository once its initial LIST has completed.
+        """
+        if not self._config.rolebinding_cache_enabled:
+            return None
+        if self._rolebinding_index is None:
+            rbac_api = BaseRepository.instrument(client.RbacAuthorizationV1Api(BaseRepository().api_client))
+            self._rolebinding_index = RoleBindingIndex(rbac_api)
+            self._rolebinding_index.start()
+        return self._rolebinding_index
+
+    @property
+    def namespace_existence_cache(self) -> Optional[ExistenceCache]:
+        """Get the Namespace existence cache if enabled."""
+        if self._config.existence_cache_ttl_seconds <= 0:
+            return None
+        if self._namespace_cache is None:
+            self._namespace_cache = ExistenceCache(
+                "namespaces", self._config.existence_cache_ttl_seconds
+            )
+        return self._namespace_cache
+
+    @property
+    def rbac_existence_cache(self) -> Optional[ExistenceCache]:
+        """Get the Role/ClusterRole existence cache if enabled."""
+        if self._config.existence_cache_ttl_seconds <= 0:
+            return None
+        if self._rbac_cache is None:
+            self._rbac_cache = ExistenceCache(
+                "roles", self._config.existence_cache_ttl_seconds
+            )
+        return self._rbac_cache
+
+    @property
+    def cluster_identity_cache(self) -> Optional[ClusterIdentityCache]:
+        """Get the watch-invalidated cluster CA and server URL cache if enabled."""
+        if not self._config.cluster_identity_cache_enabled:
+            return None
+        if self._cluster_identity is None:
+            core_api = BaseRepository.instrument(client.CoreV1Api(BaseRepository().api_client))
+            self._cluster_identity = ClusterIdentityCache(self.secret_repo, core_api)
+            self._cluster_identity.start()
+        return self._cluster_identity
+
+    # ==================== Work Queues ====================
+
+    @property
+    def reconcile_queue(self) -> Optional[CoalescingQueue]:
+        """Get the queue merging namespace-triggered binding reconciles.
+
+        Items are keyed by (kind, namespace, name) of the owning User or
+        Group and carry its latest body. Returns None if debouncing is
+        disabled, in which case callers reconcile immediately.
+        """
+        if self._config.reconcile_debounce_seconds <= 0:
+            return None
+        if self._reconcile_queue is None:
+            self._reconcile_queue = CoalescingQueue(
+                "bindings",
+                self.reconcile_owner_bindings,
+                self._config.reconcile_debounce_seconds
+            )
+            self._reconcile_queue.start()
+        return self._reconcile_queue
+
+    def reconcile_owner_bindings(self, key: Hashable, body: Any) -> None:
+        """Reconcile the bindings of a queued User or Group.
+
+        Args:
+            key: (kind, namespace, name) of the owner
+            body: Latest body of the owner
+        """
+        kind = key[0]
+        if kind == "User":
+            self.rbac_service.create_user_role_bindings(User.from_dict(body))
+        elif kind == "Group":
+            self.rbac_service.create_group_role_bindings(Group.from_dict(body))
+        else:
+            raise ValueError(f"Unknown owner kind '{kind}'")
+
+    def shutdown(self) -> None:
+        """Stop background workers, processing any queued reconciles."""
+        if self._token_refresher is not None:
+            self._token_refresher.stop()
+            self._token_refresher = None
+        if self._reconcile_queue is not None:
+            self._reconcile_queue.stop()
+            self._reconcile_queue = None
+        if self._cluster_identity is not None:
+            self._cluster_identity.stop()
+            self._cluster_identity = None
+        if self._rolebinding_index is not None:
+            self._rolebinding_index.stop()
+            self._rolebinding_index = None
+        if self._audit_logger is not None:
+            shutdown_audit_logger()
+
     # ==================== Repositories ====================
 
     @property
     def namespace_repo(self) -> NamespaceRepository:
         """Get the namespace repository."""
         if self._ns_repo is None:
-            self._ns_repo = NamespaceRepository()
+            self._ns_repo = NamespaceRepository(
+                existence_cache=self.namespace_existence_cache
+            )
         return self._ns_repo
 
     @property
@@ -113,7 +240,10 @@ class ServiceContainer:
     def rbac_repo(self) -> RBACRepository:
         """Get the RBAC repository."""
         if self._rbac_repo is None:
-            self._rbac_repo = RBACRepository()
+            self._rbac_repo = RBACRepository(
+                binding_index=self.rolebinding_index,
+                existence_cache=self.rbac_existence_cache
+            )
         return self._rbac_repo
 
     @property
@@ -139,7 +269,9 @@ class ServiceContainer:
             self._rbac_service = RBACService(
                 rbac_repo=self.rbac_repo,
                 ns_repo=self.namespace_repo,
-                audit_logger=self.audit_logger
+                audit_logger=self.audit_logger,
+                adopt_unlabelled=self._config.adopt_unlabelled_bindings,
+                max_concurrency=self._config.rbac_max_concurrency
             )
         return self._rbac_service
 
@@ -149,10 +281,37 @@ class ServiceContainer:
         if self._kubeconfig_service is None:
             self._kubeconfig_service = KubeconfigService(
                 secret_repo=self.secret_repo,
-                audit_logger=self.audit_logger
+                audit_logger=self.audit_logger,
+                cluster_identity=self.cluster_identity_cache,
+                sa_repo=self.serviceaccount_repo if self.uses_token_request else None,
+                token_expiration_seconds=self._config.token_expiration_seconds,
+                token_wait_seconds=self._config.token_wait_seconds
             )
         return self._kubeconfig_service
 
+    @property
+    def uses_token_request(self) -> bool:
+        """Whether kubeconfig tokens come from the TokenRequest API."""
+        return self._config.token_mode == "request"
+
+    @property
+    def token_refresher(self) -> Optional[TokenRefresher]:
+        """Get the bound token refresher, or None with legacy token Secrets.
+
+        The refresher is started on first access.
+        """
+        if not self.uses_token_request:
+            return None
+        if self._token_refresher is None:
+            self._token_refresher = TokenRefresher(
+                kubeconfig_service=self.kubeconfig_service,
+                secret_repo=self.secret_repo,
+                custom_api=BaseRepository.instrument(client.CustomObjectsApi(BaseRepository().api_client)),
+                interval_seconds=self._config.token_refresh_interval_seconds
+            )
+            self._token_refresher.start()
+        return self._token_refresher
+
     @property
     def user_service(self) -> UserService:
         """Get the user service."""
@@ -5,7 +5,7 @@ across the operator codebase.
 """
 
 import re
-from typing import Optional, Any, Set
+from typing import Dict, Optional, Any, Set
 
 
 # Sensitive field names that should be redacted in logs and error messages
@@ -200,6 +200,19 @@ class RBACError(OperatorError):
         super().__init__(message=message, details=details)
 
 
+class RBACReconcileError(RBACError):
+    """Raised when some bindings of a reconcile pass could not be applied."""
+
+    def __init__(self, owner: str, failures: Dict[str, Exception], total: int):
+        self.owner = owner
+        self.failures = failures
+        summary = "; ".join(f"{key}: {error}" for key, error in failures.items())
+        super().__init__(
+            message=f"{len(failures)} of {total} bindings failed for '{owner}': {summary}"
+        )
+        self.details = sanitize_dict({"owner": owner, "failed": list(failures)})
+
+
 class ConfigurationError(OperatorError):
     """Raised when there's a configuration error."""
 
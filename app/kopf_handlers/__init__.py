@@ -1,19 +1,31 @@
 """Kopf event handlers for k8s-iam-operator.
 
 This module registers all CRD handlers with Kopf and provides
-optional OpenTelemetry tracing support.
+reconcile metrics and optional OpenTelemetry tracing support.
 """
 
 import kopf
 import os
 import logging
 
-from app.config import Config
+from app.config import Config, get_config
+from app.container import get_container
 from app.utils.audit import configure_audit_logging
-from .user_handlers import create_user_handler, update_user_handler, delete_user_handler
+from app.utils.instrumentation import enable_span_events, instrument
+from .user_handlers import (
+    create_user_handler,
+    update_user_handler,
+    delete_user_handler,
+    user_type_label_handler,
+)
 from .role_handlers import create_role_handler, delete_role_handler
 from .group_handlers import create_group_handler, update_group_handler, delete_group_handler
-from .namespace_handlers import namespace_created_handler
+from .namespace_handlers import (
+    namespace_created_handler,
+    target_namespace_index,
+    namespace_event_handler,
+    cluster_role_event_handler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +38,21 @@ if os.environ.get('ENABLE_TRACING', 'False').lower() == 'true':
     try:
         from app.utils.tracing import setup_tracer
         tracer = setup_tracer()
+        enable_span_events()
         logger.info("OpenTelemetry tracing enabled")
     except Exception as e:
         logger.warning(f"Failed to initialize tracing: {e}")
 
 
 def with_tracing(handler):
-    """Decorator to add tracing to handlers."""
+    """Decorator to add reconcile metrics and tracing to handlers."""
+    instrumented = instrument(handler)
+
     def wrapper(*args, **kwargs):
         if tracer:
             with tracer.start_as_current_span(handler.__name__):
-                return handler(*args, **kwargs)
-        return handler(*args, **kwargs)
+                return instrumented(*args, **kwargs)
+        return instrumented(*args, **kwargs)
     return wrapper
 
 
@@ -93,7 +108,8 @@ def create_user_fn(body, spec, **kwargs):
     return create_user_handler(body, spec, **kwargs)
 
 
-@kopf.on.update(Config.GROUP, Config.VERSION, Config.PLURAL)
+# Only spec changes reconcile; the user-type label patch must not re-enter here
+@kopf.on.update(Config.GROUP, Config.VERSION, Config.PLURAL, field='spec')
 @with_tracing
 def update_user_fn(body, spec, **kwargs):
     """Handle User update."""
@@ -107,18 +123,73 @@ def delete_user_fn(body, spec, **kwargs):
     return delete_user_handler(body, spec, **kwargs)
 
 
+@kopf.on.resume(Config.GROUP, Config.VERSION, Config.PLURAL)
+@kopf.on.create(Config.GROUP, Config.VERSION, Config.PLURAL)
+@kopf.on.update(Config.GROUP, Config.VERSION, Config.PLURAL, field='spec')
+async def label_user_type_fn(spec, labels, patch, **kwargs):
+    """Keep the user-type label in line with the User spec."""
+    user_type_label_handler(spec, labels, patch, **kwargs)
+
+
 # ==================== Namespace Handlers ====================
 
+@kopf.index(Config.GROUP, Config.VERSION, Config.PLURAL)
+def users_by_target_namespace(body, spec, **kwargs):
+    """Index Users by the namespaces their CRoles target."""
+    return target_namespace_index(body, spec, **kwargs)
+
+
+@kopf.index(Config.GROUP, Config.VERSION, Config.GPLURAL)
+def groups_by_target_namespace(body, spec, **kwargs):
+    """Index Groups by the namespaces their CRoles target."""
+    return target_namespace_index(body, spec, **kwargs)
+
+
 @kopf.on.create('', 'v1', 'namespaces')
 @with_tracing
-def namespace_created_fn(name, **kwargs):
+def namespace_created_fn(name, users_by_target_namespace: kopf.Index,
+                         groups_by_target_namespace: kopf.Index, **kwargs):
     """Handle Namespace creation.
 
     When a namespace is created, reconcile any Users/Groups that have
     role bindings targeting that namespace. This ensures RoleBindings
     are restored when a namespace is deleted and recreated.
     """
-    return namespace_created_handler(name, **kwargs)
+    # Snapshot the index entries before the slow reconciles start
+    users = list(users_by_target_namespace.get(name, []))
+    groups = list(groups_by_target_namespace.get(name, []))
+    return namespace_created_handler(name, users=users, groups=groups, **kwargs)
+
+
+@kopf.on.event('', 'v1', 'namespaces')
+async def namespace_event_fn(name, **kwargs):
+    """Keep the Namespace existence cache in line with watch events."""
+    namespace_event_handler(name, **kwargs)
+
+
+@kopf.on.event('rbac.authorization.k8s.io', 'v1', 'clusterroles')
+async def cluster_role_event_fn(name, **kwargs):
+    """Keep the ClusterRole existence cache in line with watch events."""
+    cluster_role_event_handler(name, **kwargs)
+
+
+# ==================== Lifecycle ====================
+
+@kopf.on.startup()
+def configure_fn(settings: kopf.OperatorSettings, **kwargs):
+    """Size Kopf's executor and start background workers."""
+    # Handlers stay sync on the blocking kubernetes client; this pool bounds
+    # how many reconciles run at once
+    settings.execution.max_workers = get_config().handler_max_workers
+    container = get_container()
+    if container.uses_token_request:
+        container.token_refresher.start()
+
+
+@kopf.on.cleanup()
+def cleanup_fn(**kwargs):
+    """Stop background workers."""
+    get_container().shutdown()
 
 
 def main():
@@ -4,159 +4,180 @@ This module watches for namespace creation events and triggers
 reconciliation of Users/Groups that have role bindings targeting
 those namespaces. This ensures that when a namespace is deleted
 and recreated, the RoleBindings are automatically restored.
+
+Users and Groups are found through a watch-maintained reverse index
+from target namespace to the objects referencing it, so a namespace
+event doesn't list every User and Group in the cluster.
 """
 
 import logging
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional
+
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from app.config import Config
 from app.container import get_container
-from app.models.user import User
-from app.models.group import Group
+from app.repositories.existence_cache import ExistenceCache
 
 logger = logging.getLogger(__name__)
 
 
-def namespace_created_handler(name: str, **kwargs) -> None:
+def target_namespace_index(body: Mapping[str, Any], spec: Mapping[str, Any],
+                           **kwargs) -> Dict[str, dict]:
+    """Index a User or Group by the namespaces its CRoles target.
+
+    Used as a Kopf index function, so the operator keeps a watch-maintained
+    reverse index from namespace to the objects that reference it.
+
+    Args:
+        body: The User or Group body
+        spec: The spec portion of the body
+        **kwargs: Additional Kopf kwargs
+
+    Returns:
+        Dict mapping each targeted namespace to a snapshot of the body
+    """
+    snapshot = {
+        "metadata": dict(body.get("metadata", {})),
+        "spec": dict(spec),
+    }
+    return {
+        cr["namespace"]: snapshot
+        for cr in spec.get("CRoles", []) or []
+        if cr.get("namespace")
+    }
+
+
+def namespace_created_handler(name: str,
+                              users: Optional[Iterable[dict]] = None,
+                              groups: Optional[Iterable[dict]] = None,
+                              **kwargs) -> None:
     """Handle namespace creation events.
 
-    When a namespace is created, find all Users and Groups that have
-    CRoles targeting that namespace and reconcile their RoleBindings.
+    When a namespace is created, reconcile the RoleBindings of all Users and
+    Groups that have CRoles targeting that namespace.
 
     Args:
         name: The name of the created namespace
+        users: Users targeting the namespace, from the reverse index. If
+               None, all Users are listed and filtered.
+        groups: Groups targeting the namespace, from the reverse index. If
+                None, all Groups are listed and filtered.
         **kwargs: Additional Kopf kwargs
     """
     logger.info(f"Namespace '{name}' created, checking for Users/Groups to reconcile")
 
     try:
         container = get_container()
-        custom_api = client.CustomObjectsApi()
 
-        # Find and reconcile Users
-        _reconcile_users_for_namespace(custom_api, container, name)
+        # Drop any cached "does not exist" answer before reconciling
+        invalidate_existence(container.namespace_existence_cache, name)
+
+        if users is None or groups is None:
+            custom_api = client.CustomObjectsApi()
+            if users is None:
+                users = _list_targeting(custom_api, Config.PLURAL, "User", name)
+            if groups is None:
+                groups = _list_targeting(custom_api, Config.GPLURAL, "Group", name)
 
-        # Find and reconcile Groups
-        _reconcile_groups_for_namespace(custom_api, container, name)
+        _reconcile_owners(container, "User", name, users)
+        _reconcile_owners(container, "Group", name, groups)
 
     except Exception as e:
         logger.exception(f"Error reconciling bindings for namespace '{name}': {e}")
 
 
-def _reconcile_users_for_namespace(
-    custom_api: client.CustomObjectsApi,
-    container,
-    namespace: str
-) -> None:
-    """Find and reconcile Users that target the given namespace.
+def namespace_event_handler(name: str, **kwargs) -> None:
+    """Invalidate the cached existence of a namespace on any watch event.
 
     Args:
-        custom_api: Kubernetes CustomObjectsApi client
-        container: Dependency injection container
-        namespace: The namespace to reconcile for
+        name: The name of the namespace
+        **kwargs: Additional Kopf kwargs
     """
-    try:
-        # List all Users across all namespaces
-        users = custom_api.list_cluster_custom_object(
-            group=Config.GROUP,
-            version=Config.VERSION,
-            plural=Config.PLURAL
-        )
+    invalidate_existence(get_container().namespace_existence_cache, name)
 
-        reconciled_count = 0
-        for user_dict in users.get('items', []):
-            user_name = user_dict.get('metadata', {}).get('name', 'unknown')
-            spec = user_dict.get('spec', {})
-            c_roles = spec.get('CRoles', [])
-
-            # Check if any CRole targets this namespace
-            targets_namespace = any(
-                cr.get('namespace') == namespace
-                for cr in c_roles
-            )
-
-            if targets_namespace:
-                logger.info(
-                    f"Reconciling User '{user_name}' for namespace '{namespace}'"
-                )
-                try:
-                    user = User.from_dict(user_dict)
-                    container.rbac_service.create_user_role_bindings(user)
-                    reconciled_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to reconcile User '{user_name}': {e}"
-                    )
-
-        if reconciled_count > 0:
-            logger.info(
-                f"Reconciled {reconciled_count} User(s) for namespace '{namespace}'"
-            )
 
-    except ApiException as e:
-        if e.status == 404:
-            logger.debug("No User CRDs found in cluster")
-        else:
-            logger.error(f"Error listing Users: {e}")
-    except Exception as e:
-        logger.error(f"Error reconciling Users for namespace '{namespace}': {e}")
+def cluster_role_event_handler(name: str, **kwargs) -> None:
+    """Invalidate the cached existence of a ClusterRole on any watch event.
+
+    Args:
+        name: The name of the ClusterRole
+        **kwargs: Additional Kopf kwargs
+    """
+    invalidate_existence(get_container().rbac_existence_cache, ("ClusterRole", name))
+
+
+def invalidate_existence(cache: Optional[ExistenceCache], key: Hashable) -> None:
+    """Invalidate a key in an existence cache, if caching is enabled."""
+    if cache is not None:
+        cache.invalidate(key)
 
 
-def _reconcile_groups_for_namespace(
-    custom_api: client.CustomObjectsApi,
-    container,
-    namespace: str
-) -> None:
-    """Find and reconcile Groups that target the given namespace.
+def _list_targeting(custom_api: client.CustomObjectsApi, plural: str,
+                    kind: str, namespace: str) -> List[dict]:
+    """List all objects of a kind and keep those targeting the namespace.
+
+    Fallback for callers without the reverse index.
 
     Args:
         custom_api: Kubernetes CustomObjectsApi client
-        container: Dependency injection container
+        plural: Plural name of the custom resource
+        kind: Kind name used in logs
         namespace: The namespace to reconcile for
+
+    Returns:
+        List of object bodies with a CRole targeting the namespace
     """
     try:
-        # List all Groups across all namespaces
-        groups = custom_api.list_cluster_custom_object(
+        objects = custom_api.list_cluster_custom_object(
             group=Config.GROUP,
             version=Config.VERSION,
-            plural=Config.GPLURAL
+            plural=plural
         )
-
-        reconciled_count = 0
-        for group_dict in groups.get('items', []):
-            group_name = group_dict.get('metadata', {}).get('name', 'unknown')
-            spec = group_dict.get('spec', {})
-            c_roles = spec.get('CRoles', [])
-
-            # Check if any CRole targets this namespace
-            targets_namespace = any(
-                cr.get('namespace') == namespace
-                for cr in c_roles
-            )
-
-            if targets_namespace:
-                logger.info(
-                    f"Reconciling Group '{group_name}' for namespace '{namespace}'"
-                )
-                try:
-                    group = Group.from_dict(group_dict)
-                    container.rbac_service.create_group_role_bindings(group)
-                    reconciled_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to reconcile Group '{group_name}': {e}"
-                    )
-
-        if reconciled_count > 0:
-            logger.info(
-                f"Reconciled {reconciled_count} Group(s) for namespace '{namespace}'"
-            )
-
     except ApiException as e:
         if e.status == 404:
-            logger.debug("No Group CRDs found in cluster")
+            logger.debug(f"No {kind} CRDs found in cluster")
         else:
-            logger.error(f"Error listing Groups: {e}")
-    except Exception as e:
-        logger.error(f"Error reconciling Groups for namespace '{namespace}': {e}")
+            logger.error(f"Error listing {kind}s: {e}")
+        return []
+
+    return [
+        obj for obj in objects.get('items', [])
+        if namespace in target_namespace_index(obj, obj.get('spec', {}))
+    ]
+
+
+def _reconcile_owners(container, kind: str, namespace: str, bodies: Iterable[dict]) -> None:
+    """Reconcile the RoleBindings of Users or Groups targeting a namespace.
+
+    With debouncing enabled, owners are enqueued on the container's
+    reconcile queue, so a burst of namespace events reconciles each owner
+    once. Otherwise they are reconciled immediately.
+
+    Args:
+        container: Dependency injection container
+        kind: Owner kind (User or Group)
+        namespace: The namespace to reconcile for
+        bodies: Owner bodies targeting the namespace
+    """
+    queue = container.reconcile_queue
+    reconciled_count = 0
+    for body in bodies:
+        metadata = body.get('metadata', {})
+        owner_name = metadata.get('name', 'unknown')
+        key = (kind, metadata.get('namespace'), owner_name)
+        try:
+            if queue is not None:
+                logger.debug(f"Queueing {kind} '{owner_name}' for namespace '{namespace}'")
+                queue.enqueue(key, body)
+            else:
+                logger.info(f"Reconciling {kind} '{owner_name}' for namespace '{namespace}'")
+                container.reconcile_owner_bindings(key, body)
+            reconciled_count += 1
+        except Exception as e:
+            logger.error(f"Failed to reconcile {kind} '{owner_name}': {e}")
+
+    if reconciled_count > 0:
+        action = "Queued" if queue is not None else "Reconciled"
+        logger.info(f"{action} {reconciled_count} {kind}(s) for namespace '{namespace}'")
@@ -7,6 +7,8 @@ import logging
 
 from app.container import get_container
 from app.exceptions import OperatorError, ValidationError
+from app.models.user import UserSpec
+from app.utils.labels import USER_TYPE_LABEL
 
 logger = logging.getLogger(__name__)
 
@@ -94,3 +96,26 @@ def delete_user_handler(body: dict, spec, **kwargs) -> dict:
     except Exception as e:
         logger.exception(f"Unexpected error deleting user: {str(e)}")
         return {"error": str(e)}
+
+
+def user_type_label_handler(spec, labels, patch, **kwargs) -> None:
+    """Mirror the User type into a label.
+
+    Counting paths list Users as PartialObjectMetadata, which carries
+    labels but not the spec, so the type must be visible in metadata.
+
+    Args:
+        spec: The spec portion of the CRD
+        labels: Current labels of the User
+        patch: Kopf patch applied to the User after the handler
+        **kwargs: Additional Kopf kwargs
+    """
+    try:
+        is_human = UserSpec.from_dict(dict(spec or {})).is_human
+    except ValueError as e:
+        logger.debug(f"Not labelling User with invalid spec: {e}")
+        return
+
+    user_type = "human" if is_human else "serviceAccount"
+    if (labels or {}).get(USER_TYPE_LABEL) != user_type:
+        patch.setdefault("metadata", {}).setdefault("labels", {})[USER_TYPE_LABEL] = user_type
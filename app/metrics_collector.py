@@ -1,40 +1,299 @@
 """Metrics collector for k8s-iam-operator.
 
-This module provides a background collector that periodically counts
-User, Group, and Role CRDs and updates the Prometheus gauges.
+This module keeps the User, Group, and Role gauges up to date from watch
+events. Each CRD is followed by a metadata-only informer that stores only
+the fields needed for counting; gauges change incrementally on every event and are
+recounted from a full LIST only on a long resync interval or when the
+watch has to be restarted. Series whose count drops to zero are removed,
+and the number of namespace series per gauge is capped.
 """
 
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
 
 from kubernetes import client, config
-from kubernetes.client.rest import ApiException
 
-from app.config import Config
+from app.config import Config, get_config
 from app.api.metrics import (
     set_users_total,
     set_groups_total,
     set_roles_total,
+    remove_users_total,
+    remove_groups_total,
+    remove_roles_total,
     set_operator_info,
 )
+from app.repositories.informer import Informer
+from app.utils.labels import USER_TYPE_LABEL
 from app.version import __version__
 
 logger = logging.getLogger(__name__)
 
-# Collection interval in seconds
-COLLECTION_INTERVAL = 30
+Bucket = Hashable
+
+# Namespace label of the series aggregating buckets beyond the cardinality cap
+OVERFLOW_NAMESPACE = "other"
+
+
+def _namespace(obj: dict) -> str:
+    """Get the namespace of a custom resource dict."""
+    return obj.get("metadata", {}).get("namespace") or "default"
+
+
+def user_bucket(obj: dict) -> Bucket:
+    """Get the (namespace, user_type) gauge labels of a User.
+
+    Metadata-only objects carry the type in the user-type label; full
+    objects (from servers without PartialObjectMetadata support) have it
+    in the spec. Users not yet labelled count as serviceAccount, the
+    default type.
+    """
+    labels = obj.get("metadata", {}).get("labels") or {}
+    user_type = labels.get(USER_TYPE_LABEL)
+    if user_type is None:
+        spec = obj.get("spec") or {}
+        is_human = spec.get("type") == "human" or spec.get("enabled", False)
+        user_type = "human" if is_human else "serviceAccount"
+    return (_namespace(obj), user_type)
+
+
+def namespace_bucket(obj: dict) -> Bucket:
+    """Get the namespace gauge label of a Group or Role."""
+    return _namespace(obj)
+
+
+def cluster_bucket(obj: dict) -> Bucket:
+    """Count all ClusterRoles under a single gauge."""
+    return "cluster"
+
+
+def overflow_bucket(bucket: Bucket) -> Bucket:
+    """Get the series a bucket is aggregated into once the cap is reached.
+
+    The namespace, always the first label, is replaced by OVERFLOW_NAMESPACE;
+    the remaining labels are kept.
+    """
+    if isinstance(bucket, tuple):
+        return (OVERFLOW_NAMESPACE,) + bucket[1:]
+    return OVERFLOW_NAMESPACE
+
+
+class ResourceCounter:
+    """Per-bucket object counts of one CRD, maintained from watch events.
+
+    Objects are listed and watched as PartialObjectMetadata, and reduced to
+    their name and bucket before being stored by the informer, so neither
+    transfer nor memory grows with the size of the spec.
+
+    Every bucket is exported as its own gauge series until max_series
+    buckets are exported; further buckets are aggregated into their
+    overflow series (namespace "other"). A series is removed as soon as
+    its count drops to zero, so deleted namespaces don't leave stale
+    series behind.
+    """
+
+    def __init__(self, name: str, plural: str, bucket: Callable[[dict], Bucket],
+                 set_gauge: Callable[[Bucket, int], None],
+                 remove_gauge: Callable[[Bucket], None],
+                 max_series: int = 0):
+        """Initialize the counter.
+
+        Args:
+            name: Name used in logs
+            plural: Plural name of the custom resource
+            bucket: Function mapping an object to its gauge labels
+            set_gauge: Function setting the gauge of one bucket
+            remove_gauge: Function removing the gauge series of one bucket
+            max_series: Maximum number of buckets exported as their own
+                        series (0 for no limit)
+        """
+        self.name = name
+        self.plural = plural
+        self._bucket = bucket
+        self._set_gauge = set_gauge
+        self._remove_gauge = remove_gauge
+        self.max_series = max_series
+        self._counts: Counter = Counter()
+        self._series: Counter = Counter()
+        self._exported: Set[Bucket] = set()
+        self._lock = threading.Lock()
+        self.informer: Optional[Informer] = None
+
+    def reduce(self, obj: dict) -> dict:
+        """Keep only what counting needs from an object."""
+        metadata = obj.get("metadata") or {}
+        return {
+            "metadata": {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "resourceVersion": metadata.get("resourceVersion"),
+            },
+            "bucket": self._bucket(obj),
+        }
+
+    def attach(self, custom_api: client.CustomObjectsApi) -> Informer:
+        """Create the informer feeding this counter."""
+        self.informer = Informer(
+            custom_api.list_cluster_custom_object,
+            name=self.name,
+            list_kwargs={
+                "group": Config.GROUP,
+                "version": Config.VERSION,
+                "plural": self.plural,
+            },
+            transform=self.reduce,
+            metadata_only=True,
+        )
+        self.informer.add_event_handler(self.on_event)
+        self.informer.add_relist_handler(self.on_relist)
+        return self.informer
+
+    def on_event(self, event_type: str, obj: dict, old: Optional[dict]) -> None:
+        """Apply a single watch event to the counts."""
+        before = old["bucket"] if old else None
+        after = None if event_type == "DELETED" else obj["bucket"]
+        if before == after:
+            return
+
+        with self._lock:
+            if before is not None:
+                self._adjust(before, -1)
+            if after is not None:
+                self._adjust(after, 1)
+
+    def on_relist(self, items: List[dict]) -> None:
+        """Replace the counts with a full recount after a LIST."""
+        counts = Counter(item["bucket"] for item in items)
+        with self._lock:
+            # Keep exporting the buckets that still exist, then fill free slots
+            self._exported &= counts.keys()
+            for bucket in sorted(counts.keys() - self._exported):
+                self._export(bucket)
+
+            series: Counter = Counter()
+            for bucket, count in counts.items():
+                series[self._series_of(bucket)] += count
+            for stale in self._series.keys() - series.keys():
+                self._remove_gauge(stale)
+            for labels, count in series.items():
+                self._set_gauge(labels, count)
+            self._counts = counts
+            self._series = series
+        logger.debug(
+            f"Recounted {self.name}: {sum(counts.values())} objects "
+            f"in {len(series)} series"
+        )
 
+    def counts(self) -> Dict[Bucket, int]:
+        """Get a copy of the current counts."""
+        with self._lock:
+            return dict(self._counts)
 
-class MetricsCollector:
-    """Collects metrics from Kubernetes CRDs and updates Prometheus gauges."""
+    def series(self) -> Dict[Bucket, int]:
+        """Get a copy of the exported series and their values."""
+        with self._lock:
+            return dict(self._series)
+
+    def _adjust(self, bucket: Bucket, delta: int) -> None:
+        """Move one bucket's count and update the series it is exported in."""
+        count = self._counts[bucket] + delta
+        if count == delta > 0:
+            self._export(bucket)
+        labels = self._series_of(bucket)
+
+        if count > 0:
+            self._counts[bucket] = count
+        else:
+            self._counts.pop(bucket, None)
+            self._exported.discard(bucket)
+
+        self._series[labels] += delta
+        if self._series[labels] > 0:
+            self._set_gauge(labels, self._series[labels])
+        else:
+            del self._series[labels]
+            self._remove_gauge(labels)
+
+    def _export(self, bucket: Bucket) -> None:
+        """Give a new bucket its own series if the cap allows it."""
+        if not self.max_series or len(self._exported) < self.max_series:
+            self._exported.add(bucket)
+        else:
+            logger.debug(f"{self.name} series cap reached, aggregating {bucket} into overflow")
+
+    def _series_of(self, bucket: Bucket) -> Bucket:
+        """Get the series labels a bucket is counted under."""
+        return bucket if bucket in self._exported else overflow_bucket(bucket)
+
+
+def _set_users(bucket: Any, count: int) -> None:
+    """Set the users gauge of a (namespace, user_type) bucket."""
+    namespace, user_type = bucket
+    set_users_total(namespace, user_type, count)
+
+
+def _remove_users(bucket: Any) -> None:
+    """Remove the users series of a (namespace, user_type) bucket."""
+    namespace, user_type = bucket
+    remove_users_total(namespace, user_type)
+
+
+def _set_roles(bucket: Any, count: int) -> None:
+    """Set the Role gauge of a namespace."""
+    set_roles_total(bucket, "Role", count)
+
+
+def _remove_roles(bucket: Any) -> None:
+    """Remove the Role series of a namespace."""
+    remove_roles_total(bucket, "Role")
+
+
+def _set_cluster_roles(bucket: Any, count: int) -> None:
+    """Set the ClusterRole gauge."""
+    set_roles_total(bucket, "ClusterRole", count)
+
+
+def _remove_cluster_roles(bucket: Any) -> None:
+    """Remove the ClusterRole series."""
+    remove_roles_total(bucket, "ClusterRole")
 
-    def __init__(self):
-        """Initialize the metrics collector."""
+
+class MetricsCollector:
+    """Maintains CRD gauges from watch events."""
+
+    def __init__(self, resync_interval: Optional[float] = None,
+                 max_series: Optional[int] = None):
+        """Initialize the metrics collector.
+
+        Args:
+            resync_interval: Seconds between full recounts; defaults to
+                             METRICS_RESYNC_SECONDS
+            max_series: Maximum namespace series per gauge; defaults to
+                        METRICS_MAX_SERIES
+        """
         self._running = False
         self._thread = None
         self._custom_api = None
+        self._stop = threading.Event()
+        self._resync_interval = (
+            resync_interval if resync_interval is not None
+            else get_config().metrics_resync_seconds
+        )
+        if max_series is None:
+            max_series = get_config().metrics_max_series
+        self.counters = [
+            ResourceCounter("users", Config.PLURAL, user_bucket,
+                            _set_users, _remove_users, max_series),
+            ResourceCounter("groups", Config.GPLURAL, namespace_bucket,
+                            set_groups_total, remove_groups_total, max_series),
+            ResourceCounter("roles", Config.RPLURAL, namespace_bucket,
+                            _set_roles, _remove_roles, max_series),
+            ResourceCounter("clusterroles", Config.CRPLURAL, cluster_bucket,
+                            _set_cluster_roles, _remove_cluster_roles, max_series),
+        ]
 
     def _init_kubernetes_client(self):
         """Initialize the Kubernetes client."""
@@ -55,6 +314,7 @@ class MetricsCollector:
             return
 
         self._running = True
+        self._stop.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         logger.info("Metrics collector started")
@@ -62,12 +322,16 @@ class MetricsCollector:
     def stop(self):
         """Stop the metrics collection."""
         self._running = False
+        self._stop.set()
         if self._thread:
             self._thread.join(timeout=5)
+        for counter in self.counters:
+            if counter.informer:
+                counter.informer.stop()
         logger.info("Metrics collector stopped")
 
     def _run(self):
-        """Main collection loop."""
+        """Start the informers, then trigger a full recount periodically."""
         # Set operator info metric
         set_operator_info(__version__)
 
@@ -78,141 +342,15 @@ class MetricsCollector:
             logger.warning("Waiting for Kubernetes client...")
             time.sleep(5)
 
-        # Collection loop
-        while self._running:
-            try:
-                self._collect_metrics()
-            except Exception as e:
-                logger.error(f"Error collecting metrics: {e}")
-
-            time.sleep(COLLECTION_INTERVAL)
-
-    def _collect_metrics(self):
-        """Collect all CRD metrics."""
-        self._collect_user_metrics()
-        self._collect_group_metrics()
-        self._collect_role_metrics()
-
-    def _collect_user_metrics(self):
-        """Collect User CRD metrics."""
-        try:
-            users = self._custom_api.list_cluster_custom_object(
-                group=Config.GROUP,
-                version=Config.VERSION,
-                plural=Config.PLURAL,
-            )
-
-            # Count users by namespace and type
-            counts = defaultdict(lambda: {"human": 0, "serviceAccount": 0})
-
-            for user in users.get("items", []):
-                namespace = user.get("metadata", {}).get("namespace", "default")
-                spec = user.get("spec", {})
-                user_type = spec.get("userType", "serviceAccount")
-                # Normalize type
-                if user_type in ("human", "Human"):
-                    counts[namespace]["human"] += 1
-                else:
-                    counts[namespace]["serviceAccount"] += 1
-
-            # Update gauges
-            for namespace, type_counts in counts.items():
-                set_users_total(namespace, "human", type_counts["human"])
-                set_users_total(namespace, "serviceAccount", type_counts["serviceAccount"])
-
-            # Log total
-            total_human = sum(c["human"] for c in counts.values())
-            total_sa = sum(c["serviceAccount"] for c in counts.values())
-            logger.debug(f"Collected user metrics: {total_human} human, {total_sa} serviceAccount")
-
-        except ApiException as e:
-            if e.status == 404:
-                logger.debug("User CRD not found (not installed)")
-            else:
-                logger.error(f"Error listing users: {e.reason}")
-
-    def _collect_group_metrics(self):
-        """Collect Group CRD metrics."""
-        try:
-            groups = self._custom_api.list_cluster_custom_object(
-                group=Config.GROUP,
-                version=Config.VERSION,
-                plural=Config.GPLURAL,
-            )
-
-            # Count groups by namespace
-            counts = defaultdict(int)
-
-            for group in groups.get("items", []):
-                namespace = group.get("metadata", {}).get("namespace", "default")
-                counts[namespace] += 1
-
-            # Update gauges
-            for namespace, count in counts.items():
-                set_groups_total(namespace, count)
-
-            total = sum(counts.values())
-            logger.debug(f"Collected group metrics: {total} groups")
-
-        except ApiException as e:
-            if e.status == 404:
-                logger.debug("Group CRD not found (not installed)")
-            else:
-                logger.error(f"Error listing groups: {e.reason}")
-
-    def _collect_role_metrics(self):
-        """Collect Role and ClusterRole CRD metrics."""
-        total_roles = 0
-        total_cluster_roles = 0
-
-        # Collect namespaced Roles
-        try:
-            roles = self._custom_api.list_cluster_custom_object(
-                group=Config.GROUP,
-                version=Config.VERSION,
-                plural=Config.RPLURAL,
-            )
-
-            # Count roles by namespace
-            role_counts = defaultdict(int)
-
-            for role in roles.get("items", []):
-                namespace = role.get("metadata", {}).get("namespace", "default")
-                role_counts[namespace] += 1
-
-            # Update gauges
-            for namespace, count in role_counts.items():
-                set_roles_total(namespace, "Role", count)
-
-            total_roles = sum(role_counts.values())
-
-        except ApiException as e:
-            if e.status == 404:
-                logger.debug("Role CRD not found (not installed)")
-            else:
-                logger.error(f"Error listing roles: {e.reason}")
-
-        # Collect ClusterRoles
-        try:
-            cluster_roles = self._custom_api.list_cluster_custom_object(
-                group=Config.GROUP,
-                version=Config.VERSION,
-                plural=Config.CRPLURAL,
-            )
-
-            total_cluster_roles = len(cluster_roles.get("items", []))
-            set_roles_total("cluster", "ClusterRole", total_cluster_roles)
+        if not self._running:
+            return
 
-        except ApiException as e:
-            if e.status == 404:
-                logger.debug("ClusterRole CRD not found (not installed)")
-            else:
-                logger.error(f"Error listing cluster roles: {e.reason}")
+        for counter in self.counters:
+            counter.attach(self._custom_api).start()
 
-        logger.debug(
-            f"Collected role metrics: {total_roles} roles, "
-            f"{total_cluster_roles} cluster roles"
-        )
+        while not self._stop.wait(self._resync_interval):
+            for counter in self.counters:
+                counter.informer.request_relist()
 
 
 # Global collector instance
@@ -1,9 +1,10 @@
 """Group model for k8s-iam-operator."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.models.user import ClusterRoleBinding
+from app.utils.labels import owner_labels, owner_selector
 
 
 @dataclass
@@ -83,6 +84,16 @@ class Group:
             "spec": self.spec.to_dict(),
         }
 
+    @property
+    def owner_labels(self) -> Dict[str, str]:
+        """Get the ownership labels for objects created for this group."""
+        return owner_labels("Group", self.name, self.namespace)
+
+    @property
+    def owner_selector(self) -> str:
+        """Get the label selector matching objects created for this group."""
+        return owner_selector("Group", self.name, self.namespace)
+
     def role_binding_name(self, namespace: str, role: str) -> str:
         """Generate RoleBinding name for a namespaced role."""
         return f"{self.name}-{namespace}-{role}"
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict
 
+from app.utils.labels import owner_labels, owner_selector
+
 
 class UserType(str, Enum):
     """Type of user identity."""
@@ -245,6 +247,16 @@ class User:
             "spec": self.spec.to_dict(),
         }
 
+    @property
+    def owner_labels(self) -> Dict[str, str]:
+        """Get the ownership labels for objects created for this user."""
+        return owner_labels("User", self.name, self.namespace)
+
+    @property
+    def owner_selector(self) -> str:
+        """Get the label selector matching objects created for this user."""
+        return owner_selector("User", self.name, self.namespace)
+
     @property
     def service_account_name(self) -> str:
         """Get the service account name for this user."""
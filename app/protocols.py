@@ -132,7 +132,8 @@ class ISecretRepository(Protocol):
         self,
         sa_name: str,
         namespace: str,
-        token_name: Optional[str] = None
+        token_name: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None
     ) -> Any:
         """Create a service account token secret."""
         ...
@@ -141,7 +142,8 @@ class ISecretRepository(Protocol):
         self,
         name: str,
         namespace: str,
-        kubeconfig_data: str
+        kubeconfig_data: str,
+        labels: Optional[Dict[str, str]] = None
     ) -> Any:
         """Create a kubeconfig secret."""
         ...
@@ -193,7 +195,13 @@ class IRBACRepository(Protocol):
         """Create a Role."""
         ...
 
-    def update_role(self, name: str, namespace: str, rules: List[Dict[str, Any]]) -> Any:
+    def update_role(
+        self,
+        name: str,
+        namespace: str,
+        rules: List[Dict[str, Any]],
+        labels: Optional[Dict[str, str]] = None
+    ) -> Any:
         """Update a Role."""
         ...
 
@@ -219,7 +227,12 @@ class IRBACRepository(Protocol):
         """Create a ClusterRole."""
         ...
 
-    def update_cluster_role(self, name: str, rules: List[Dict[str, Any]]) -> Any:
+    def update_cluster_role(
+        self,
+        name: str,
+        rules: List[Dict[str, Any]],
+        labels: Optional[Dict[str, str]] = None
+    ) -> Any:
         """Update a ClusterRole."""
         ...
 
@@ -252,7 +265,8 @@ class IRBACRepository(Protocol):
         name: str,
         namespace: str,
         role_ref: Any,
-        subjects: List[Any]
+        subjects: List[Any],
+        labels: Optional[Dict[str, str]] = None
     ) -> Any:
         """Update a RoleBinding."""
         ...
@@ -288,7 +302,8 @@ class IRBACRepository(Protocol):
         self,
         name: str,
         role_ref: Any,
-        subjects: List[Any]
+        subjects: List[Any],
+        labels: Optional[Dict[str, str]] = None
     ) -> Any:
         """Update a ClusterRoleBinding."""
         ...
@@ -9,6 +9,10 @@ from app.repositories.namespace_repository import NamespaceRepository
 from app.repositories.serviceaccount_repository import ServiceAccountRepository
 from app.repositories.secret_repository import SecretRepository
 from app.repositories.rbac_repository import RBACRepository
+from app.repositories.informer import Informer
+from app.repositories.rolebinding_index import RoleBindingIndex
+from app.repositories.existence_cache import ExistenceCache
+from app.repositories.cluster_identity import ClusterIdentity, ClusterIdentityCache
 
 __all__ = [
     "BaseRepository",
@@ -16,4 +20,9 @@ __all__ = [
     "ServiceAccountRepository",
     "SecretRepository",
     "RBACRepository",
+    "Informer",
+    "RoleBindingIndex",
+    "ExistenceCache",
+    "ClusterIdentity",
+    "ClusterIdentityCache",
 ]
@@ -1,10 +1,68 @@
 """Base repository with common Kubernetes client setup."""
 
-from typing import Optional
+import json
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
 from app.exceptions import KubernetesAPIError, ResourceNotFoundError, ResourceAlreadyExistsError
+from app.utils.instrumentation import InstrumentedApi
+
+logger = logging.getLogger(__name__)
+
+# Field manager recorded for every server-side apply made by the operator
+FIELD_MANAGER = "k8s-iam-operator"
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# Accept headers asking the API server for metadata-only objects. Plain JSON
+# is listed last so servers without support fall back to full objects.
+PARTIAL_METADATA_LIST_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+)
+PARTIAL_METADATA_ACCEPT = (
+    "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+)
+
+# Times a paginated LIST starts over after its continue token expired
+LIST_RESTARTS = 3
+
+
+def conflicting_fields(e: ApiException) -> List[str]:
+    """Get the fields named by a server-side apply conflict.
+
+    Args:
+        e: The ApiException raised by the apply
+
+    Returns:
+        Field paths such as ".metadata.labels.team"; empty if the error is
+        not an apply conflict
+    """
+    if e.status != 409 or not e.body:
+        return []
+    try:
+        causes = (json.loads(e.body).get("details") or {}).get("causes") or []
+    except (ValueError, AttributeError):
+        return []
+    return [cause["field"] for cause in causes
+            if cause.get("type") == "FieldManagerConflict" and cause.get("field")]
+
+
+def drop_field(body: Dict[str, Any], path: str) -> None:
+    """Remove a field, given as a conflict field path, from an apply body.
+
+    Label and annotation keys may contain dots, so everything after
+    ".metadata.labels." or ".metadata.annotations." is taken as one key.
+    """
+    for prefix in (".metadata.labels.", ".metadata.annotations."):
+        if path.startswith(prefix):
+            parent = (body.get("metadata") or {}).get(prefix.split(".")[2]) or {}
+            parent.pop(path[len(prefix):], None)
+            return
+    *parents, key = path.lstrip(".").split(".")
+    for part in parents:
+        body = body.get(part) or {}
+    body.pop(key, None)
 
 
 class BaseRepository:
@@ -61,6 +119,155 @@ class BaseRepository:
             BaseRepository._api_client = self._configure_client()
         return BaseRepository._api_client
 
+    @staticmethod
+    def instrument(api: Any) -> Any:
+        """Wrap a Kubernetes API object so every call through it is measured.
+
+        Calls are counted against the current reconcile, observed in the
+        API latency histogram by verb, resource and status code, and
+        recorded as span events when tracing is enabled.
+
+        Args:
+            api: Kubernetes API object, e.g. a CoreV1Api
+
+        Returns:
+            A proxy exposing the same methods
+        """
+        return InstrumentedApi(api)
+
+    @staticmethod
+    def iter_pages(list_func: Callable[..., Any], page_size: int,
+                   **kwargs: Any) -> Iterator[List[Any]]:
+        """Iterate over a paginated LIST call one page at a time.
+
+        Uses the API server's limit/continue chunking so only one page of
+        results is held in memory at once. If the continue token expires
+        mid-list (410 Gone), the list starts over from the first page, so
+        items already yielded may be yielded again; callers must treat
+        items idempotently.
+
+        Args:
+            list_func: Kubernetes client list function, returning a typed
+                       list object or, for custom objects, a dict
+            page_size: Maximum number of items per page
+            **kwargs: Extra arguments for the list function (selectors, etc.)
+
+        Yields:
+            Lists of items, one per page
+
+        Raises:
+            ApiException: If a LIST fails, or its continue token expired
+                          more than LIST_RESTARTS times
+        """
+        restarts = 0
+        continue_token = None
+        while True:
+            params = dict(kwargs, _continue=continue_token) if continue_token else kwargs
+            try:
+                result = list_func(limit=page_size, **params)
+            except ApiException as e:
+                if e.status != 410 or not continue_token or restarts >= LIST_RESTARTS:
+                    raise
+                restarts += 1
+                logger.info("List continue token expired, listing again from the start")
+                continue_token = None
+                continue
+            if isinstance(result, dict):
+                # Custom object APIs return plain dicts
+                yield result.get("items") or []
+                continue_token = (result.get("metadata") or {}).get("continue")
+            else:
+                yield result.items or []
+                continue_token = result.metadata._continue if result.metadata else None
+            if not continue_token:
+                break
+
+    def server_side_apply(self, patch_func: Callable[..., Any], body: Any,
+                          resource_type: str, name: str,
+                          namespace: Optional[str] = None) -> Any:
+        """Apply the desired state of an object in a single request.
+
+        Server-side apply creates the object if it is missing and otherwise
+        updates only the fields owned by the operator's field manager, so
+        no read-before-write or create-then-patch fallback is needed. The
+        apply is forced: fields the operator sets are taken over from other
+        field managers.
+
+        Args:
+            patch_func: Kubernetes client patch function for the resource
+            body: Full desired object, including apiVersion and kind
+            resource_type: Type of resource (Role, Secret, etc.)
+            name: Name of the resource
+            namespace: Namespace of the resource, if namespaced
+
+        Returns:
+            The applied object
+
+        Raises:
+            KubernetesAPIError: For API errors
+        """
+        try:
+            return patch_func(**self._apply_kwargs(body, name, namespace, force=True))
+        except ApiException as e:
+            self.handle_api_exception(e, "apply", resource_type, name, namespace)
+
+    def server_side_apply_shared(self, patch_func: Callable[..., Any], body: Dict[str, Any],
+                                 resource_type: str, name: str,
+                                 namespace: Optional[str] = None) -> Any:
+        """Apply the desired state of an object without taking over fields.
+
+        For objects that users or other controllers also manage. The apply
+        is not forced, so the API server rejects it with a conflict if it
+        sets a field owned by another field manager. The conflicting fields
+        are then left out and the apply is sent again, so existing values
+        set by others win.
+
+        Args:
+            patch_func: Kubernetes client patch function for the resource
+            body: Full desired object as a dict, including apiVersion and kind
+            resource_type: Type of resource (Namespace, ServiceAccount, etc.)
+            name: Name of the resource
+            namespace: Namespace of the resource, if namespaced
+
+        Returns:
+            The applied object
+
+        Raises:
+            ResourceAlreadyExistsError: If a conflict remains after leaving
+                                        out the conflicting fields
+            KubernetesAPIError: For other API errors
+        """
+        try:
+            return patch_func(**self._apply_kwargs(body, name, namespace, force=False))
+        except ApiException as e:
+            fields = conflicting_fields(e)
+            if not fields:
+                self.handle_api_exception(e, "apply", resource_type, name, namespace)
+        logger.info(
+            f"Leaving {', '.join(fields)} of {resource_type} '{name}' to other field managers"
+        )
+        for path in fields:
+            drop_field(body, path)
+        try:
+            return patch_func(**self._apply_kwargs(body, name, namespace, force=False))
+        except ApiException as e:
+            self.handle_api_exception(e, "apply", resource_type, name, namespace)
+
+    @staticmethod
+    def _apply_kwargs(body: Any, name: str, namespace: Optional[str],
+                      force: bool) -> Dict[str, Any]:
+        """Build the arguments of a server-side apply patch call."""
+        kwargs = {
+            "name": name,
+            "body": body,
+            "field_manager": FIELD_MANAGER,
+            "force": force,
+            "_content_type": APPLY_PATCH_CONTENT_TYPE,
+        }
+        if namespace is not None:
+            kwargs["namespace"] = namespace
+        return kwargs
+
     @staticmethod
     def handle_api_exception(e: ApiException, operation: str, resource_type: str,
                               name: str, namespace: Optional[str] = None) -> None:
@@ -0,0 +1,132 @@
+"""Process-wide cache of the cluster identity used in kubeconfigs.
+
+Every generated kubeconfig embeds the API server URL and the cluster CA.
+The CA is read from the kube-root-ca.crt ConfigMap and base64-encoded once,
+then served from memory until a watch on that ConfigMap reports a change,
+so onboarding many users costs a single CA read.
+"""
+
+import base64
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from kubernetes import client
+
+from app.repositories.informer import Informer
+from app.repositories.secret_repository import SecretRepository
+
+logger = logging.getLogger(__name__)
+
+CA_CONFIGMAP_NAME = "kube-root-ca.crt"
+CA_CONFIGMAP_NAMESPACE = "kube-system"
+CA_CONFIGMAP_KEY = "ca.crt"
+
+
+@dataclass(frozen=True)
+class ClusterIdentity:
+    """API server URL and base64-encoded CA certificate of the cluster."""
+
+    server: str
+    ca_data: str
+
+
+def read_cluster_identity(secret_repo: SecretRepository) -> ClusterIdentity:
+    """Read the cluster identity from the API.
+
+    Args:
+        secret_repo: Repository used to read the CA ConfigMap
+
+    Returns:
+        The cluster identity; ca_data is empty if the ConfigMap has no CA
+
+    Raises:
+        ResourceNotFoundError: If the CA ConfigMap doesn't exist
+        KubernetesAPIError: For other API errors
+    """
+    configmap = secret_repo.get_configmap(
+        name=CA_CONFIGMAP_NAME,
+        namespace=CA_CONFIGMAP_NAMESPACE
+    )
+    cluster_ca = (configmap.data or {}).get(CA_CONFIGMAP_KEY)
+    ca_data = base64.b64encode(cluster_ca.encode('utf-8')).decode('utf-8') if cluster_ca else ""
+    return ClusterIdentity(
+        server=secret_repo.api_client.configuration.host,
+        ca_data=ca_data,
+    )
+
+
+class ClusterIdentityCache:
+    """Thread-safe cache of the cluster identity, invalidated by a watch."""
+
+    def __init__(self, secret_repo: SecretRepository,
+                 core_api: Optional[client.CoreV1Api] = None):
+        """Initialize the cache.
+
+        Args:
+            secret_repo: Repository used to read the CA ConfigMap
+            core_api: Core API client used to watch the CA ConfigMap. If not
+                      provided, the cache is never invalidated by a watch.
+        """
+        self._secret_repo = secret_repo
+        self._identity: Optional[ClusterIdentity] = None
+        self._lock = threading.Lock()
+        self._informer: Optional[Informer] = None
+
+        if core_api is not None:
+            self._informer = Informer(
+                core_api.list_namespaced_config_map,
+                name="cluster-ca",
+                field_selector=f"metadata.name={CA_CONFIGMAP_NAME}",
+                list_kwargs={"namespace": CA_CONFIGMAP_NAMESPACE},
+            )
+            self._informer.add_event_handler(self._on_event)
+            self._informer.add_relist_handler(self._on_relist)
+
+    def start(self) -> None:
+        """Start watching the CA ConfigMap."""
+        if self._informer:
+            self._informer.start()
+
+    def stop(self) -> None:
+        """Stop watching the CA ConfigMap."""
+        if self._informer:
+            self._informer.stop()
+
+    def get(self) -> ClusterIdentity:
+        """Get the cluster identity, reading the CA on first use.
+
+        An identity without CA data is returned but not cached, so a
+        missing CA is retried on the next call.
+
+        Returns:
+            The cluster identity
+
+        Raises:
+            ResourceNotFoundError: If the CA ConfigMap doesn't exist
+            KubernetesAPIError: For other API errors
+        """
+        with self._lock:
+            if self._identity is not None:
+                return self._identity
+
+            identity = read_cluster_identity(self._secret_repo)
+            if identity.ca_data:
+                self._identity = identity
+                logger.debug("Cached cluster identity")
+            return identity
+
+    def invalidate(self) -> None:
+        """Forget the cached identity."""
+        with self._lock:
+            self._identity = None
+
+    def _on_event(self, event_type: str, obj: Any, old_obj: Optional[Any]) -> None:
+        """Invalidate on any change to the CA ConfigMap."""
+        logger.info(f"Cluster CA ConfigMap {event_type.lower()}, invalidating cached identity")
+        self.invalidate()
+
+    def _on_relist(self, items: List[Any]) -> None:
+        """Invalidate after a relist, since changes may have been missed."""
+        self.invalidate()
@@ -0,0 +1,76 @@
+"""Short-lived memoization of resource existence checks.
+
+Reconciling a User or Group probes the same Namespaces and ClusterRoles
+over and over (one probe per binding). This module caches the result of
+those probes for a short TTL. Entries are also updated by the operator's
+own writes and invalidated by watch events, so the TTL only bounds
+staleness for changes made outside the operator that the watch missed.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from app.api.metrics import record_existence_cache_lookup
+
+
+class ExistenceCache:
+    """Thread-safe TTL cache of existence probe results."""
+
+    def __init__(self, name: str, ttl_seconds: float = 30.0):
+        """Initialize the cache.
+
+        Args:
+            name: Cache name used as the metric label
+            ttl_seconds: How long a probe result stays valid
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable, probe: Callable[[], bool]) -> bool:
+        """Get a cached result, running the probe on a miss.
+
+        Args:
+            key: Cache key identifying the resource
+            probe: Function performing the actual existence check
+
+        Returns:
+            Whether the resource exists
+        """
+        cached = self.get(key)
+        record_existence_cache_lookup(self.name, hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        exists = probe()
+        self.set(key, exists)
+        return exists
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        """Get a cached result, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            exists, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return exists
+
+    def set(self, key: Hashable, exists: bool) -> None:
+        """Record a known existence state for a resource."""
+        with self._lock:
+            self._entries[key] = (exists, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the cached state of a resource."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all cached states."""
+        with self._lock:
+            self._entries.clear()
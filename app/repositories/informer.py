@@ -0,0 +1,300 @@
+"""Watch-fed in-memory cache for Kubernetes resources.
+
+This module provides a small list-then-watch informer that keeps a local
+copy of every object of one resource type. Consumers register event
+handlers to build secondary indexes on top of the store.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from app.repositories.base import PARTIAL_METADATA_ACCEPT, PARTIAL_METADATA_LIST_ACCEPT
+
+logger = logging.getLogger(__name__)
+
+# HTTP status returned by the API server when a watch resourceVersion expired
+HTTP_GONE = 410
+
+ObjectKey = Tuple[str, str]
+EventHandler = Callable[[str, Any, Optional[Any]], None]
+RelistHandler = Callable[[List[Any]], None]
+
+
+def object_meta(obj: Any, field: str) -> Optional[str]:
+    """Read a metadata field from a typed model or a raw dict.
+
+    Args:
+        obj: A kubernetes client model or a raw API dict
+        field: Metadata field in camelCase (e.g. "resourceVersion")
+
+    Returns:
+        The field value, or None if not present
+    """
+    if isinstance(obj, dict):
+        return (obj.get("metadata") or {}).get(field)
+    metadata = getattr(obj, "metadata", None)
+    if metadata is None:
+        return None
+    snake = "".join("_" + c.lower() if c.isupper() else c for c in field)
+    return getattr(metadata, snake, None)
+
+
+def object_key(obj: Any) -> ObjectKey:
+    """Get the (namespace, name) store key for an object."""
+    return (object_meta(obj, "namespace") or "", object_meta(obj, "name") or "")
+
+
+def _list_items(response: Any) -> List[Any]:
+    """Extract the item list from a typed or raw list response."""
+    if isinstance(response, dict):
+        return response.get("items") or []
+    return response.items or []
+
+
+def _list_resource_version(response: Any) -> Optional[str]:
+    """Extract the list resourceVersion from a typed or raw list response."""
+    if isinstance(response, dict):
+        return (response.get("metadata") or {}).get("resourceVersion")
+    return response.metadata.resource_version
+
+
+class Informer:
+    """List-then-watch cache for a single Kubernetes resource type.
+
+    The informer performs one full LIST on start, then follows a WATCH from
+    the returned resourceVersion. Watch timeouts and transient errors resume
+    from the last seen resourceVersion; a full relist only happens when the
+    API server reports the resourceVersion as expired (410 Gone).
+    """
+
+    def __init__(
+        self,
+        list_func: Callable[..., Any],
+        name: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        list_kwargs: Optional[Dict[str, Any]] = None,
+        watch_timeout_seconds: int = 300,
+        retry_delay_seconds: float = 5.0,
+        transform: Optional[Callable[[Any], Any]] = None,
+        metadata_only: bool = False,
+    ):
+        """Initialize the informer.
+
+        Args:
+            list_func: Kubernetes client list function supporting watch
+            name: Human readable name used in logs
+            label_selector: Optional label selector for LIST and WATCH
+            field_selector: Optional field selector for LIST and WATCH
+            list_kwargs: Extra keyword arguments for the list function
+            watch_timeout_seconds: Server-side timeout for each WATCH call
+            retry_delay_seconds: Delay before retrying after an error
+            transform: Optional function reducing each object before it is
+                       stored, so only the fields consumers need are kept.
+                       The result must keep the object's metadata.
+            metadata_only: Request PartialObjectMetadata instead of full
+                           objects, for consumers that only need metadata.
+                           Requires a list function returning raw dicts.
+        """
+        self.name = name
+        self._list_func = list_func
+        self._list_kwargs = dict(list_kwargs or {})
+        if label_selector:
+            self._list_kwargs["label_selector"] = label_selector
+        if field_selector:
+            self._list_kwargs["field_selector"] = field_selector
+        self._watch_timeout = watch_timeout_seconds
+        self._retry_delay = retry_delay_seconds
+        self._transform = transform
+        self._metadata_only = metadata_only
+        self._relist_requested = False
+
+        self._store: Dict[ObjectKey, Any] = {}
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._event_handlers: List[EventHandler] = []
+        self._relist_handlers: List[RelistHandler] = []
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+
+    # ==================== Lifecycle ====================
+
+    def add_event_handler(self, handler: EventHandler) -> None:
+        """Register a handler called as handler(event_type, obj, old_obj)."""
+        self._event_handlers.append(handler)
+
+    def add_relist_handler(self, handler: RelistHandler) -> None:
+        """Register a handler called with the full item list after a LIST."""
+        self._relist_handlers.append(handler)
+
+    def start(self) -> None:
+        """Start the list/watch background thread."""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Informer '{self.name}' started")
+
+    def stop(self) -> None:
+        """Stop the list/watch background thread."""
+        self._running = False
+        if self._watch:
+            self._watch.stop()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info(f"Informer '{self.name}' stopped")
+
+    def request_relist(self) -> None:
+        """Replace the store with a fresh LIST once the current watch ends.
+
+        The current watch is stopped so the relist happens promptly.
+        """
+        self._relist_requested = True
+        if self._watch:
+            self._watch.stop()
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial LIST has completed."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial LIST has completed.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if the informer is synced
+        """
+        return self._synced.wait(timeout)
+
+    # ==================== Store Access ====================
+
+    def get(self, namespace: str, name: str) -> Optional[Any]:
+        """Get a cached object by namespace and name."""
+        with self._lock:
+            return self._store.get((namespace or "", name))
+
+    def list(self) -> List[Any]:
+        """List all cached objects."""
+        with self._lock:
+            return list(self._store.values())
+
+    # ==================== List/Watch Loop ====================
+
+    def _run(self) -> None:
+        """Main list/watch loop."""
+        resource_version: Optional[str] = None
+
+        while self._running:
+            try:
+                if resource_version is None or self._relist_requested:
+                    self._relist_requested = False
+                    resource_version = self._relist()
+                resource_version = self._watch_from(resource_version)
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    logger.info(
+                        f"Informer '{self.name}' watch expired, relisting"
+                    )
+                    resource_version = None
+                    continue
+                logger.warning(f"Informer '{self.name}' API error: {e.reason}")
+                time.sleep(self._retry_delay)
+            except Exception as e:
+                logger.error(f"Informer '{self.name}' error: {e}")
+                time.sleep(self._retry_delay)
+
+    def _relist(self) -> Optional[str]:
+        """Replace the store with a fresh LIST.
+
+        Returns:
+            The resourceVersion of the list
+        """
+        kwargs = dict(self._list_kwargs)
+        if self._metadata_only:
+            kwargs["_headers"] = {"Accept": PARTIAL_METADATA_LIST_ACCEPT}
+        response = self._list_func(**kwargs)
+        items = _list_items(response)
+        if self._transform:
+            items = [self._transform(item) for item in items]
+
+        with self._lock:
+            self._store = {object_key(item): item for item in items}
+            for handler in self._relist_handlers:
+                handler(items)
+
+        self._synced.set()
+        logger.debug(f"Informer '{self.name}' listed {len(items)} objects")
+        return _list_resource_version(response)
+
+    def _watch_from(self, resource_version: Optional[str]) -> Optional[str]:
+        """Follow a WATCH until it times out or is stopped.
+
+        Args:
+            resource_version: The resourceVersion to start from
+
+        Returns:
+            The last seen resourceVersion
+
+        Raises:
+            ApiException: With status 410 when the resourceVersion expired
+        """
+        self._watch = watch.Watch()
+        kwargs = dict(self._list_kwargs)
+        kwargs["timeout_seconds"] = self._watch_timeout
+        kwargs["allow_watch_bookmarks"] = True
+        if self._metadata_only:
+            kwargs["_headers"] = {"Accept": PARTIAL_METADATA_ACCEPT}
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+
+        for event in self._watch.stream(self._list_func, **kwargs):
+            if not self._running:
+                self._watch.stop()
+                break
+            resource_version = self._handle_event(event) or resource_version
+
+        return resource_version
+
+    def _handle_event(self, event: Dict[str, Any]) -> Optional[str]:
+        """Apply a single watch event to the store.
+
+        Args:
+            event: Watch event with 'type' and 'object' keys
+
+        Returns:
+            The resourceVersion carried by the event
+        """
+        event_type = event["type"]
+        obj = event["object"]
+        resource_version = object_meta(obj, "resourceVersion")
+
+        if event_type == "BOOKMARK":
+            return resource_version
+
+        if self._transform:
+            obj = self._transform(obj)
+        key = object_key(obj)
+        with self._lock:
+            old = self._store.get(key)
+            if event_type == "DELETED":
+                self._store.pop(key, None)
+            else:
+                self._store[key] = obj
+            for handler in self._event_handlers:
+                handler(event_type, obj, old)
+
+        return resource_version
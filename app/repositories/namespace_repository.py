@@ -6,15 +6,17 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from app.repositories.base import BaseRepository
-from app.exceptions import ResourceNotFoundError
+from app.repositories.existence_cache import ExistenceCache
 
 
 class NamespaceRepository(BaseRepository):
     """Repository for Kubernetes Namespace operations."""
 
-    def __init__(self, api_client: Optional[client.ApiClient] = None):
+    def __init__(self, api_client: Optional[client.ApiClient] = None,
+                 existence_cache: Optional[ExistenceCache] = None):
         super().__init__(api_client)
-        self._core_v1 = client.CoreV1Api(self.api_client)
+        self._core_v1 = self.instrument(client.CoreV1Api(self.api_client))
+        self.existence_cache = existence_cache
 
     def get(self, name: str) -> client.V1Namespace:
         """Get a namespace by name.
@@ -43,6 +45,12 @@ class NamespaceRepository(BaseRepository):
         Returns:
             True if namespace exists, False otherwise
         """
+        if self.existence_cache is not None:
+            return self.existence_cache.lookup(name, lambda: self._probe(name))
+        return self._probe(name)
+
+    def _probe(self, name: str) -> bool:
+        """Check with the API server whether a namespace exists."""
         try:
             self._core_v1.read_namespace(name=name)
             return True
@@ -75,10 +83,14 @@ class NamespaceRepository(BaseRepository):
         namespace = client.V1Namespace(metadata=metadata)
 
         try:
-            return self._core_v1.create_namespace(body=namespace)
+            created = self._core_v1.create_namespace(body=namespace)
         except ApiException as e:
             self.handle_api_exception(e, "create", "Namespace", name)
 
+        if self.existence_cache is not None:
+            self.existence_cache.set(name, True)
+        return created
+
     def delete(self, name: str, grace_period_seconds: int = 0) -> None:
         """Delete a namespace.
 
@@ -98,6 +110,9 @@ class NamespaceRepository(BaseRepository):
             self._core_v1.delete_namespace(name=name, body=delete_options)
         except ApiException as e:
             self.handle_api_exception(e, "delete", "Namespace", name)
+        finally:
+            if self.existence_cache is not None:
+                self.existence_cache.invalidate(name)
 
     def list_all(self) -> List[client.V1Namespace]:
         """List all namespaces.
@@ -119,17 +134,29 @@ class NamespaceRepository(BaseRepository):
 
     def ensure_exists(self, name: str, labels: Optional[dict] = None,
                       annotations: Optional[dict] = None) -> client.V1Namespace:
-        """Ensure a namespace exists, creating it if necessary.
+        """Ensure a namespace exists with the operator's labels and annotations.
+
+        Uses a single server-side apply that is not forced: labels and
+        annotations of an existing namespace that other field managers
+        set keep their values.
 
         Args:
             name: The namespace name
-            labels: Optional labels to apply (only on create)
-            annotations: Optional annotations to apply (only on create)
+            labels: Optional labels owned by the operator
+            annotations: Optional annotations owned by the operator
 
         Returns:
-            The V1Namespace object (existing or newly created)
+            The applied V1Namespace object
         """
-        try:
-            return self.get(name)
-        except ResourceNotFoundError:
-            return self.create(name, labels=labels, annotations=annotations)
+        metadata = {"name": name}
+        if labels:
+            metadata["labels"] = dict(labels)
+        if annotations:
+            metadata["annotations"] = dict(annotations)
+        namespace = {"apiVersion": "v1", "kind": "Namespace", "metadata": metadata}
+        applied = self.server_side_apply_shared(
+            self._core_v1.patch_namespace, namespace, "Namespace", name
+        )
+        if self.existence_cache is not None:
+            self.existence_cache.set(name, True)
+        return applied
@@ -22,7 +22,7 @@ class NetworkPolicyRepository(BaseRepository):
             networking_api: Optional Kubernetes NetworkingV1Api client
         """
         super().__init__()
-        self.networking_api = networking_api or client.NetworkingV1Api()
+        self.networking_api = self.instrument(networking_api or client.NetworkingV1Api())
 
     def get(self, name: str, namespace: str) -> client.V1NetworkPolicy:
         """Get a NetworkPolicy by name.
@@ -71,7 +71,7 @@ class NetworkPolicyRepository(BaseRepository):
         namespace: str,
         labels: Optional[Dict[str, str]] = None
     ) -> client.V1NetworkPolicy:
-        """Create an isolated NetworkPolicy (deny all ingress except same namespace).
+        """Apply an isolated NetworkPolicy (deny all ingress except same namespace).
 
         Args:
             name: The NetworkPolicy name
@@ -79,9 +79,11 @@ class NetworkPolicyRepository(BaseRepository):
             labels: Optional labels
 
         Returns:
-            The created NetworkPolicy
+            The applied NetworkPolicy
         """
         policy = client.V1NetworkPolicy(
+            api_version="networking.k8s.io/v1",
+            kind="NetworkPolicy",
             metadata=client.V1ObjectMeta(
                 name=name,
                 namespace=namespace,
@@ -105,7 +107,7 @@ class NetworkPolicyRepository(BaseRepository):
                 ]
             )
         )
-        return self._create(policy, namespace)
+        return self._apply(policy, namespace)
 
     def create_restricted_policy(
         self,
@@ -113,7 +115,7 @@ class NetworkPolicyRepository(BaseRepository):
         namespace: str,
         labels: Optional[Dict[str, str]] = None
     ) -> client.V1NetworkPolicy:
-        """Create a restricted NetworkPolicy (deny all except DNS and same namespace).
+        """Apply a restricted NetworkPolicy (deny all except DNS and same namespace).
 
         Args:
             name: The NetworkPolicy name
@@ -121,9 +123,11 @@ class NetworkPolicyRepository(BaseRepository):
             labels: Optional labels
 
         Returns:
-            The created NetworkPolicy
+            The applied NetworkPolicy
         """
         policy = client.V1NetworkPolicy(
+            api_version="networking.k8s.io/v1",
+            kind="NetworkPolicy",
             metadata=client.V1ObjectMeta(
                 name=name,
                 namespace=namespace,
@@ -184,40 +188,34 @@ class NetworkPolicyRepository(BaseRepository):
                 ]
             )
         )
-        return self._create(policy, namespace)
+        return self._apply(policy, namespace)
 
-    def _create(
+    def _apply(
         self,
         policy: client.V1NetworkPolicy,
         namespace: str
     ) -> client.V1NetworkPolicy:
-        """Create a NetworkPolicy.
+        """Create or update a NetworkPolicy with a single server-side apply.
 
         Args:
-            policy: The NetworkPolicy object
+            policy: The NetworkPolicy object, including apiVersion and kind
             namespace: The namespace
 
         Returns:
-            The created NetworkPolicy
+            The applied NetworkPolicy
 
         Raises:
-            KubernetesAPIError: If creation fails
+            KubernetesAPIError: If the apply fails
         """
-        try:
-            result = self.networking_api.create_namespaced_network_policy(
-                namespace, policy
-            )
-            logger.info(
-                f"Created NetworkPolicy '{policy.metadata.name}' "
-                f"in namespace '{namespace}'"
-            )
-            return result
-        except ApiException as e:
-            raise KubernetesAPIError(
-                "create_network_policy",
-                f"Failed to create NetworkPolicy '{policy.metadata.name}': {e.reason}",
-                e.status
-            )
+        result = self.server_side_apply(
+            self.networking_api.patch_namespaced_network_policy, policy,
+            "NetworkPolicy", policy.metadata.name, namespace
+        )
+        logger.info(
+            f"Applied NetworkPolicy '{policy.metadata.name}' "
+            f"in namespace '{namespace}'"
+        )
+        return result
 
     def delete(self, name: str, namespace: str) -> None:
         """Delete a NetworkPolicy.
@@ -1,20 +1,71 @@
 """RBAC repository for Kubernetes RBAC operations."""
 
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from app.repositories.base import BaseRepository
-from app.exceptions import ResourceAlreadyExistsError
+from app.repositories.existence_cache import ExistenceCache
+from app.repositories.rolebinding_index import RoleBindingIndex
+from app.api.metrics import record_binding_apply
+from app.exceptions import ResourceNotFoundError
+from app.utils.labels import selector_matches
+
+RBAC_API_VERSION = "rbac.authorization.k8s.io/v1"
+
+# Outcomes of create_or_update_role_binding / create_or_update_cluster_role_binding
+BINDING_UNCHANGED = "skipped"
+BINDING_CREATED = "created"
+BINDING_PATCHED = "patched"
+BINDING_REPLACED = "replaced"
+
+
+def _role_ref_key(role_ref) -> Tuple[str, str, str]:
+    """Get a comparable key for a role reference."""
+    return (role_ref.api_group or "", role_ref.kind, role_ref.name)
+
+
+def _subject_keys(subjects) -> List[Tuple[str, str, str, str]]:
+    """Get a comparable, order-preserving key list for binding subjects."""
+    return [
+        (s.kind, s.name, s.namespace or "", s.api_group or "")
+        for s in (subjects or [])
+    ]
 
 
 class RBACRepository(BaseRepository):
     """Repository for Kubernetes RBAC operations (Roles, ClusterRoles, Bindings)."""
 
-    def __init__(self, api_client: Optional[client.ApiClient] = None):
+    # Page size for cluster-wide binding listings
+    LIST_PAGE_SIZE = 500
+
+    def __init__(self, api_client: Optional[client.ApiClient] = None,
+                 binding_index: Optional[RoleBindingIndex] = None,
+                 existence_cache: Optional[ExistenceCache] = None):
+        """Initialize the repository.
+
+        Args:
+            api_client: Optional pre-configured API client
+            binding_index: Optional watch-fed RoleBinding index used for
+                          subject lookups once it has synced
+            existence_cache: Optional cache for Role/ClusterRole existence checks
+        """
         super().__init__(api_client)
-        self._rbac_v1 = client.RbacAuthorizationV1Api(self.api_client)
+        self._rbac_v1 = self.instrument(client.RbacAuthorizationV1Api(self.api_client))
+        self.binding_index = binding_index
+        self.existence_cache = existence_cache
+
+    def _cached_exists(self, key: tuple, probe: Callable[[], bool]) -> bool:
+        """Run an existence probe through the cache if one is configured."""
+        if self.existence_cache is None:
+            return probe()
+        return self.existence_cache.lookup(key, probe)
+
+    def _forget(self, key: tuple) -> None:
+        """Drop a cached existence result after a write."""
+        if self.existence_cache is not None:
+            self.existence_cache.invalidate(key)
 
     # ==================== Role Operations ====================
 
@@ -39,6 +90,12 @@ class RBACRepository(BaseRepository):
 
     def role_exists(self, name: str, namespace: str) -> bool:
         """Check if a role exists."""
+        return self._cached_exists(
+            ("Role", namespace, name), lambda: self._probe_role(name, namespace)
+        )
+
+    def _probe_role(self, name: str, namespace: str) -> bool:
+        """Check with the API server whether a role exists."""
         try:
             self._rbac_v1.read_namespaced_role(name=name, namespace=namespace)
             return True
@@ -49,7 +106,8 @@ class RBACRepository(BaseRepository):
 
     def create_role(self, name: str, namespace: str,
                     rules: List[dict],
-                    labels: Optional[dict] = None) -> client.V1Role:
+                    labels: Optional[dict] = None,
+                    annotations: Optional[dict] = None) -> client.V1Role:
         """Create a Role.
 
         Args:
@@ -57,40 +115,51 @@ class RBACRepository(BaseRepository):
             namespace: The namespace
             rules: List of policy rules
             labels: Optional labels
+            annotations: Optional annotations
 
         Returns:
             The created V1Role object
         """
-        metadata = client.V1ObjectMeta(name=name, labels=labels or {})
+        metadata = client.V1ObjectMeta(name=name, labels=labels or {}, annotations=annotations or None)
         role = client.V1Role(metadata=metadata, rules=rules)
 
         try:
             return self._rbac_v1.create_namespaced_role(namespace=namespace, body=role)
         except ApiException as e:
             self.handle_api_exception(e, "create", "Role", name, namespace)
+        finally:
+            self._forget(("Role", namespace, name))
 
     def update_role(self, name: str, namespace: str,
-                    rules: List[dict]) -> client.V1Role:
-        """Update a Role.
+                    rules: List[dict],
+                    labels: Optional[dict] = None,
+                    annotations: Optional[dict] = None) -> client.V1Role:
+        """Apply the desired state of a Role, creating it if missing.
 
         Args:
             name: The role name
             namespace: The namespace
             rules: New list of policy rules
+            labels: Optional labels owned by the operator
+            annotations: Optional annotations owned by the operator
 
         Returns:
-            The updated V1Role object
+            The applied V1Role object
         """
         body = client.V1Role(
-            metadata=client.V1ObjectMeta(name=name),
+            api_version=RBAC_API_VERSION,
+            kind="Role",
+            metadata=client.V1ObjectMeta(
+                name=name, namespace=namespace, labels=labels, annotations=annotations
+            ),
             rules=rules
         )
         try:
-            return self._rbac_v1.patch_namespaced_role(
-                name=name, namespace=namespace, body=body
+            return self.server_side_apply(
+                self._rbac_v1.patch_namespaced_role, body, "Role", name, namespace
             )
-        except ApiException as e:
-            self.handle_api_exception(e, "update", "Role", name, namespace)
+        finally:
+            self._forget(("Role", namespace, name))
 
     def delete_role(self, name: str, namespace: str) -> None:
         """Delete a Role."""
@@ -98,6 +167,8 @@ class RBACRepository(BaseRepository):
             self._rbac_v1.delete_namespaced_role(name=name, namespace=namespace)
         except ApiException as e:
             self.handle_api_exception(e, "delete", "Role", name, namespace)
+        finally:
+            self._forget(("Role", namespace, name))
 
     # ==================== ClusterRole Operations ====================
 
@@ -110,6 +181,12 @@ class RBACRepository(BaseRepository):
 
     def cluster_role_exists(self, name: str) -> bool:
         """Check if a ClusterRole exists."""
+        return self._cached_exists(
+            ("ClusterRole", name), lambda: self._probe_cluster_role(name)
+        )
+
+    def _probe_cluster_role(self, name: str) -> bool:
+        """Check with the API server whether a ClusterRole exists."""
         try:
             self._rbac_v1.read_cluster_role(name=name)
             return True
@@ -119,26 +196,35 @@ class RBACRepository(BaseRepository):
             raise
 
     def create_cluster_role(self, name: str, rules: List[dict],
-                            labels: Optional[dict] = None) -> client.V1ClusterRole:
+                            labels: Optional[dict] = None,
+                            annotations: Optional[dict] = None) -> client.V1ClusterRole:
         """Create a ClusterRole."""
-        metadata = client.V1ObjectMeta(name=name, labels=labels or {})
+        metadata = client.V1ObjectMeta(name=name, labels=labels or {}, annotations=annotations or None)
         role = client.V1ClusterRole(metadata=metadata, rules=rules)
 
         try:
             return self._rbac_v1.create_cluster_role(body=role)
         except ApiException as e:
             self.handle_api_exception(e, "create", "ClusterRole", name)
+        finally:
+            self._forget(("ClusterRole", name))
 
-    def update_cluster_role(self, name: str, rules: List[dict]) -> client.V1ClusterRole:
-        """Update a ClusterRole."""
+    def update_cluster_role(self, name: str, rules: List[dict],
+                            labels: Optional[dict] = None,
+                            annotations: Optional[dict] = None) -> client.V1ClusterRole:
+        """Apply the desired state of a ClusterRole, creating it if missing."""
         body = client.V1ClusterRole(
-            metadata=client.V1ObjectMeta(name=name),
+            api_version=RBAC_API_VERSION,
+            kind="ClusterRole",
+            metadata=client.V1ObjectMeta(name=name, labels=labels, annotations=annotations),
             rules=rules
         )
         try:
-            return self._rbac_v1.patch_cluster_role(name=name, body=body)
-        except ApiException as e:
-            self.handle_api_exception(e, "update", "ClusterRole", name)
+            return self.server_side_apply(
+                self._rbac_v1.patch_cluster_role, body, "ClusterRole", name
+            )
+        finally:
+            self._forget(("ClusterRole", name))
 
     def delete_cluster_role(self, name: str) -> None:
         """Delete a ClusterRole."""
@@ -146,14 +232,13 @@ class RBACRepository(BaseRepository):
             self._rbac_v1.delete_cluster_role(name=name)
         except ApiException as e:
             self.handle_api_exception(e, "delete", "ClusterRole", name)
+        finally:
+            self._forget(("ClusterRole", name))
 
     def create_or_update_cluster_role(self, name: str, rules: List[dict],
                                        labels: Optional[dict] = None) -> client.V1ClusterRole:
-        """Create or update a ClusterRole."""
-        try:
-            return self.create_cluster_role(name, rules, labels)
-        except ResourceAlreadyExistsError:
-            return self.update_cluster_role(name, rules)
+        """Create or update a ClusterRole with a single server-side apply."""
+        return self.update_cluster_role(name, rules, labels)
 
     # ==================== RoleBinding Operations ====================
 
@@ -197,19 +282,20 @@ class RBACRepository(BaseRepository):
 
     def update_role_binding(self, name: str, namespace: str,
                             role_ref: client.V1RoleRef,
-                            subjects: List) -> client.V1RoleBinding:
-        """Update a RoleBinding."""
+                            subjects: List,
+                            labels: Optional[dict] = None) -> client.V1RoleBinding:
+        """Apply the desired state of a RoleBinding, creating it if missing."""
         binding = client.V1RoleBinding(
-            metadata=client.V1ObjectMeta(name=name, namespace=namespace),
+            api_version=RBAC_API_VERSION,
+            kind="RoleBinding",
+            metadata=client.V1ObjectMeta(name=name, namespace=namespace, labels=labels),
             role_ref=role_ref,
             subjects=subjects
         )
-        try:
-            return self._rbac_v1.patch_namespaced_role_binding(
-                name=name, namespace=namespace, body=binding
-            )
-        except ApiException as e:
-            self.handle_api_exception(e, "update", "RoleBinding", name, namespace)
+        return self.server_side_apply(
+            self._rbac_v1.patch_namespaced_role_binding, binding,
+            "RoleBinding", name, namespace
+        )
 
     def delete_role_binding(self, name: str, namespace: str) -> None:
         """Delete a RoleBinding."""
@@ -218,20 +304,77 @@ class RBACRepository(BaseRepository):
         except ApiException as e:
             self.handle_api_exception(e, "delete", "RoleBinding", name, namespace)
 
-    def list_role_bindings(self, namespace: str) -> List[client.V1RoleBinding]:
+    def list_role_bindings(self, namespace: str,
+                           label_selector: Optional[str] = None) -> List[client.V1RoleBinding]:
         """List all RoleBindings in a namespace."""
-        result = self._rbac_v1.list_namespaced_role_binding(namespace=namespace)
+        if label_selector:
+            result = self._rbac_v1.list_namespaced_role_binding(
+                namespace=namespace, label_selector=label_selector
+            )
+        else:
+            result = self._rbac_v1.list_namespaced_role_binding(namespace=namespace)
         return result.items
 
+    def iter_role_bindings(self, label_selector: Optional[str] = None,
+                           page_size: Optional[int] = None) -> Iterator[client.V1RoleBinding]:
+        """Stream RoleBindings from all namespaces.
+
+        Issues a single paginated cluster-wide LIST instead of one call per
+        namespace, holding at most one page in memory.
+
+        Args:
+            label_selector: Optional label selector to filter server-side
+            page_size: Items per page (defaults to LIST_PAGE_SIZE)
+
+        Yields:
+            V1RoleBinding objects
+        """
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        for page in self.iter_pages(
+            self._rbac_v1.list_role_binding_for_all_namespaces,
+            page_size or self.LIST_PAGE_SIZE,
+            **kwargs
+        ):
+            yield from page
+
     def create_or_update_role_binding(self, name: str, namespace: str,
                                        role_ref: client.V1RoleRef,
                                        subjects: List,
-                                       labels: Optional[dict] = None) -> client.V1RoleBinding:
-        """Create or update a RoleBinding."""
+                                       labels: Optional[dict] = None) -> str:
+        """Create or update a RoleBinding, skipping the write if unchanged.
+
+        The current binding is read from the RoleBinding index when it has
+        synced, otherwise with a single GET. Missing or drifted bindings are
+        written with one server-side apply. A binding whose roleRef differs
+        is deleted first, since roleRef is immutable.
+
+        Returns:
+            What was done: BINDING_CREATED, BINDING_PATCHED, BINDING_REPLACED
+            or BINDING_UNCHANGED
+        """
+        actual = self._read_role_binding(name, namespace)
+        action = self._binding_action(actual, role_ref, subjects, labels)
+        record_binding_apply("RoleBinding", action)
+
+        if action == BINDING_UNCHANGED:
+            return action
+        if action == BINDING_REPLACED:
+            try:
+                self.delete_role_binding(name, namespace)
+            except ResourceNotFoundError:
+                pass
+
+        self.update_role_binding(name, namespace, role_ref, subjects, labels)
+        return action
+
+    def _read_role_binding(self, name: str, namespace: str) -> Optional[client.V1RoleBinding]:
+        """Read a RoleBinding from the index if synced, else from the API."""
+        if self.binding_index is not None and self.binding_index.has_synced:
+            return self.binding_index.get(name, namespace)
         try:
-            return self.create_role_binding(name, namespace, role_ref, subjects, labels)
-        except ResourceAlreadyExistsError:
-            return self.update_role_binding(name, namespace, role_ref, subjects)
+            return self.get_role_binding(name, namespace)
+        except ResourceNotFoundError:
+            return None
 
     # ==================== ClusterRoleBinding Operations ====================
 
@@ -271,17 +414,20 @@ class RBACRepository(BaseRepository):
 
     def update_cluster_role_binding(self, name: str,
                                      role_ref: client.V1RoleRef,
-                                     subjects: List) -> client.V1ClusterRoleBinding:
-        """Update a ClusterRoleBinding."""
+                                     subjects: List,
+                                     labels: Optional[dict] = None) -> client.V1ClusterRoleBinding:
+        """Apply the desired state of a ClusterRoleBinding, creating it if missing."""
         binding = client.V1ClusterRoleBinding(
-            metadata=client.V1ObjectMeta(name=name),
+            api_version=RBAC_API_VERSION,
+            kind="ClusterRoleBinding",
+            metadata=client.V1ObjectMeta(name=name, labels=labels),
             role_ref=role_ref,
             subjects=subjects
         )
-        try:
-            return self._rbac_v1.replace_cluster_role_binding(name=name, body=binding)
-        except ApiException as e:
-            self.handle_api_exception(e, "update", "ClusterRoleBinding", name)
+        return self.server_side_apply(
+            self._rbac_v1.patch_cluster_role_binding, binding,
+            "ClusterRoleBinding", name
+        )
 
     def delete_cluster_role_binding(self, name: str) -> None:
         """Delete a ClusterRoleBinding."""
@@ -295,17 +441,56 @@ class RBACRepository(BaseRepository):
         result = self._rbac_v1.list_cluster_role_binding()
         return result.items
 
+    def iter_cluster_role_bindings(
+        self, label_selector: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> Iterator[client.V1ClusterRoleBinding]:
+        """Stream ClusterRoleBindings page by page.
+
+        Args:
+            label_selector: Optional label selector to filter server-side
+            page_size: Items per page (defaults to LIST_PAGE_SIZE)
+
+        Yields:
+            V1ClusterRoleBinding objects
+        """
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        for page in self.iter_pages(
+            self._rbac_v1.list_cluster_role_binding,
+            page_size or self.LIST_PAGE_SIZE,
+            **kwargs
+        ):
+            yield from page
+
     def create_or_update_cluster_role_binding(
         self, name: str,
         role_ref: client.V1RoleRef,
         subjects: List,
         labels: Optional[dict] = None
-    ) -> client.V1ClusterRoleBinding:
-        """Create or update a ClusterRoleBinding."""
+    ) -> str:
+        """Create or update a ClusterRoleBinding, skipping the write if unchanged.
+
+        Returns:
+            What was done, as for create_or_update_role_binding
+        """
         try:
-            return self.create_cluster_role_binding(name, role_ref, subjects, labels)
-        except ResourceAlreadyExistsError:
-            return self.update_cluster_role_binding(name, role_ref, subjects)
+            actual = self.get_cluster_role_binding(name)
+        except ResourceNotFoundError:
+            actual = None
+
+        action = self._binding_action(actual, role_ref, subjects, labels)
+        record_binding_apply("ClusterRoleBinding", action)
+
+        if action == BINDING_UNCHANGED:
+            return action
+        if action == BINDING_REPLACED:
+            try:
+                self.delete_cluster_role_binding(name)
+            except ResourceNotFoundError:
+                pass
+
+        self.update_cluster_role_binding(name, role_ref, subjects, labels)
+        return action
 
     # ==================== Helper Methods ====================
 
@@ -351,63 +536,87 @@ class RBACRepository(BaseRepository):
             name=name
         )
 
+    @staticmethod
+    def _binding_action(actual, role_ref: client.V1RoleRef, subjects: List,
+                        labels: Optional[dict] = None) -> str:
+        """Decide which write, if any, brings a binding to the desired state.
+
+        Args:
+            actual: The current binding, or None if it doesn't exist
+            role_ref: Desired role reference
+            subjects: Desired subjects
+            labels: Desired labels; extra labels on the binding are ignored
+
+        Returns:
+            One of BINDING_CREATED, BINDING_REPLACED, BINDING_PATCHED or
+            BINDING_UNCHANGED
+        """
+        if actual is None:
+            return BINDING_CREATED
+        if _role_ref_key(actual.role_ref) != _role_ref_key(role_ref):
+            return BINDING_REPLACED
+
+        actual_labels = actual.metadata.labels or {}
+        labels_match = all(actual_labels.get(k) == v for k, v in (labels or {}).items())
+        if _subject_keys(actual.subjects) != _subject_keys(subjects) or not labels_match:
+            return BINDING_PATCHED
+        return BINDING_UNCHANGED
+
+    @staticmethod
+    def _has_subject(binding, subject_name: str, subject_kind: str) -> bool:
+        """Check whether a binding references the given subject."""
+        return any(
+            subject.name == subject_name and subject.kind == subject_kind
+            for subject in (binding.subjects or [])
+        )
+
     def find_bindings_for_subject(self, subject_name: str, subject_kind: str,
-                                   namespace: Optional[str] = None) -> List[client.V1RoleBinding]:
+                                   namespace: Optional[str] = None,
+                                   label_selector: Optional[str] = None) -> List[client.V1RoleBinding]:
         """Find all RoleBindings for a given subject across namespaces.
 
         Args:
             subject_name: Name of the subject
             subject_kind: Kind of subject (ServiceAccount, Group, User)
             namespace: If provided, only search this namespace
+            label_selector: Optional label selector applied server-side
 
         Returns:
             List of matching RoleBindings
         """
-        matching = []
+        if self.binding_index is not None and self.binding_index.has_synced:
+            return [
+                binding for binding in self.binding_index.find_by_subject(
+                    subject_kind, subject_name, namespace
+                )
+                if selector_matches(label_selector, binding.metadata.labels)
+            ]
 
         if namespace:
-            bindings = self.list_role_bindings(namespace)
-            for binding in bindings:
-                if binding.subjects:
-                    for subject in binding.subjects:
-                        if subject.name == subject_name and subject.kind == subject_kind:
-                            matching.append(binding)
-                            break
+            bindings = self.list_role_bindings(namespace, label_selector)
         else:
-            # List from all namespaces
-            core_v1 = client.CoreV1Api(self.api_client)
-            namespaces = core_v1.list_namespace().items
-            for ns in namespaces:
-                bindings = self.list_role_bindings(ns.metadata.name)
-                for binding in bindings:
-                    if binding.subjects:
-                        for subject in binding.subjects:
-                            if subject.name == subject_name and subject.kind == subject_kind:
-                                matching.append(binding)
-                                break
-
-        return matching
+            bindings = self.iter_role_bindings(label_selector)
+
+        return [
+            binding for binding in bindings
+            if self._has_subject(binding, subject_name, subject_kind)
+        ]
 
     def find_cluster_role_bindings_for_subject(
-        self, subject_name: str, subject_kind: str
+        self, subject_name: str, subject_kind: str,
+        label_selector: Optional[str] = None
     ) -> List[client.V1ClusterRoleBinding]:
         """Find all ClusterRoleBindings for a given subject.
 
         Args:
             subject_name: Name of the subject
             subject_kind: Kind of subject (ServiceAccount, Group, User)
+            label_selector: Optional label selector applied server-side
 
         Returns:
             List of matching ClusterRoleBindings
         """
-        matching = []
-        bindings = self.list_cluster_role_bindings()
-
-        for binding in bindings:
-            if binding.subjects:
-                for subject in binding.subjects:
-                    if subject.name == subject_name and subject.kind == subject_kind:
-                        matching.append(binding)
-                        break
-
-        return matching
+        return [
+            binding for binding in self.iter_cluster_role_bindings(label_selector)
+            if self._has_subject(binding, subject_name, subject_kind)
+        ]
@@ -22,7 +22,7 @@ class ResourceQuotaRepository(BaseRepository):
             core_api: Optional Kubernetes CoreV1Api client
         """
         super().__init__()
-        self.core_api = core_api or client.CoreV1Api()
+        self.core_api = self.instrument(core_api or client.CoreV1Api())
 
     def get(self, name: str, namespace: str) -> client.V1ResourceQuota:
         """Get a ResourceQuota by name.
@@ -173,7 +173,10 @@ class ResourceQuotaRepository(BaseRepository):
         hard: Dict[str, str],
         labels: Optional[Dict[str, str]] = None
     ) -> client.V1ResourceQuota:
-        """Ensure a ResourceQuota exists, creating or updating as needed.
+        """Ensure a ResourceQuota exists with the given limits.
+
+        Uses a single server-side apply instead of an existence check
+        followed by a create or a read-modify-replace.
 
         Args:
             name: The ResourceQuota name
@@ -184,6 +187,19 @@ class ResourceQuotaRepository(BaseRepository):
         Returns:
             The ResourceQuota object
         """
-        if self.exists(name, namespace):
-            return self.update(name, namespace, hard)
-        return self.create(name, namespace, hard, labels)
+        quota = client.V1ResourceQuota(
+            api_version="v1",
+            kind="ResourceQuota",
+            metadata=client.V1ObjectMeta(
+                name=name,
+                namespace=namespace,
+                labels=labels or None
+            ),
+            spec=client.V1ResourceQuotaSpec(hard=hard)
+        )
+        result = self.server_side_apply(
+            self.core_api.patch_namespaced_resource_quota, quota,
+            "ResourceQuota", name, namespace
+        )
+        logger.info(f"Applied ResourceQuota '{name}' in namespace '{namespace}'")
+        return result
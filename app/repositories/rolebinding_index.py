@@ -0,0 +1,122 @@
+"""Subject index over a watch-fed RoleBinding cache.
+
+Looking up the RoleBindings of a subject through the API requires listing
+every namespace. This module keeps all RoleBindings in memory and indexes
+them by (subject kind, subject name) so lookups need no API calls at all.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from kubernetes import client
+
+from app.repositories.informer import Informer, ObjectKey, object_key
+
+logger = logging.getLogger(__name__)
+
+SubjectKey = Tuple[str, str]
+
+
+def _subject_keys(binding: Any) -> Set[SubjectKey]:
+    """Get the (kind, name) keys of all subjects of a binding."""
+    return {
+        (subject.kind, subject.name)
+        for subject in (binding.subjects or [])
+    }
+
+
+class RoleBindingIndex:
+    """In-memory RoleBinding cache indexed by subject."""
+
+    def __init__(self, rbac_api: client.RbacAuthorizationV1Api,
+                 label_selector: Optional[str] = None):
+        """Initialize the index.
+
+        Args:
+            rbac_api: RBAC API client used for LIST and WATCH
+            label_selector: Optional label selector restricting cached bindings
+        """
+        self._informer = Informer(
+            rbac_api.list_role_binding_for_all_namespaces,
+            name="rolebindings",
+            label_selector=label_selector,
+        )
+        self._lock = threading.RLock()
+        self._by_subject: Dict[SubjectKey, Dict[ObjectKey, Any]] = defaultdict(dict)
+
+        self._informer.add_event_handler(self._on_event)
+        self._informer.add_relist_handler(self._on_relist)
+
+    def start(self) -> None:
+        """Start watching RoleBindings."""
+        self._informer.start()
+
+    def stop(self) -> None:
+        """Stop watching RoleBindings."""
+        self._informer.stop()
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the index holds a complete view of the cluster."""
+        return self._informer.has_synced
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial LIST has completed."""
+        return self._informer.wait_for_sync(timeout)
+
+    def get(self, name: str, namespace: str) -> Optional[client.V1RoleBinding]:
+        """Get a cached RoleBinding by name and namespace."""
+        return self._informer.get(namespace, name)
+
+    def find_by_subject(self, subject_kind: str, subject_name: str,
+                        namespace: Optional[str] = None) -> List[client.V1RoleBinding]:
+        """Find cached RoleBindings referencing a subject.
+
+        Args:
+            subject_kind: Kind of subject (ServiceAccount, Group, User)
+            subject_name: Name of the subject
+            namespace: If provided, only return bindings in this namespace
+
+        Returns:
+            List of matching RoleBindings
+        """
+        with self._lock:
+            bindings = list(self._by_subject.get((subject_kind, subject_name), {}).values())
+
+        if namespace:
+            bindings = [b for b in bindings if b.metadata.namespace == namespace]
+        return bindings
+
+    # ==================== Informer Callbacks ====================
+
+    def _on_event(self, event_type: str, binding: Any, old: Optional[Any]) -> None:
+        """Keep the subject index in line with a single watch event."""
+        key = object_key(binding)
+        with self._lock:
+            if old is not None:
+                self._remove(key, old)
+            if event_type != "DELETED":
+                self._add(key, binding)
+
+    def _on_relist(self, bindings: List[Any]) -> None:
+        """Rebuild the subject index from a full LIST."""
+        with self._lock:
+            self._by_subject = defaultdict(dict)
+            for binding in bindings:
+                self._add(object_key(binding), binding)
+        logger.info(f"RoleBinding index rebuilt with {len(bindings)} bindings")
+
+    def _add(self, key: ObjectKey, binding: Any) -> None:
+        for subject_key in _subject_keys(binding):
+            self._by_subject[subject_key][key] = binding
+
+    def _remove(self, key: ObjectKey, binding: Any) -> None:
+        for subject_key in _subject_keys(binding):
+            entries = self._by_subject.get(subject_key)
+            if entries is None:
+                continue
+            entries.pop(key, None)
+            if not entries:
+                del self._by_subject[subject_key]
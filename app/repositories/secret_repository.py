@@ -1,20 +1,22 @@
 """Secret repository for Kubernetes secret operations."""
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-from kubernetes import client
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
 
 from app.repositories.base import BaseRepository
 # Exceptions are handled by base class
 
+KUBECONFIG_TYPE_LABEL = "k8s-iam-operator/type"
+
 
 class SecretRepository(BaseRepository):
     """Repository for Kubernetes Secret operations."""
 
     def __init__(self, api_client: Optional[client.ApiClient] = None):
         super().__init__(api_client)
-        self._core_v1 = client.CoreV1Api(self.api_client)
+        self._core_v1 = self.instrument(client.CoreV1Api(self.api_client))
 
     def get(self, name: str, namespace: str) -> client.V1Secret:
         """Get a secret by name and namespace.
@@ -94,13 +96,15 @@ class SecretRepository(BaseRepository):
             self.handle_api_exception(e, "create", "Secret", name, namespace)
 
     def create_service_account_token(self, sa_name: str, namespace: str,
-                                      token_name: Optional[str] = None) -> client.V1Secret:
+                                      token_name: Optional[str] = None,
+                                      labels: Optional[dict] = None) -> client.V1Secret:
         """Create a service account token secret.
 
         Args:
             sa_name: The service account name
             namespace: The namespace
             token_name: Optional custom name for the token secret
+            labels: Optional labels to apply
 
         Returns:
             The created V1Secret object
@@ -112,6 +116,7 @@ class SecretRepository(BaseRepository):
         name = token_name or f"{sa_name}-token"
         metadata = client.V1ObjectMeta(
             name=name,
+            labels=labels or {},
             annotations={"kubernetes.io/service-account.name": sa_name}
         )
         secret = client.V1Secret(
@@ -127,15 +132,18 @@ class SecretRepository(BaseRepository):
             self.handle_api_exception(e, "create", "Secret", name, namespace)
 
     def ensure_service_account_token(self, sa_name: str, namespace: str,
-                                      token_name: Optional[str] = None) -> client.V1Secret:
+                                      token_name: Optional[str] = None,
+                                      labels: Optional[dict] = None) -> client.V1Secret:
         """Ensure a service account token secret exists.
 
-        Creates the secret if it doesn't exist, returns existing if it does.
+        Uses a single server-side apply. The token data filled in by the
+        token controller is owned by another field manager and is kept.
 
         Args:
             sa_name: The service account name
             namespace: The namespace
             token_name: Optional custom name for the token secret
+            labels: Optional labels owned by the operator
 
         Returns:
             The V1Secret object (existing or newly created)
@@ -144,22 +152,76 @@ class SecretRepository(BaseRepository):
             KubernetesAPIError: For API errors
         """
         name = token_name or f"{sa_name}-token"
+        secret = client.V1Secret(
+            api_version="v1",
+            kind="Secret",
+            metadata=client.V1ObjectMeta(
+                name=name,
+                namespace=namespace,
+                labels=labels or None,
+                annotations={"kubernetes.io/service-account.name": sa_name}
+            ),
+            type="kubernetes.io/service-account-token"
+        )
+        return self.server_side_apply(
+            self._core_v1.patch_namespaced_secret, secret, "Secret", name, namespace
+        )
+
+    def wait_for_token(self, name: str, namespace: str,
+                       timeout_seconds: int = 10) -> Optional[str]:
+        """Wait for the token controller to populate a token secret.
 
-        # Check if it already exists
-        if self.exists(name, namespace):
-            return self.get(name, namespace)
+        Reads the secret once and, if the token is still missing, watches
+        only that secret from the read's resourceVersion until the token
+        appears or the timeout expires.
+
+        Args:
+            name: The token secret name
+            namespace: The namespace
+            timeout_seconds: Maximum time to wait
 
-        # Create if it doesn't exist
-        return self.create_service_account_token(sa_name, namespace, token_name)
+        Returns:
+            The base64 encoded token, or None if it didn't appear in time
+
+        Raises:
+            ResourceNotFoundError: If the secret doesn't exist
+            KubernetesAPIError: For other API errors
+        """
+        secret = self.get(name, namespace)
+        token = (secret.data or {}).get("token")
+        if token or timeout_seconds <= 0:
+            return token
+
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self._core_v1.list_namespaced_secret,
+                namespace=namespace,
+                field_selector=f"metadata.name={name}",
+                resource_version=secret.metadata.resource_version,
+                timeout_seconds=timeout_seconds
+            ):
+                if event["type"] == "DELETED":
+                    break
+                token = (event["object"].data or {}).get("token")
+                if token:
+                    break
+        except ApiException as e:
+            self.handle_api_exception(e, "watch", "Secret", name, namespace)
+        finally:
+            w.stop()
+        return token
 
     def create_kubeconfig_secret(self, name: str, namespace: str,
-                                  kubeconfig_data: str) -> client.V1Secret:
+                                  kubeconfig_data: str,
+                                  labels: Optional[dict] = None) -> client.V1Secret:
         """Create a kubeconfig secret.
 
         Args:
             name: The secret name
             namespace: The namespace
             kubeconfig_data: Base64 encoded kubeconfig data
+            labels: Optional labels merged with the kubeconfig type label
 
         Returns:
             The created V1Secret object
@@ -173,19 +235,24 @@ class SecretRepository(BaseRepository):
             namespace=namespace,
             data={"kubeconfig": kubeconfig_data},
             secret_type="Opaque",
-            labels={"k8s-iam-operator/type": "kubeconfig"}
+            labels=self._kubeconfig_labels(labels)
         )
 
     def ensure_kubeconfig_secret(self, name: str, namespace: str,
-                                  kubeconfig_data: str) -> client.V1Secret:
-        """Ensure a kubeconfig secret exists, updating if necessary.
+                                  kubeconfig_data: str,
+                                  labels: Optional[dict] = None,
+                                  annotations: Optional[dict] = None) -> client.V1Secret:
+        """Ensure a kubeconfig secret exists with the given data.
 
-        Creates the secret if it doesn't exist, updates if it does.
+        Uses a single server-side apply instead of an existence check
+        followed by a create or update.
 
         Args:
             name: The secret name
             namespace: The namespace
             kubeconfig_data: Base64 encoded kubeconfig data
+            labels: Optional labels merged with the kubeconfig type label
+            annotations: Optional annotations owned by the operator
 
         Returns:
             The V1Secret object (existing or newly created)
@@ -193,16 +260,44 @@ class SecretRepository(BaseRepository):
         Raises:
             KubernetesAPIError: For API errors
         """
-        if self.exists(name, namespace):
-            # Update the kubeconfig data
-            return self.update(
+        secret = client.V1Secret(
+            api_version="v1",
+            kind="Secret",
+            metadata=client.V1ObjectMeta(
                 name=name,
                 namespace=namespace,
-                data={"kubeconfig": kubeconfig_data}
-            )
+                labels=self._kubeconfig_labels(labels),
+                annotations=annotations
+            ),
+            data={"kubeconfig": kubeconfig_data},
+            type="Opaque"
+        )
+        return self.server_side_apply(
+            self._core_v1.patch_namespaced_secret, secret, "Secret", name, namespace
+        )
+
+    def iter_kubeconfig_secrets(self, page_size: int = 500) -> Iterator[client.V1Secret]:
+        """Iterate over all kubeconfig secrets in the cluster.
 
-        # Create if it doesn't exist
-        return self.create_kubeconfig_secret(name, namespace, kubeconfig_data)
+        Args:
+            page_size: Maximum number of secrets per LIST page
+
+        Yields:
+            V1Secret objects
+        """
+        for page in self.iter_pages(
+            self._core_v1.list_secret_for_all_namespaces,
+            page_size,
+            label_selector=f"{KUBECONFIG_TYPE_LABEL}=kubeconfig"
+        ):
+            yield from page
+
+    @staticmethod
+    def _kubeconfig_labels(labels: Optional[dict] = None) -> dict:
+        """Get the labels for a kubeconfig secret."""
+        merged = dict(labels or {})
+        merged[KUBECONFIG_TYPE_LABEL] = "kubeconfig"
+        return merged
 
     def update(self, name: str, namespace: str,
                data: Optional[Dict[str, str]] = None,
@@ -6,7 +6,6 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from app.repositories.base import BaseRepository
-from app.exceptions import ResourceNotFoundError
 
 
 class ServiceAccountRepository(BaseRepository):
@@ -14,7 +13,7 @@ class ServiceAccountRepository(BaseRepository):
 
     def __init__(self, api_client: Optional[client.ApiClient] = None):
         super().__init__(api_client)
-        self._core_v1 = client.CoreV1Api(self.api_client)
+        self._core_v1 = self.instrument(client.CoreV1Api(self.api_client))
 
     def get(self, name: str, namespace: str) -> client.V1ServiceAccount:
         """Get a service account by name and namespace.
@@ -149,6 +148,39 @@ class ServiceAccountRepository(BaseRepository):
         except ApiException as e:
             self.handle_api_exception(e, "delete", "ServiceAccount", name, namespace)
 
+    def create_token(self, name: str, namespace: str,
+                     expiration_seconds: int) -> client.V1TokenRequestStatus:
+        """Request a bound token for a service account.
+
+        Uses the TokenRequest API, which returns the token synchronously
+        instead of waiting for the token controller to fill a Secret.
+
+        Args:
+            name: The service account name
+            namespace: The namespace
+            expiration_seconds: Requested token lifetime
+
+        Returns:
+            The token request status holding the token and its expiry
+
+        Raises:
+            ResourceNotFoundError: If service account doesn't exist
+            KubernetesAPIError: For other API errors
+        """
+        token_request = client.AuthenticationV1TokenRequest(
+            spec=client.V1TokenRequestSpec(
+                audiences=[],
+                expiration_seconds=expiration_seconds
+            )
+        )
+        try:
+            result = self._core_v1.create_namespaced_service_account_token(
+                name=name, namespace=namespace, body=token_request
+            )
+        except ApiException as e:
+            self.handle_api_exception(e, "create token", "ServiceAccount", name, namespace)
+        return result.status
+
     def list_in_namespace(self, namespace: str) -> List[client.V1ServiceAccount]:
         """List all service accounts in a namespace.
 
@@ -165,24 +197,34 @@ class ServiceAccountRepository(BaseRepository):
                       labels: Optional[dict] = None,
                       annotations: Optional[dict] = None,
                       automount_token: bool = True) -> client.V1ServiceAccount:
-        """Ensure a service account exists, creating it if necessary.
+        """Ensure a service account exists with the given desired state.
+
+        Uses a single server-side apply instead of a get followed by a
+        create. The apply is not forced, so fields of an existing service
+        account that other field managers set keep their values.
 
         Args:
             name: The service account name
             namespace: The namespace
-            labels: Optional labels to apply (only on create)
-            annotations: Optional annotations to apply (only on create)
+            labels: Optional labels owned by the operator
+            annotations: Optional annotations owned by the operator
             automount_token: Whether to automount the service account token
 
         Returns:
-            The V1ServiceAccount object (existing or newly created)
+            The applied V1ServiceAccount object
         """
-        try:
-            return self.get(name, namespace)
-        except ResourceNotFoundError:
-            return self.create(
-                name, namespace,
-                labels=labels,
-                annotations=annotations,
-                automount_token=automount_token
-            )
+        metadata = {"name": name, "namespace": namespace}
+        if labels:
+            metadata["labels"] = dict(labels)
+        if annotations:
+            metadata["annotations"] = dict(annotations)
+        sa = {
+            "apiVersion": "v1",
+            "kind": "ServiceAccount",
+            "metadata": metadata,
+            "automountServiceAccountToken": automount_token,
+        }
+        return self.server_side_apply_shared(
+            self._core_v1.patch_namespaced_service_account, sa,
+            "ServiceAccount", name, namespace
+        )
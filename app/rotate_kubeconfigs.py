@@ -0,0 +1,85 @@
+"""Command line entry point for bulk kubeconfig rotation.
+
+Regenerates the kubeconfig Secrets of all human users, for example after
+a cluster CA rotation or an API endpoint change:
+
+    k8s-iam-rotate-kubeconfigs --checkpoint /tmp/rotation.ckpt --rate 20
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from kubernetes import client
+
+from app.container import get_container
+from app.repositories import BaseRepository
+from app.services.kubeconfig_rotation import KubeconfigRotator, RotationCheckpoint
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Regenerate the kubeconfig Secrets of all human users."
+    )
+    parser.add_argument("--checkpoint", default=".kubeconfig-rotation.ckpt",
+                        help="File recording completed users, used to resume")
+    parser.add_argument("--reset", action="store_true",
+                        help="Ignore and remove an existing checkpoint")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Maximum number of users rotated at once")
+    parser.add_argument("--rate", type=float, default=20.0,
+                        help="Sustained rotations per second (0 for no limit)")
+    parser.add_argument("--page-size", type=int, default=100,
+                        help="Users fetched per LIST page")
+    parser.add_argument("--force", action="store_true",
+                        help="Rewrite secrets even if their content is unchanged")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a kubeconfig rotation.
+
+    Returns:
+        Exit code: 0 on success, 1 if any user failed
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+    )
+    args = parse_args(argv)
+
+    checkpoint = RotationCheckpoint(args.checkpoint)
+    if args.reset:
+        checkpoint.clear()
+
+    container = get_container()
+    try:
+        rotator = KubeconfigRotator(
+            kubeconfig_service=container.kubeconfig_service,
+            custom_api=client.CustomObjectsApi(BaseRepository().api_client),
+            checkpoint=checkpoint,
+            max_concurrency=args.concurrency,
+            rate_per_second=args.rate,
+            page_size=args.page_size,
+        )
+        progress = rotator.rotate(force=args.force)
+    finally:
+        # Flush queued audit events and stop informer threads before exiting
+        container.shutdown()
+
+    for key, error in sorted(progress.failures.items()):
+        logger.error(f"{key}: {error}")
+    if progress.failed:
+        logger.error(
+            f"{progress.failed} user(s) failed; rerun with the same checkpoint to retry them"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,8 @@ from app.services.group_service import GroupService
 from app.services.role_service import RoleService
 from app.services.rbac_service import RBACService
 from app.services.kubeconfig_service import KubeconfigService
+from app.services.kubeconfig_rotation import KubeconfigRotator, RotationCheckpoint
+from app.services.token_refresher import TokenRefresher
 
 __all__ = [
     "UserService",
@@ -16,4 +18,7 @@ __all__ = [
     "RoleService",
     "RBACService",
     "KubeconfigService",
+    "KubeconfigRotator",
+    "RotationCheckpoint",
+    "TokenRefresher",
 ]
@@ -6,12 +6,14 @@ from typing import Optional
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from app.api.metrics import record_group_created, record_group_deleted
 from app.models.group import Group
 from app.config import Config
 from app.services.rbac_service import RBACService
 from app.validators import validate_group_name, validate_group_spec
 # Exceptions used for documentation
 from app.utils.audit import AuditLogger
+from app.utils.instrumentation import phase
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +49,16 @@ class GroupService:
         group = Group.from_dict(body)
 
         # Validate inputs
-        validate_group_name(group.name)
-        validate_group_spec(spec)
+        with phase("validate"):
+            validate_group_name(group.name)
+            validate_group_spec(spec, body.get("metadata"))
 
         logger.info(f"Creating group '{group.name}' in namespace '{namespace}'")
 
         # Create all role bindings for the group
-        self.rbac_service.create_group_role_bindings(group)
+        with phase("rbac"):
+            self.rbac_service.create_group_role_bindings(group)
+        record_group_created(namespace)
 
         if self.audit:
             self.audit.log_create(
@@ -85,13 +90,15 @@ class GroupService:
         group = Group.from_dict(body)
 
         # Validate inputs
-        validate_group_name(group.name)
-        validate_group_spec(spec)
+        with phase("validate"):
+            validate_group_name(group.name)
+            validate_group_spec(spec, body.get("metadata"))
 
         logger.info(f"Updating group '{group.name}' in namespace '{namespace}'")
 
         # Update role bindings (removes stale ones, creates new ones)
-        self.rbac_service.update_group_role_bindings(group)
+        with phase("rbac"):
+            self.rbac_service.update_group_role_bindings(group)
 
         if self.audit:
             self.audit.log_update(
@@ -124,11 +131,14 @@ class GroupService:
         logger.info(f"Deleting group '{group.name}' from namespace '{namespace}'")
 
         # Delete all role bindings for the group
-        self.rbac_service.delete_group_role_bindings(group)
+        with phase("rbac"):
+            self.rbac_service.delete_group_role_bindings(group)
 
         # Delete the custom resource itself
         self._delete_custom_resource(group)
 
+        record_group_deleted(namespace)
+
         if self.audit:
             self.audit.log_delete(
                 resource_type="Group",
@@ -0,0 +1,242 @@
+"""Bulk kubeconfig rotation for human users.
+
+After a CA rotation or an API endpoint change every human user needs a new
+kubeconfig. This module streams all User resources page by page and
+regenerates only their kubeconfig Secrets, at bounded concurrency and
+behind a token-bucket rate limit. Completed users are recorded in a
+checkpoint file so an interrupted run resumes where it stopped.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+from kubernetes import client
+
+from app.config import Config
+from app.models.user import User
+from app.repositories.base import BaseRepository
+from app.services.kubeconfig_service import KubeconfigService
+from app.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RotationProgress:
+    """Running totals of a rotation."""
+
+    seen: int = 0
+    rotated: int = 0
+    resumed: int = 0
+    failed: int = 0
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def done(self) -> int:
+        """Number of users finished, successfully or not."""
+        return self.rotated + self.resumed + self.failed
+
+
+ProgressCallback = Callable[[RotationProgress], None]
+
+
+class RotationCheckpoint:
+    """Append-only file of users whose kubeconfig has been rotated.
+
+    Each line holds one "namespace/name" key. Appending keeps every write
+    O(1) and a crash loses at most the line being written.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the checkpoint.
+
+        Args:
+            path: Path of the checkpoint file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Set[str]:
+        """Get the keys of users completed by previous runs."""
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, "r") as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def mark_done(self, key: str) -> None:
+        """Record a user as completed."""
+        with self._lock, open(self.path, "a") as f:
+            f.write(f"{key}\n")
+
+    def clear(self) -> None:
+        """Remove the checkpoint so the next run starts from scratch."""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def iter_users(custom_api: client.CustomObjectsApi,
+               page_size: int = 100) -> Iterator[dict]:
+    """Iterate over all User resources one page at a time.
+
+    If the continue token expires during a long rotation, the list starts
+    over and Users already yielded are yielded again.
+
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        page_size: Maximum number of Users per page
+
+    Yields:
+        User bodies
+    """
+    for page in BaseRepository.iter_pages(
+        custom_api.list_cluster_custom_object,
+        page_size,
+        group=Config.GROUP,
+        version=Config.VERSION,
+        plural=Config.PLURAL,
+    ):
+        yield from page
+
+
+class KubeconfigRotator:
+    """Regenerates the kubeconfig Secrets of all human users."""
+
+    def __init__(
+        self,
+        kubeconfig_service: KubeconfigService,
+        custom_api: client.CustomObjectsApi,
+        checkpoint: Optional[RotationCheckpoint] = None,
+        max_concurrency: int = 10,
+        rate_per_second: float = 20.0,
+        page_size: int = 100,
+        progress_interval: int = 100
+    ):
+        """Initialize the rotator.
+
+        Args:
+            kubeconfig_service: Service generating and writing kubeconfigs
+            custom_api: Client used to list User resources
+            checkpoint: Optional checkpoint for resuming interrupted runs
+            max_concurrency: Maximum number of users rotated at once
+            rate_per_second: Sustained rotations per second (0 for no limit)
+            page_size: Users fetched per LIST page
+            progress_interval: Log progress every this many users
+        """
+        self.kubeconfig_service = kubeconfig_service
+        self.custom_api = custom_api
+        self.checkpoint = checkpoint
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(rate_per_second)
+        self.page_size = page_size
+        self.progress_interval = max(1, progress_interval)
+
+    def rotate(self, force: bool = False,
+               on_progress: Optional[ProgressCallback] = None) -> RotationProgress:
+        """Rotate the kubeconfig of every human user.
+
+        Args:
+            force: Rewrite secrets even if their content hash is unchanged
+            on_progress: Optional callback invoked after each user
+
+        Returns:
+            The final progress totals
+        """
+        progress = RotationProgress()
+        lock = threading.Lock()
+        completed = self.checkpoint.load() if self.checkpoint else set()
+        if completed:
+            logger.info(f"Resuming kubeconfig rotation, {len(completed)} user(s) already done")
+
+        # Pick up a rotated CA or endpoint instead of a cached one
+        if self.kubeconfig_service.cluster_identity is not None:
+            self.kubeconfig_service.cluster_identity.invalidate()
+
+        def finish(key: str, error: Optional[Exception] = None, resumed: bool = False) -> None:
+            with lock:
+                self._record(progress, key, error, resumed)
+                if on_progress:
+                    on_progress(progress)
+
+        in_flight: Set[Future] = set()
+        listed: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix="rotate") as pool:
+            for key, user, error in self._iter_human_users():
+                # A list restarted after its continue token expired repeats users
+                if key in listed:
+                    continue
+                listed.add(key)
+                with lock:
+                    progress.seen += 1
+                if error is not None:
+                    finish(key, error=error)
+                    continue
+                if key in completed:
+                    finish(key, resumed=True)
+                    continue
+
+                # Keep at most max_concurrency users queued so the stream stays lazy
+                if len(in_flight) >= self.max_concurrency:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.add(pool.submit(self._rotate_one, key, user, force, finish))
+
+        logger.info(
+            f"Kubeconfig rotation finished: {progress.rotated} rotated, "
+            f"{progress.resumed} resumed, {progress.failed} failed"
+        )
+        if self.checkpoint and progress.failed == 0:
+            self.checkpoint.clear()
+        return progress
+
+    def _iter_human_users(self) -> Iterator[Tuple[str, Optional[User], Optional[Exception]]]:
+        """Stream (key, User, error) tuples of all human users.
+
+        A User that can't be parsed is yielded with the error instead of
+        a User, so it counts as failed without ending the stream.
+        """
+        for body in iter_users(self.custom_api, self.page_size):
+            try:
+                user = User.from_dict(body)
+            except Exception as e:
+                metadata = body.get("metadata") or {}
+                key = f"{metadata.get('namespace')}/{metadata.get('name')}"
+                logger.error(f"Failed to read User '{key}' for kubeconfig rotation: {e}")
+                yield key, None, e
+                continue
+            if user.spec.is_human:
+                yield f"{user.namespace}/{user.name}", user, None
+
+    def _rotate_one(self, key: str, user: User, force: bool,
+                    finish: Callable[..., None]) -> None:
+        """Rotate a single user's kubeconfig, honouring the rate limit."""
+        self.bucket.acquire()
+        try:
+            self.kubeconfig_service.create_kubeconfig_secret(user, force=force)
+        except Exception as e:
+            logger.error(f"Failed to rotate kubeconfig for '{key}': {e}")
+            finish(key, error=e)
+            return
+        if self.checkpoint:
+            self.checkpoint.mark_done(key)
+        finish(key)
+
+    def _record(self, progress: RotationProgress, key: str,
+                error: Optional[Exception], resumed: bool) -> None:
+        """Update the totals for a finished user and log periodic progress."""
+        if resumed:
+            progress.resumed += 1
+        elif error is not None:
+            progress.failed += 1
+            progress.failures[key] = str(error)
+        else:
+            progress.rotated += 1
+        if progress.done % self.progress_interval == 0:
+            logger.info(
+                f"Kubeconfig rotation: {progress.done}/{progress.seen} done, "
+                f"{progress.failed} failed"
+            )
@@ -1,17 +1,47 @@
 """Kubeconfig service for generating user kubeconfig files."""
 
 import base64
+import hashlib
 import json
 import logging
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 
+from app.api.metrics import record_kubeconfig_generated, record_kubeconfig_write_skipped
 from app.models.user import User
 from app.repositories.secret_repository import SecretRepository
+from app.repositories.serviceaccount_repository import ServiceAccountRepository
+from app.repositories.cluster_identity import (
+    ClusterIdentity,
+    ClusterIdentityCache,
+    read_cluster_identity,
+)
 from app.exceptions import KubeconfigGenerationError, ResourceNotFoundError
 from app.utils.audit import AuditLogger
 
 logger = logging.getLogger(__name__)
 
+# Annotation recording the hash of the kubeconfig stored in the secret
+KUBECONFIG_HASH_ANNOTATION = "k8sio.auth/kubeconfig-hash"
+
+# Annotations recording the bound token issue time, expiry and the cluster it targets
+TOKEN_ISSUED_ANNOTATION = "k8sio.auth/token-issued-at"
+TOKEN_EXPIRES_ANNOTATION = "k8sio.auth/token-expires-at"
+CLUSTER_HASH_ANNOTATION = "k8sio.auth/cluster-hash"
+
+# Bound tokens are renewed once less than this share of their lifetime remains
+TOKEN_REFRESH_FRACTION = 0.2
+
+
+def kubeconfig_hash(kubeconfig: str) -> str:
+    """Get the content hash stamped on a kubeconfig secret."""
+    return hashlib.sha256(kubeconfig.encode('utf-8')).hexdigest()
+
+
+def cluster_hash(identity: ClusterIdentity) -> str:
+    """Get the hash of the cluster identity embedded in a kubeconfig."""
+    return hashlib.sha256(f"{identity.server}\n{identity.ca_data}".encode('utf-8')).hexdigest()
+
 
 class KubeconfigService:
     """Service for generating and managing kubeconfig secrets."""
@@ -19,22 +49,53 @@ class KubeconfigService:
     def __init__(
         self,
         secret_repo: SecretRepository,
-        audit_logger: Optional[AuditLogger] = None
+        audit_logger: Optional[AuditLogger] = None,
+        cluster_identity: Optional[ClusterIdentityCache] = None,
+        sa_repo: Optional[ServiceAccountRepository] = None,
+        token_expiration_seconds: int = 86400,
+        token_wait_seconds: int = 10
     ):
         """Initialize the service with required repositories.
 
         Args:
             secret_repo: Repository for secret operations
             audit_logger: Optional audit logger for tracking changes
+            cluster_identity: Optional cache of the cluster CA and server URL.
+                              If not provided, they are read on every call.
+            sa_repo: Optional service account repository. If provided, tokens
+                     are requested through the TokenRequest API instead of
+                     being read from a service-account-token Secret.
+            token_expiration_seconds: Lifetime of TokenRequest tokens
+            token_wait_seconds: How long to wait for the token controller to
+                                populate a new token secret
         """
         self.secret_repo = secret_repo
         self.audit = audit_logger
+        self.cluster_identity = cluster_identity
+        self.sa_repo = sa_repo
+        self.token_expiration_seconds = token_expiration_seconds
+        self.token_wait_seconds = token_wait_seconds
 
-    def generate_kubeconfig(self, user: User) -> str:
+    @property
+    def uses_token_request(self) -> bool:
+        """Whether tokens come from the TokenRequest API."""
+        return self.sa_repo is not None
+
+    def _get_cluster_identity(self) -> ClusterIdentity:
+        """Get the cluster CA and server URL, from the cache if enabled."""
+        if self.cluster_identity is not None:
+            return self.cluster_identity.get()
+        return read_cluster_identity(self.secret_repo)
+
+    def generate_kubeconfig(self, user: User, token: Optional[str] = None,
+                            identity: Optional[ClusterIdentity] = None) -> str:
         """Generate a kubeconfig for the given user.
 
         Args:
             user: The User object
+            token: Optional bearer token; read from the user's token secret
+                   if not provided
+            identity: Optional cluster identity; looked up if not provided
 
         Returns:
             The kubeconfig as a JSON string
@@ -43,44 +104,26 @@ class KubeconfigService:
             KubeconfigGenerationError: If generation fails
         """
         try:
-            # Get the service account token
-            token_secret = self.secret_repo.get(
-                name=user.token_secret_name,
-                namespace=user.namespace
-            )
-            token = token_secret.data.get("token")
-            if not token:
-                raise KubeconfigGenerationError(
-                    user.name,
-                    f"Token secret '{user.token_secret_name}' has no token data"
-                )
+            if token is None:
+                token = self._read_secret_token(user)
 
-            # Get cluster CA certificate
-            ca_configmap = self.secret_repo.get_configmap(
-                name='kube-root-ca.crt',
-                namespace='kube-system'
-            )
-            cluster_ca = ca_configmap.data.get('ca.crt')
-            if not cluster_ca:
+            # Get cluster CA certificate and URL
+            if identity is None:
+                identity = self._get_cluster_identity()
+            if not identity.ca_data:
                 raise KubeconfigGenerationError(
                     user.name,
                     "Could not retrieve cluster CA certificate"
                 )
 
-            # Get cluster URL from API client configuration
-            api_client = self.secret_repo.api_client
-            cluster_url = api_client.configuration.host
-
             # Build kubeconfig structure
             kubeconfig = {
                 'apiVersion': 'v1',
                 'kind': 'Config',
                 'clusters': [{
                     'cluster': {
-                        'server': cluster_url,
-                        'certificate-authority-data': base64.b64encode(
-                            cluster_ca.encode('utf-8')
-                        ).decode('utf-8'),
+                        'server': identity.server,
+                        'certificate-authority-data': identity.ca_data,
                     },
                     'name': 'cluster',
                 }],
@@ -95,7 +138,7 @@ class KubeconfigService:
                 'users': [{
                     'name': user.name,
                     'user': {
-                        'token': base64.b64decode(token).decode('utf-8'),
+                        'token': token,
                     },
                 }],
             }
@@ -113,7 +156,26 @@ class KubeconfigService:
                 f"Failed to generate kubeconfig: {str(e)}"
             )
 
-    def create_kubeconfig_secret(self, user: User) -> None:
+    def _read_secret_token(self, user: User) -> str:
+        """Read the token of the user's service-account-token Secret.
+
+        A freshly created secret may not have its token yet; in that case
+        the secret is watched for up to token_wait_seconds instead of
+        failing the reconcile straight away.
+        """
+        token = self.secret_repo.wait_for_token(
+            name=user.token_secret_name,
+            namespace=user.namespace,
+            timeout_seconds=self.token_wait_seconds
+        )
+        if not token:
+            raise KubeconfigGenerationError(
+                user.name,
+                f"Token secret '{user.token_secret_name}' has no token data"
+            )
+        return base64.b64decode(token).decode('utf-8')
+
+    def create_kubeconfig_secret(self, user: User, force: bool = False) -> None:
         """Create or update a kubeconfig secret for the user.
 
         The secret is created in the user's dedicated namespace.
@@ -121,12 +183,28 @@ class KubeconfigService:
 
         Args:
             user: The User object
+            force: Write the secret even if its content hash is unchanged
 
         Raises:
             KubeconfigGenerationError: If creation fails
         """
         try:
-            kubeconfig = self.generate_kubeconfig(user)
+            stored = self._stored_annotations(user)
+            if self.uses_token_request:
+                kubeconfig, annotations = self._render_with_token_request(user, stored, force)
+                if kubeconfig is None:
+                    self._skip_write(user)
+                    return
+            else:
+                kubeconfig = self.generate_kubeconfig(user)
+                annotations = {}
+            content_hash = kubeconfig_hash(kubeconfig)
+
+            if not force and stored.get(KUBECONFIG_HASH_ANNOTATION) == content_hash:
+                self._skip_write(user)
+                return
+
+            annotations[KUBECONFIG_HASH_ANNOTATION] = content_hash
             kubeconfig_b64 = base64.b64encode(
                 kubeconfig.encode('utf-8')
             ).decode('utf-8')
@@ -134,13 +212,16 @@ class KubeconfigService:
             self.secret_repo.ensure_kubeconfig_secret(
                 name=user.kubeconfig_secret_name,
                 namespace=user.user_namespace,
-                kubeconfig_data=kubeconfig_b64
+                kubeconfig_data=kubeconfig_b64,
+                labels=user.owner_labels,
+                annotations=annotations
             )
 
             logger.info(
                 f"Ensured kubeconfig secret '{user.kubeconfig_secret_name}' "
                 f"in namespace '{user.user_namespace}'"
             )
+            record_kubeconfig_generated(user.user_namespace)
 
             if self.audit:
                 self.audit.log_create(
@@ -158,6 +239,103 @@ class KubeconfigService:
                 f"Failed to create kubeconfig secret: {str(e)}"
             )
 
+    def _render_with_token_request(self, user: User, stored: Dict[str, str],
+                                   force: bool) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """Render a kubeconfig with a fresh bound token, if one is needed.
+
+        A new token is only requested when the stored one is close to
+        expiry or was issued for a different cluster identity.
+
+        Args:
+            user: The User object
+            stored: Annotations of the current kubeconfig secret
+            force: Request a new token regardless of the stored one
+
+        Returns:
+            Tuple of (kubeconfig, annotations), or (None, None) if the
+            stored kubeconfig is still valid
+        """
+        identity = self._get_cluster_identity()
+        identity_hash = cluster_hash(identity)
+        if (not force and stored.get(CLUSTER_HASH_ANNOTATION) == identity_hash
+                and not self.token_needs_refresh(stored.get(TOKEN_EXPIRES_ANNOTATION),
+                                                 issued_at=stored.get(TOKEN_ISSUED_ANNOTATION))):
+            return None, None
+
+        issued_at = datetime.now(timezone.utc)
+        status = self.sa_repo.create_token(
+            name=user.service_account_name,
+            namespace=user.namespace,
+            expiration_seconds=self.token_expiration_seconds
+        )
+        kubeconfig = self.generate_kubeconfig(user, token=status.token, identity=identity)
+        annotations = {
+            TOKEN_ISSUED_ANNOTATION: issued_at.isoformat(),
+            TOKEN_EXPIRES_ANNOTATION: status.expiration_timestamp.isoformat(),
+            CLUSTER_HASH_ANNOTATION: identity_hash,
+        }
+        return kubeconfig, annotations
+
+    def token_needs_refresh(self, expires_at: Optional[str],
+                            now: Optional[datetime] = None,
+                            issued_at: Optional[str] = None) -> bool:
+        """Check whether a bound token is missing or close to expiry.
+
+        The refresh margin is a share of the lifetime the API server
+        actually issued, which may be shorter than the requested
+        expiration. Without an issue time the requested one is used.
+
+        Args:
+            expires_at: ISO 8601 expiry stamped on the kubeconfig secret
+            now: Current time, injectable for tests
+            issued_at: ISO 8601 issue time stamped on the kubeconfig secret
+
+        Returns:
+            True if a new token should be requested
+        """
+        if not expires_at:
+            return True
+        try:
+            expiry = datetime.fromisoformat(expires_at)
+        except ValueError:
+            return True
+        now = now or datetime.now(timezone.utc)
+        lifetime = timedelta(seconds=self.token_expiration_seconds)
+        if issued_at:
+            try:
+                issued = expiry - datetime.fromisoformat(issued_at)
+            except ValueError:
+                issued = None
+            if issued and timedelta(0) < issued < lifetime:
+                lifetime = issued
+        return expiry - now <= lifetime * TOKEN_REFRESH_FRACTION
+
+    def _skip_write(self, user: User) -> None:
+        """Record a kubeconfig secret write skipped as unchanged."""
+        logger.debug(
+            f"Kubeconfig secret '{user.kubeconfig_secret_name}' "
+            f"is up to date, skipping write"
+        )
+        record_kubeconfig_write_skipped()
+
+    def _stored_annotations(self, user: User) -> Dict[str, str]:
+        """Get the annotations of the user's current kubeconfig secret.
+
+        Args:
+            user: The User object
+
+        Returns:
+            The annotations, empty if the secret doesn't exist
+        """
+        try:
+            secret = self.secret_repo.get(
+                name=user.kubeconfig_secret_name,
+                namespace=user.user_namespace
+            )
+        except ResourceNotFoundError:
+            return {}
+        return secret.metadata.annotations or {}
+
     def delete_kubeconfig_secret(self, user: User) -> None:
         """Delete the kubeconfig secret for a user.
 
@@ -1,14 +1,18 @@
 """RBAC service for managing role bindings."""
 
 import logging
-from typing import Optional, Set, Tuple
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Set, Tuple, Union
 
 from app.models.user import User, ClusterRoleBinding as CRoleBinding
 from app.models.group import Group
-from app.repositories.rbac_repository import RBACRepository
+from app.repositories.rbac_repository import BINDING_CREATED, BINDING_UNCHANGED, RBACRepository
 from app.repositories.namespace_repository import NamespaceRepository
-from app.exceptions import ResourceNotFoundError
+from app.exceptions import RBACReconcileError, ResourceNotFoundError
 from app.utils.audit import AuditLogger
+from app.utils.concurrency import Task, run_bounded
+from app.utils.labels import unmanaged_selector
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +24,9 @@ class RBACService:
         self,
         rbac_repo: RBACRepository,
         ns_repo: NamespaceRepository,
-        audit_logger: Optional[AuditLogger] = None
+        audit_logger: Optional[AuditLogger] = None,
+        adopt_unlabelled: bool = False,
+        max_concurrency: int = 10
     ):
         """Initialize the service with required repositories.
 
@@ -28,10 +34,99 @@ class RBACService:
             rbac_repo: Repository for RBAC operations
             ns_repo: Repository for namespace operations
             audit_logger: Optional audit logger for tracking changes
+            adopt_unlabelled: Whether lookups also match bindings created
+                before ownership labels were introduced. Costs an extra
+                cluster-wide LIST per lookup, so it is meant for upgrades only
+            max_concurrency: Maximum number of bindings applied in parallel
         """
         self.rbac_repo = rbac_repo
         self.ns_repo = ns_repo
         self.audit = audit_logger
+        self.adopt_unlabelled = adopt_unlabelled
+        self.max_concurrency = max_concurrency
+
+    def _run_binding_tasks(self, owner: str, tasks: List[Task]) -> None:
+        """Apply independent bindings concurrently and aggregate failures.
+
+        Args:
+            owner: Name of the User or Group being reconciled
+            tasks: (key, callable) pairs, one per binding
+
+        Raises:
+            RBACReconcileError: If any task failed
+        """
+        failures = run_bounded(tasks, self.max_concurrency)
+        if failures:
+            for key, error in failures.items():
+                logger.error(f"Failed to apply binding '{key}' for '{owner}': {error}")
+            raise RBACReconcileError(owner, failures, len(tasks))
+
+    def _binding_events(self, owner_type: str, owner: Union[User, Group]) -> ContextManager[None]:
+        """Audit the binding changes of a reconcile as one event, if enabled."""
+        if self.audit is None:
+            return nullcontext()
+        return self.audit.binding_events(owner_type, owner.name, owner.namespace)
+
+    def _record_binding(self, action: str, resource_type: str, name: str,
+                        namespace: Optional[str], details: Dict[str, Any],
+                        context: str = "") -> None:
+        """Log and audit a binding write; unchanged bindings are neither.
+
+        Args:
+            action: Outcome returned by the repository
+            resource_type: RoleBinding or ClusterRoleBinding
+            name: Name of the binding
+            namespace: Namespace of a RoleBinding
+            details: Audit event details
+            context: Suffix of the log message
+        """
+        if action == BINDING_UNCHANGED:
+            return
+        logger.info(f"{action.capitalize()} {resource_type} '{name}'{context}")
+        if self.audit:
+            log = self.audit.log_create if action == BINDING_CREATED else self.audit.log_update
+            log(resource_type=resource_type, name=name, namespace=namespace, details=details)
+
+    # ==================== Owned Binding Lookups ====================
+
+    def _find_owned_bindings(self, owner_selector: str, subject_name: str,
+                             subject_kind: str) -> List[Any]:
+        """Find RoleBindings created by the operator for an owner."""
+        return self._find_owned(
+            self.rbac_repo.find_bindings_for_subject,
+            owner_selector, subject_name, subject_kind
+        )
+
+    def _find_owned_cluster_role_bindings(self, owner_selector: str, subject_name: str,
+                                          subject_kind: str) -> List[Any]:
+        """Find ClusterRoleBindings created by the operator for an owner."""
+        return self._find_owned(
+            self.rbac_repo.find_cluster_role_bindings_for_subject,
+            owner_selector, subject_name, subject_kind
+        )
+
+    def _find_owned(self, find: Callable[..., List[Any]], owner_selector: str,
+                    subject_name: str, subject_kind: str) -> List[Any]:
+        """Run a subject lookup filtered by the owner's label selector.
+
+        When adoption is enabled, bindings without the managed-by label are
+        matched too, so objects created by older operator versions are still
+        cleaned up. They are relabelled on their next create-or-update.
+        """
+        selectors = [owner_selector]
+        if self.adopt_unlabelled:
+            selectors.append(unmanaged_selector())
+
+        found: Dict[Tuple[str, str], Any] = {}
+        for selector in selectors:
+            for binding in find(
+                subject_name=subject_name,
+                subject_kind=subject_kind,
+                label_selector=selector
+            ):
+                key = (binding.metadata.namespace or "", binding.metadata.name)
+                found.setdefault(key, binding)
+        return list(found.values())
 
     # ==================== User RBAC ====================
 
@@ -40,15 +135,29 @@ class RBACService:
 
         Args:
             user: The User object
+
+        Raises:
+            RBACReconcileError: If one or more bindings could not be applied
         """
+        tasks = []
+
         # Create RoleBindings for ClusterRoles in specific namespaces
         for cr_binding in user.spec.cluster_roles:
             if cr_binding.namespace:
-                self._create_user_namespaced_binding(user, cr_binding)
+                tasks.append((
+                    f"{cr_binding.namespace}/{cr_binding.cluster_role}",
+                    partial(self._create_user_namespaced_binding, user, cr_binding)
+                ))
 
         # Create RoleBindings for Roles
         for role_name in user.spec.roles:
-            self._create_user_role_binding(user, role_name)
+            tasks.append((
+                f"{user.namespace}/{role_name}",
+                partial(self._create_user_role_binding, user, role_name)
+            ))
+
+        with self._binding_events("User", user):
+            self._run_binding_tasks(user.name, tasks)
 
     def _create_user_namespaced_binding(self, user: User,
                                          cr_binding: CRoleBinding) -> None:
@@ -76,21 +185,17 @@ class RBACService:
 
         role_ref = self.rbac_repo.create_cluster_role_ref(cr_binding.cluster_role)
 
-        self.rbac_repo.create_or_update_role_binding(
+        action = self.rbac_repo.create_or_update_role_binding(
             name=binding_name,
             namespace=cr_binding.namespace,
             role_ref=role_ref,
-            subjects=subjects
+            subjects=subjects,
+            labels=user.owner_labels
+        )
+        self._record_binding(
+            action, "RoleBinding", binding_name, cr_binding.namespace,
+            {"user": user.name, "clusterRole": cr_binding.cluster_role}, f" in namespace '{cr_binding.namespace}'"
         )
-        logger.info(f"Created RoleBinding '{binding_name}' in namespace '{cr_binding.namespace}'")
-
-        if self.audit:
-            self.audit.log_create(
-                resource_type="RoleBinding",
-                name=binding_name,
-                namespace=cr_binding.namespace,
-                details={"user": user.name, "clusterRole": cr_binding.cluster_role}
-            )
 
     def _create_user_role_binding(self, user: User, role_name: str) -> None:
         """Create a RoleBinding for a Role in the user's namespace."""
@@ -109,21 +214,17 @@ class RBACService:
         subject = self.rbac_repo.create_service_account_subject(user.name, user.namespace)
         role_ref = self.rbac_repo.create_role_ref(role_name)
 
-        self.rbac_repo.create_or_update_role_binding(
+        action = self.rbac_repo.create_or_update_role_binding(
             name=binding_name,
             namespace=user.namespace,
             role_ref=role_ref,
-            subjects=[subject]
+            subjects=[subject],
+            labels=user.owner_labels
+        )
+        self._record_binding(
+            action, "RoleBinding", binding_name, user.namespace,
+            {"user": user.name, "role": role_name}, f" for role '{role_name}'"
         )
-        logger.info(f"Created RoleBinding '{binding_name}' for role '{role_name}'")
-
-        if self.audit:
-            self.audit.log_create(
-                resource_type="RoleBinding",
-                name=binding_name,
-                namespace=user.namespace,
-                details={"user": user.name, "role": role_name}
-            )
 
     def update_user_role_bindings(self, user: User) -> None:
         """Update role bindings for a user, removing stale ones.
@@ -131,11 +232,12 @@ class RBACService:
         Args:
             user: The User object
         """
-        # Remove stale bindings
-        self._cleanup_user_bindings(user)
+        with self._binding_events("User", user):
+            # Remove stale bindings
+            self._cleanup_user_bindings(user)
 
-        # Create/update current bindings
-        self.create_user_role_bindings(user)
+            # Create/update current bindings
+            self.create_user_role_bindings(user)
 
     def _cleanup_user_bindings(self, user: User) -> None:
         """Remove RoleBindings that are no longer in the user spec."""
@@ -146,10 +248,7 @@ class RBACService:
                 expected_bindings.add((cr.namespace, cr.cluster_role))
 
         # Find and delete stale bindings
-        bindings = self.rbac_repo.find_bindings_for_subject(
-            subject_name=user.name,
-            subject_kind="ServiceAccount"
-        )
+        bindings = self._find_owned_bindings(user.owner_selector, user.name, "ServiceAccount")
 
         for binding in bindings:
             ns = binding.metadata.namespace
@@ -181,24 +280,21 @@ class RBACService:
         Args:
             user: The User object
         """
-        # Delete namespaced RoleBindings
-        bindings = self.rbac_repo.find_bindings_for_subject(
-            subject_name=user.name,
-            subject_kind="ServiceAccount"
-        )
-        for binding in bindings:
-            self._delete_role_binding(
-                binding.metadata.name,
-                binding.metadata.namespace
-            )
+        with self._binding_events("User", user):
+            # Delete namespaced RoleBindings
+            bindings = self._find_owned_bindings(user.owner_selector, user.name, "ServiceAccount")
+            for binding in bindings:
+                self._delete_role_binding(
+                    binding.metadata.name,
+                    binding.metadata.namespace
+                )
 
-        # Delete ClusterRoleBindings
-        crb_bindings = self.rbac_repo.find_cluster_role_bindings_for_subject(
-            subject_name=user.name,
-            subject_kind="ServiceAccount"
-        )
-        for binding in crb_bindings:
-            self._delete_cluster_role_binding(binding.metadata.name)
+            # Delete ClusterRoleBindings
+            crb_bindings = self._find_owned_cluster_role_bindings(
+                user.owner_selector, user.name, "ServiceAccount"
+            )
+            for binding in crb_bindings:
+                self._delete_cluster_role_binding(binding.metadata.name)
 
     def _delete_cluster_role_binding(self, name: str) -> None:
         """Delete a ClusterRoleBinding with logging."""
@@ -240,7 +336,8 @@ class RBACService:
 
         self.rbac_repo.create_or_update_cluster_role(
             name=user.restricted_role_name,
-            rules=rules
+            rules=rules,
+            labels=user.owner_labels
         )
         logger.info(f"Created restricted ClusterRole '{user.restricted_role_name}'")
 
@@ -248,12 +345,14 @@ class RBACService:
         role_ref = self.rbac_repo.create_cluster_role_ref(user.restricted_role_name)
         subject = self.rbac_repo.create_service_account_subject(user.name, user.namespace)
 
-        self.rbac_repo.create_or_update_cluster_role_binding(
+        action = self.rbac_repo.create_or_update_cluster_role_binding(
             name=user.restricted_binding_name,
             role_ref=role_ref,
-            subjects=[subject]
+            subjects=[subject],
+            labels=user.owner_labels
         )
-        logger.info(f"Created restricted ClusterRoleBinding '{user.restricted_binding_name}'")
+        if action != BINDING_UNCHANGED:
+            logger.info(f"{action.capitalize()} restricted ClusterRoleBinding '{user.restricted_binding_name}'")
 
         if self.audit:
             self.audit.log_create(
@@ -283,18 +382,35 @@ class RBACService:
 
         Args:
             group: The Group object
+
+        Raises:
+            RBACReconcileError: If one or more bindings could not be applied
         """
+        tasks = []
+
         # Create bindings for namespaced cluster roles
         for cr_binding in group.spec.get_namespaced_roles():
-            self._create_group_namespaced_binding(group, cr_binding)
+            tasks.append((
+                f"{cr_binding.namespace}/{cr_binding.cluster_role}",
+                partial(self._create_group_namespaced_binding, group, cr_binding)
+            ))
 
         # Create bindings for cluster-wide cluster roles
         for cr_binding in group.spec.get_cluster_wide_roles():
-            self._create_group_cluster_binding(group, cr_binding)
+            tasks.append((
+                cr_binding.cluster_role,
+                partial(self._create_group_cluster_binding, group, cr_binding)
+            ))
 
         # Create bindings for roles
         for role_name in group.spec.roles:
-            self._create_group_role_binding(group, role_name)
+            tasks.append((
+                f"{group.namespace}/{role_name}",
+                partial(self._create_group_role_binding, group, role_name)
+            ))
+
+        with self._binding_events("Group", group):
+            self._run_binding_tasks(group.name, tasks)
 
     def _create_group_namespaced_binding(self, group: Group,
                                           cr_binding: CRoleBinding) -> None:
@@ -308,21 +424,17 @@ class RBACService:
         )
         role_ref = self.rbac_repo.create_cluster_role_ref(cr_binding.cluster_role)
 
-        self.rbac_repo.create_or_update_role_binding(
+        action = self.rbac_repo.create_or_update_role_binding(
             name=binding_name,
             namespace=cr_binding.namespace,
             role_ref=role_ref,
-            subjects=[subject]
+            subjects=[subject],
+            labels=group.owner_labels
+        )
+        self._record_binding(
+            action, "RoleBinding", binding_name, cr_binding.namespace,
+            {"group": group.name, "clusterRole": cr_binding.cluster_role}, f" for group '{group.name}'"
         )
-        logger.info(f"Created RoleBinding '{binding_name}' for group '{group.name}'")
-
-        if self.audit:
-            self.audit.log_create(
-                resource_type="RoleBinding",
-                name=binding_name,
-                namespace=cr_binding.namespace,
-                details={"group": group.name, "clusterRole": cr_binding.cluster_role}
-            )
 
     def _create_group_cluster_binding(self, group: Group,
                                        cr_binding: CRoleBinding) -> None:
@@ -332,19 +444,16 @@ class RBACService:
         subject = self.rbac_repo.create_group_subject(group.name)
         role_ref = self.rbac_repo.create_cluster_role_ref(cr_binding.cluster_role)
 
-        self.rbac_repo.create_or_update_cluster_role_binding(
+        action = self.rbac_repo.create_or_update_cluster_role_binding(
             name=binding_name,
             role_ref=role_ref,
-            subjects=[subject]
+            subjects=[subject],
+            labels=group.owner_labels
+        )
+        self._record_binding(
+            action, "ClusterRoleBinding", binding_name, None,
+            {"group": group.name, "clusterRole": cr_binding.cluster_role}, f" for group '{group.name}'"
         )
-        logger.info(f"Created ClusterRoleBinding '{binding_name}' for group '{group.name}'")
-
-        if self.audit:
-            self.audit.log_create(
-                resource_type="ClusterRoleBinding",
-                name=binding_name,
-                details={"group": group.name, "clusterRole": cr_binding.cluster_role}
-            )
 
     def _create_group_role_binding(self, group: Group, role_name: str) -> None:
         """Create a RoleBinding for a group's Role."""
@@ -353,26 +462,23 @@ class RBACService:
         subject = self.rbac_repo.create_group_subject(group.name)
         role_ref = self.rbac_repo.create_role_ref(role_name)
 
-        self.rbac_repo.create_or_update_role_binding(
+        action = self.rbac_repo.create_or_update_role_binding(
             name=binding_name,
             namespace=group.namespace,
             role_ref=role_ref,
-            subjects=[subject]
+            subjects=[subject],
+            labels=group.owner_labels
+        )
+        self._record_binding(
+            action, "RoleBinding", binding_name, group.namespace,
+            {"group": group.name, "role": role_name}, f" for group '{group.name}'"
         )
-        logger.info(f"Created RoleBinding '{binding_name}' for group '{group.name}'")
-
-        if self.audit:
-            self.audit.log_create(
-                resource_type="RoleBinding",
-                name=binding_name,
-                namespace=group.namespace,
-                details={"group": group.name, "role": role_name}
-            )
 
     def update_group_role_bindings(self, group: Group) -> None:
         """Update role bindings for a group, removing stale ones."""
-        self._cleanup_group_bindings(group)
-        self.create_group_role_bindings(group)
+        with self._binding_events("Group", group):
+            self._cleanup_group_bindings(group)
+            self.create_group_role_bindings(group)
 
     def _cleanup_group_bindings(self, group: Group) -> None:
         """Remove bindings that are no longer in the group spec."""
@@ -387,19 +493,15 @@ class RBACService:
             expected_rb.add((cr.namespace, cr.cluster_role))
 
         # Clean up ClusterRoleBindings
-        crb_bindings = self.rbac_repo.find_cluster_role_bindings_for_subject(
-            subject_name=group.name,
-            subject_kind="Group"
+        crb_bindings = self._find_owned_cluster_role_bindings(
+            group.owner_selector, group.name, "Group"
         )
         for binding in crb_bindings:
             if binding.role_ref.name not in expected_crb:
                 self._delete_cluster_role_binding(binding.metadata.name)
 
         # Clean up RoleBindings
-        rb_bindings = self.rbac_repo.find_bindings_for_subject(
-            subject_name=group.name,
-            subject_kind="Group"
-        )
+        rb_bindings = self._find_owned_bindings(group.owner_selector, group.name, "Group")
         for binding in rb_bindings:
             ns = binding.metadata.namespace
             role = binding.role_ref.name
@@ -411,21 +513,18 @@ class RBACService:
 
     def delete_group_role_bindings(self, group: Group) -> None:
         """Delete all role bindings for a group."""
-        # Delete namespaced RoleBindings
-        bindings = self.rbac_repo.find_bindings_for_subject(
-            subject_name=group.name,
-            subject_kind="Group"
-        )
-        for binding in bindings:
-            self._delete_role_binding(
-                binding.metadata.name,
-                binding.metadata.namespace
-            )
+        with self._binding_events("Group", group):
+            # Delete namespaced RoleBindings
+            bindings = self._find_owned_bindings(group.owner_selector, group.name, "Group")
+            for binding in bindings:
+                self._delete_role_binding(
+                    binding.metadata.name,
+                    binding.metadata.namespace
+                )
 
-        # Delete ClusterRoleBindings
-        crb_bindings = self.rbac_repo.find_cluster_role_bindings_for_subject(
-            subject_name=group.name,
-            subject_kind="Group"
-        )
-        for binding in crb_bindings:
-            self._delete_cluster_role_binding(binding.metadata.name)
+            # Delete ClusterRoleBindings
+            crb_bindings = self._find_owned_cluster_role_bindings(
+                group.owner_selector, group.name, "Group"
+            )
+            for binding in crb_bindings:
+                self._delete_cluster_role_binding(binding.metadata.name)
@@ -4,11 +4,14 @@ import logging
 import time
 from typing import Optional
 
+from app.api.metrics import record_role_created, record_role_deleted
 from app.repositories.rbac_repository import RBACRepository
 from app.repositories.namespace_repository import NamespaceRepository
 from app.validators import validate_role_name, validate_role_spec
 from app.exceptions import ResourceNotFoundError
 from app.utils.audit import AuditLogger
+from app.utils.instrumentation import phase
+from app.utils.labels import owner_annotations, owner_labels
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +55,9 @@ class RoleService:
         name = body['metadata']['name']
 
         # Validate inputs
-        validate_role_name(name)
-        validated_spec = validate_role_spec(spec)
+        with phase("validate"):
+            validate_role_name(name)
+            validated_spec = validate_role_spec(spec)
 
         if kind == 'Role':
             return self._create_namespaced_role(name, namespace, validated_spec)
@@ -83,16 +87,20 @@ class RoleService:
             }
 
         rules = spec.get('rules', [])
+        labels = owner_labels("Role", name, namespace)
+        annotations = owner_annotations(name)
 
         # Check if role exists
-        if self.rbac_repo.role_exists(name, namespace):
-            self.rbac_repo.update_role(name, namespace, rules)
-            logger.info(f"Updated Role '{name}' in namespace '{namespace}'")
-            action = "updated"
-        else:
-            self.rbac_repo.create_role(name, namespace, rules)
-            logger.info(f"Created Role '{name}' in namespace '{namespace}'")
-            action = "created"
+        with phase("rbac"):
+            if self.rbac_repo.role_exists(name, namespace):
+                self.rbac_repo.update_role(name, namespace, rules, labels, annotations)
+                logger.info(f"Updated Role '{name}' in namespace '{namespace}'")
+                action = "updated"
+            else:
+                self.rbac_repo.create_role(name, namespace, rules, labels, annotations)
+                logger.info(f"Created Role '{name}' in namespace '{namespace}'")
+                action = "created"
+                record_role_created(namespace, "Role")
 
         if self.audit:
             if action == "created":
@@ -123,16 +131,20 @@ class RoleService:
             Status dict
         """
         rules = spec.get('rules', [])
+        labels = owner_labels("ClusterRole", name)
+        annotations = owner_annotations(name)
 
         # Check if cluster role exists
-        if self.rbac_repo.cluster_role_exists(name):
-            self.rbac_repo.update_cluster_role(name, rules)
-            logger.info(f"Updated ClusterRole '{name}'")
-            action = "updated"
-        else:
-            self.rbac_repo.create_cluster_role(name, rules)
-            logger.info(f"Created ClusterRole '{name}'")
-            action = "created"
+        with phase("rbac"):
+            if self.rbac_repo.cluster_role_exists(name):
+                self.rbac_repo.update_cluster_role(name, rules, labels, annotations)
+                logger.info(f"Updated ClusterRole '{name}'")
+                action = "updated"
+            else:
+                self.rbac_repo.create_cluster_role(name, rules, labels, annotations)
+                logger.info(f"Created ClusterRole '{name}'")
+                action = "created"
+                record_role_created("cluster", "ClusterRole")
 
         if self.audit:
             if action == "created":
@@ -208,8 +220,10 @@ class RoleService:
             Status dict
         """
         try:
-            self.rbac_repo.delete_role(name, namespace)
+            with phase("rbac"):
+                self.rbac_repo.delete_role(name, namespace)
             logger.info(f"Deleted Role '{name}' from namespace '{namespace}'")
+            record_role_deleted(namespace, "Role")
 
             if self.audit:
                 self.audit.log_delete(
@@ -233,8 +247,10 @@ class RoleService:
             Status dict
         """
         try:
-            self.rbac_repo.delete_cluster_role(name)
+            with phase("rbac"):
+                self.rbac_repo.delete_cluster_role(name)
             logger.info(f"Deleted ClusterRole '{name}'")
+            record_role_deleted("cluster", "ClusterRole")
 
             if self.audit:
                 self.audit.log_delete(
@@ -0,0 +1,132 @@
+"""Background renewal of bound service account tokens.
+
+With TOKEN_MODE=request, kubeconfigs embed short-lived tokens from the
+TokenRequest API. This module periodically scans the kubeconfig Secrets
+and regenerates those whose token is close to expiry, so users never hold
+an expired kubeconfig.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from app.config import Config
+from app.models.user import User
+from app.repositories.secret_repository import SecretRepository
+from app.services.kubeconfig_service import (
+    KubeconfigService,
+    TOKEN_EXPIRES_ANNOTATION,
+    TOKEN_ISSUED_ANNOTATION,
+)
+from app.utils.labels import OWNER_NAME_LABEL, OWNER_NAMESPACE_LABEL
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefresher:
+    """Renews kubeconfig tokens before they expire."""
+
+    def __init__(
+        self,
+        kubeconfig_service: KubeconfigService,
+        secret_repo: SecretRepository,
+        custom_api: client.CustomObjectsApi,
+        interval_seconds: float = 300.0
+    ):
+        """Initialize the refresher.
+
+        Args:
+            kubeconfig_service: Service regenerating kubeconfig secrets
+            secret_repo: Repository used to list kubeconfig secrets
+            custom_api: Client used to read the owning User resources
+            interval_seconds: Time between scans
+        """
+        self.kubeconfig_service = kubeconfig_service
+        self.secret_repo = secret_repo
+        self.custom_api = custom_api
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the refresh thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="token-refresher", daemon=True
+        )
+        self._thread.start()
+        logger.info("Token refresher started")
+
+    def stop(self) -> None:
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        logger.info("Token refresher stopped")
+
+    def _run(self) -> None:
+        """Scan for expiring tokens until stopped."""
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.refresh_due()
+            except Exception as e:
+                logger.error(f"Token refresh scan failed: {e}")
+
+    def refresh_due(self) -> int:
+        """Regenerate every kubeconfig whose token is close to expiry.
+
+        Returns:
+            Number of kubeconfigs regenerated
+        """
+        refreshed = 0
+        for secret in self.secret_repo.iter_kubeconfig_secrets():
+            annotations = secret.metadata.annotations or {}
+            if not self.kubeconfig_service.token_needs_refresh(
+                annotations.get(TOKEN_EXPIRES_ANNOTATION),
+                issued_at=annotations.get(TOKEN_ISSUED_ANNOTATION)
+            ):
+                continue
+
+            user = self._owner(secret)
+            if user is None:
+                continue
+            try:
+                self.kubeconfig_service.create_kubeconfig_secret(user)
+                refreshed += 1
+            except Exception as e:
+                logger.error(f"Failed to refresh token for User '{user.name}': {e}")
+
+        if refreshed:
+            logger.info(f"Refreshed {refreshed} kubeconfig token(s)")
+        return refreshed
+
+    def _owner(self, secret: client.V1Secret) -> Optional[User]:
+        """Get the User owning a kubeconfig secret, from its owner labels."""
+        labels = secret.metadata.labels or {}
+        name = labels.get(OWNER_NAME_LABEL)
+        namespace = labels.get(OWNER_NAMESPACE_LABEL)
+        if not name or not namespace:
+            logger.debug(f"Kubeconfig secret '{secret.metadata.name}' has no owner labels")
+            return None
+
+        try:
+            body = self.custom_api.get_namespaced_custom_object(
+                group=Config.GROUP,
+                version=Config.VERSION,
+                namespace=namespace,
+                plural=Config.PLURAL,
+                name=name
+            )
+        except ApiException as e:
+            if e.status == 404:
+                logger.debug(f"User '{namespace}/{name}' no longer exists")
+            else:
+                logger.error(f"Failed to read User '{namespace}/{name}': {e.reason}")
+            return None
+        return User.from_dict(body)
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+from app.api.metrics import record_user_created, record_user_deleted
 from app.models.user import User, NetworkPolicyMode
 from app.repositories.serviceaccount_repository import ServiceAccountRepository
 from app.repositories.namespace_repository import NamespaceRepository
@@ -15,6 +16,7 @@ from app.services.kubeconfig_service import KubeconfigService
 from app.validators import validate_user_name, validate_user_spec
 from app.exceptions import ResourceNotFoundError
 from app.utils.audit import AuditLogger
+from app.utils.instrumentation import phase
 
 logger = logging.getLogger(__name__)
 
@@ -72,8 +74,9 @@ class UserService:
         user = User.from_dict(body)
 
         # Validate inputs
-        validate_user_name(user.name)
-        validate_user_spec(spec)
+        with phase("validate"):
+            validate_user_name(user.name)
+            validate_user_spec(spec, body.get("metadata"))
 
         user_type = "human" if user.spec.is_human else "serviceAccount"
         logger.info(
@@ -85,10 +88,12 @@ class UserService:
         sa_namespace = user.sa_namespace
 
         # Create ServiceAccount
-        self.sa_repo.create(
-            name=user.service_account_name,
-            namespace=sa_namespace
-        )
+        with phase("service_account"):
+            self.sa_repo.ensure_exists(
+                name=user.service_account_name,
+                namespace=sa_namespace,
+                labels=user.owner_labels
+            )
         logger.info(
             f"Created ServiceAccount '{user.service_account_name}' "
             f"in namespace '{sa_namespace}'"
@@ -114,7 +119,9 @@ class UserService:
             )
 
         # Create role bindings
-        self.rbac_service.create_user_role_bindings(user)
+        with phase("rbac"):
+            self.rbac_service.create_user_role_bindings(user)
+        record_user_created(namespace, user_type)
 
         # Build status
         status = {
@@ -142,16 +149,34 @@ class UserService:
         Args:
             user: The User object
         """
-        # Ensure SA token secret exists (idempotent for updates)
-        self.secret_repo.ensure_service_account_token(
-            sa_name=user.service_account_name,
-            namespace=user.namespace
-        )
-        logger.info(f"Ensured SA token secret exists for '{user.name}'")
+        # Ensure SA token secret exists (idempotent for updates), unless
+        # tokens are requested directly through the TokenRequest API
+        if not self.kubeconfig_service.uses_token_request:
+            with phase("service_account"):
+                self.secret_repo.ensure_service_account_token(
+                    sa_name=user.service_account_name,
+                    namespace=user.namespace,
+                    labels=user.owner_labels
+                )
+            logger.info(f"Ensured SA token secret exists for '{user.name}'")
 
         # Create restricted permissions
-        self.rbac_service.create_user_restricted_permissions(user)
+        with phase("rbac"):
+            self.rbac_service.create_user_restricted_permissions(user)
+
+        with phase("namespace"):
+            self._setup_user_namespace(user)
 
+        # Generate kubeconfig
+        with phase("kubeconfig"):
+            self.kubeconfig_service.create_kubeconfig_secret(user)
+
+    def _setup_user_namespace(self, user: User) -> None:
+        """Ensure the user namespace with its optional quota and network policy.
+
+        Args:
+            user: The User object
+        """
         # Create/ensure user namespace exists with optional config
         ns_labels = {}
         ns_annotations = {}
@@ -161,8 +186,8 @@ class UserService:
             ns_annotations = user.spec.namespace_config.annotations.copy()
 
         # Add standard labels
+        ns_labels.update(user.owner_labels)
         ns_labels.update({
-            "app.kubernetes.io/managed-by": "k8s-iam-operator",
             "k8sio.auth/user": user.name,
             "k8sio.auth/type": "human",
         })
@@ -186,7 +211,7 @@ class UserService:
                 name=user.quota_name,
                 namespace=user.user_namespace,
                 hard=quota_spec,
-                labels={"app.kubernetes.io/managed-by": "k8s-iam-operator"}
+                labels=user.owner_labels
             )
             logger.info(
                 f"Applied ResourceQuota '{user.quota_name}' "
@@ -204,22 +229,19 @@ class UserService:
                 self.network_policy_repo.create_isolated_policy(
                     name=user.network_policy_name,
                     namespace=user.user_namespace,
-                    labels={"app.kubernetes.io/managed-by": "k8s-iam-operator"}
+                    labels=user.owner_labels
                 )
             elif policy_mode == NetworkPolicyMode.RESTRICTED:
                 self.network_policy_repo.create_restricted_policy(
                     name=user.network_policy_name,
                     namespace=user.user_namespace,
-                    labels={"app.kubernetes.io/managed-by": "k8s-iam-operator"}
+                    labels=user.owner_labels
                 )
             logger.info(
                 f"Applied NetworkPolicy '{user.network_policy_name}' "
                 f"({policy_mode.value}) to namespace '{user.user_namespace}'"
             )
 
-        # Generate kubeconfig
-        self.kubeconfig_service.create_kubeconfig_secret(user)
-
     def update_user(self, body: dict, spec: dict, namespace: str) -> dict:
         """Handle User CRD update.
 
@@ -234,35 +256,33 @@ class UserService:
         user = User.from_dict(body)
 
         # Validate inputs
-        validate_user_name(user.name)
-        validate_user_spec(spec)
+        with phase("validate"):
+            validate_user_name(user.name)
+            validate_user_spec(spec, body.get("metadata"))
 
         user_type = "human" if user.spec.is_human else "serviceAccount"
         logger.info(f"Updating {user_type} user '{user.name}'")
 
         sa_namespace = user.sa_namespace
 
-        # Update ServiceAccount (if needed)
-        try:
-            self.sa_repo.update(
+        # Apply ServiceAccount (recreates it if it was deleted)
+        with phase("service_account"):
+            self.sa_repo.ensure_exists(
                 name=user.service_account_name,
-                namespace=sa_namespace
-            )
-        except ResourceNotFoundError:
-            # SA was deleted, recreate
-            self.sa_repo.create(
-                name=user.service_account_name,
-                namespace=sa_namespace
+                namespace=sa_namespace,
+                labels=user.owner_labels
             )
 
         # Handle type changes
         if user.spec.is_human:
             self._setup_human_user(user)
         else:
-            self._cleanup_human_resources(user)
+            with phase("namespace"):
+                self._cleanup_human_resources(user)
 
         # Update role bindings
-        self.rbac_service.update_user_role_bindings(user)
+        with phase("rbac"):
+            self.rbac_service.update_user_role_bindings(user)
 
         if self.audit:
             self.audit.log_update(
@@ -323,10 +343,11 @@ class UserService:
 
         # Delete ServiceAccount
         try:
-            self.sa_repo.delete(
-                name=user.service_account_name,
-                namespace=sa_namespace
-            )
+            with phase("service_account"):
+                self.sa_repo.delete(
+                    name=user.service_account_name,
+                    namespace=sa_namespace
+                )
             logger.info(f"Deleted ServiceAccount '{user.service_account_name}'")
 
             if self.audit:
@@ -342,18 +363,13 @@ class UserService:
 
         # Delete user namespace if human user
         if user.spec.is_human:
-            try:
-                self.ns_repo.delete(user.user_namespace)
-                logger.info(f"Deleted user namespace '{user.user_namespace}'")
-            except ResourceNotFoundError:
-                logger.debug(
-                    f"User namespace '{user.user_namespace}' already deleted"
-                )
-
-        # Delete all role bindings
-        self.rbac_service.delete_user_role_bindings(user)
-
-        # Delete restricted permissions
-        self.rbac_service.delete_user_restricted_permissions(user)
+            with phase("namespace"):
+                self._cleanup_human_resources(user)
+
+        # Delete all role bindings and restricted permissions
+        with phase("rbac"):
+            self.rbac_service.delete_user_role_bindings(user)
+            self.rbac_service.delete_user_restricted_permissions(user)
+        record_user_deleted(namespace, user_type)
 
         return {"state": "deleted"}
@@ -4,15 +4,23 @@ This module provides structured audit logging for all IAM-related
 operations in the k8s-iam-operator.
 """
 
+import functools
 import json
 import logging
+import math
+import os
+import threading
+import time
 import uuid
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+from contextlib import contextmanager
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Callable, Dict, Any, Iterator, List, NamedTuple, Tuple
 from contextvars import ContextVar
 
+from app.config import OperatorConfig, get_config
+from app.utils.audit_pipeline import AuditPipeline, AuditSink, create_sink
+from app.utils.audit_spool import AuditSpool, SpoolReplayer
+
 logger = logging.getLogger("audit")
 
 # Context variable for trace ID (for distributed tracing)
@@ -50,16 +58,14 @@ class EventOutcome(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
-class Actor:
+class Actor(NamedTuple):
     """Actor who initiated the event."""
     type: str  # operator, user, system
     name: str
     namespace: Optional[str] = None
 
 
-@dataclass
-class Subject:
+class Subject(NamedTuple):
     """Subject affected by the event."""
     type: str  # User, Group, ServiceAccount, Pod, etc.
     name: str
@@ -67,8 +73,7 @@ class Subject:
     uid: Optional[str] = None
 
 
-@dataclass
-class Resource:
+class Resource(NamedTuple):
     """Resource involved in the event."""
     type: str  # Role, ClusterRole, RoleBinding, etc.
     name: str
@@ -76,8 +81,7 @@ class Resource:
     api_version: str = "k8sio.auth/v1"
 
 
-@dataclass
-class IAMEvent:
+class IAMEvent(NamedTuple):
     """Structured IAM audit event."""
     timestamp: str
     event_id: str
@@ -88,10 +92,10 @@ class IAMEvent:
     subject: Subject
     resource: Optional[Resource] = None
     message: str = ""
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = None
     trace_id: Optional[str] = None
     duration_ms: Optional[float] = None
-    labels: Dict[str, str] = field(default_factory=dict)
+    labels: Optional[Dict[str, str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for JSON serialization."""
@@ -101,13 +105,13 @@ class IAMEvent:
             "category": self.category.value,
             "action": self.action.value,
             "outcome": self.outcome.value,
-            "actor": asdict(self.actor),
-            "subject": asdict(self.subject),
+            "actor": self.actor._asdict(),
+            "subject": self.subject._asdict(),
             "message": self.message,
         }
 
         if self.resource:
-            data["resource"] = asdict(self.resource)
+            data["resource"] = self.resource._asdict()
 
         if self.details:
             data["details"] = self.details
@@ -125,19 +129,223 @@ class IAMEvent:
 
     def to_json(self) -> str:
         """Convert event to JSON string."""
-        return json.dumps(self.to_dict())
+        return _encode(*self)
+
+
+class PendingEvent(NamedTuple):
+    """An event captured on the calling thread.
+
+    Holds the IAMEvent fields except the timestamp and event id, which are
+    produced with the JSON when the event is written.
+    """
+    created_at: float
+    category: EventCategory
+    action: EventAction
+    outcome: EventOutcome
+    actor: Actor
+    subject: Subject
+    resource: Optional[Resource]
+    message: str
+    details: Optional[Dict[str, Any]]
+    trace_id: Optional[str]
+    duration_ms: Optional[float]
+    labels: Optional[Dict[str, str]]
+
+
+# ==================== Encoding ====================
+#
+# The encoder writes the same JSON as json.dumps(event.to_dict()) without
+# building the intermediate dicts. Enum values are encoded once, actor
+# fragments are cached since almost every event has the operator as actor,
+# and flat details and labels dicts are encoded without json.dumps.
+
+_encode_str = json.encoder.encode_basestring_ascii
+
+_ENUM_JSON = {
+    member: _encode_str(member.value)
+    for enum in (EventCategory, EventAction, EventOutcome)
+    for member in enum
+}
+
+_last_second: Tuple[int, str] = (-1, "")
+
+
+def _encode_float(value: float) -> str:
+    """Encode a float like json.dumps, which spells out non-finite values."""
+    if value != value or value in (math.inf, -math.inf):
+        return json.dumps(value)
+    return float.__repr__(value)
+
+
+# Encoders of the exact scalar types found in details and labels
+_SCALAR_JSON: Dict[type, Callable[[Any], str]] = {
+    str: _encode_str,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a scalar field value."""
+    encode = _SCALAR_JSON.get(type(value))
+    return encode(value) if encode else json.dumps(value)
+
+
+def _encode_object(value: Dict[str, Any]) -> str:
+    """Encode a details or labels dict.
+
+    Flat dicts of strings and numbers, which nearly all events carry, are
+    encoded inline; anything else goes through json.dumps.
+    """
+    parts = []
+    for key, item in value.items():
+        encode = _SCALAR_JSON.get(type(item))
+        if encode is None or type(key) is not str:
+            return json.dumps(value)
+        parts.append(f"{_encode_str(key)}: {encode(item)}")
+    return "{" + ", ".join(parts) + "}"
+
+
+def _encode_record(record: Tuple[Any, ...]) -> str:
+    """Encode an Actor, Subject or Resource as a JSON object."""
+    return "{" + ", ".join(
+        f'"{name}": {_encode_value(value)}' for name, value in zip(record._fields, record)
+    ) + "}"
+
+
+def _encode_subject(subject: Subject) -> str:
+    """Encode a subject; the most common record, so unrolled."""
+    type_, name, namespace, uid = subject
+    return (
+        f'{{"type": {_encode_str(type_)}, "name": {_encode_str(name)}, '
+        f'"namespace": {_encode_value(namespace)}, "uid": {_encode_value(uid)}}}'
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_actor(actor: Actor) -> str:
+    """Encode an actor, cached per distinct actor."""
+    return _encode_record(actor)
+
+
+# Hex digit of the variant nibble of a UUID, by the random nibble it replaces
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def _event_id() -> str:
+    """Generate a random (version 4) UUID string.
+
+    Same format as str(uuid.uuid4()) without building a UUID object; the
+    version and variant bits are set on the hex digits.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+
+def _format_timestamp(created_at: float) -> str:
+    """Format an epoch time as an ISO 8601 UTC timestamp.
+
+    The date and time up to the second are formatted once per second.
+    """
+    global _last_second
+    second = int(created_at)
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = (second, prefix)
+    return f"{prefix}.{int((created_at - second) * 1_000_000):06d}+00:00"
+
+
+def _encode(timestamp: str, event_id: str, category: EventCategory, action: EventAction,
+            outcome: EventOutcome, actor: Actor, subject: Subject, resource: Optional[Resource],
+            message: str, details: Optional[Dict[str, Any]], trace_id: Optional[str],
+            duration_ms: Optional[float], labels: Optional[Dict[str, str]]) -> str:
+    """Encode the fields of an event as a JSON object."""
+    parts = [
+        '{"timestamp": ', _encode_str(timestamp),
+        ', "event_id": ', _encode_str(event_id),
+        ', "category": ', _ENUM_JSON[category],
+        ', "action": ', _ENUM_JSON[action],
+        ', "outcome": ', _ENUM_JSON[outcome],
+        ', "actor": ', _encode_actor(actor),
+        ', "subject": ', _encode_subject(subject),
+        ', "message": ', _encode_str(message),
+    ]
+    if resource:
+        parts += (', "resource": ', _encode_record(resource))
+    if details:
+        parts += (', "details": ', _encode_object(details))
+    if trace_id:
+        parts += (', "trace_id": ', _encode_str(trace_id))
+    if duration_ms is not None:
+        parts += (', "duration_ms": ', _encode_value(duration_ms))
+    if labels:
+        parts += (', "labels": ', _encode_object(labels))
+    parts.append("}")
+    return "".join(parts)
+
+
+def build_event(pending: PendingEvent) -> IAMEvent:
+    """Turn a captured event into an IAMEvent."""
+    return IAMEvent(_format_timestamp(pending.created_at), _event_id(), *pending[1:])
+
+
+def encode_event(pending: PendingEvent) -> str:
+    """Serialize a captured event to a JSON line."""
+    return _encode(_format_timestamp(pending.created_at), _event_id(), *pending[1:])
+
+
+# ==================== Binding Aggregation ====================
+
+_BINDING_TYPES = frozenset({"RoleBinding", "ClusterRoleBinding"})
+
+
+class BindingAggregate:
+    """Binding events collected while reconciling one User or Group."""
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregate."""
+        self.bindings: Dict[EventAction, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, event: PendingEvent) -> None:
+        """Collect a binding event as "namespace/name" under its action."""
+        subject = event.subject
+        child = f"{subject.namespace}/{subject.name}" if subject.namespace else subject.name
+        with self._lock:
+            self.bindings.setdefault(event.action, []).append(child)
+
+
+# Aggregate of the running reconcile; copied into worker threads by run_bounded
+_binding_aggregate: ContextVar[Optional[BindingAggregate]] = ContextVar('binding_aggregate', default=None)
+
+_AGGREGATE_ACTIONS = {
+    frozenset({EventAction.CREATE}): (EventAction.BIND, "Applied"),
+    frozenset({EventAction.DELETE}): (EventAction.UNBIND, "Deleted"),
+}
 
 
 class AuditLogger:
     """Structured audit logger for IAM operations."""
 
-    def __init__(self, operator_name: str = "k8s-iam-operator"):
+    def __init__(self, operator_name: str = "k8s-iam-operator",
+                 pipeline: Optional[AuditPipeline] = None,
+                 aggregate_bindings: bool = False):
         """Initialize the audit logger.
 
         Args:
             operator_name: Name of the operator for log entries
+            pipeline: Optional queue delivering events from a background
+                      writer. If not provided, events are serialized and
+                      logged on the calling thread.
+            aggregate_bindings: Whether binding events inside
+                                binding_events() are logged as one event
         """
         self.operator_name = operator_name
+        self.pipeline = pipeline
+        self.aggregate_bindings = aggregate_bindings
         self._default_actor = Actor(type="operator", name=operator_name)
 
     def _get_trace_id(self) -> Optional[str]:
@@ -156,30 +364,85 @@ class AuditLogger:
         actor: Optional[Actor] = None,
         duration_ms: Optional[float] = None,
         labels: Optional[Dict[str, str]] = None,
-    ) -> IAMEvent:
-        """Create an IAM event."""
-        return IAMEvent(
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            event_id=str(uuid.uuid4()),
-            category=category,
-            action=action,
-            outcome=outcome,
-            actor=actor or self._default_actor,
-            subject=subject,
-            resource=resource,
-            message=message,
-            details=details or {},
-            trace_id=self._get_trace_id(),
-            duration_ms=duration_ms,
-            labels=labels or {},
+    ) -> PendingEvent:
+        """Capture an IAM event without serializing it."""
+        return PendingEvent(
+            time.time(),
+            category,
+            action,
+            outcome,
+            actor or self._default_actor,
+            subject,
+            resource,
+            message,
+            details,
+            self._get_trace_id(),
+            duration_ms,
+            labels,
         )
 
-    def _log_event(self, event: IAMEvent) -> None:
-        """Log an event."""
+    def _log_event(self, event: PendingEvent) -> None:
+        """Log an event, through the pipeline if there is one."""
+        aggregate = _binding_aggregate.get()
+        if aggregate is not None and event.subject.type in _BINDING_TYPES \
+                and event.outcome != EventOutcome.FAILURE:
+            aggregate.add(event)
+            return
+        if self.pipeline is not None:
+            self.pipeline.submit(event)
+            return
+        line = encode_event(event)
         if event.outcome == EventOutcome.FAILURE:
-            logger.error(event.to_json())
+            logger.error(line)
         else:
-            logger.info(event.to_json())
+            logger.info(line)
+
+    @contextmanager
+    def binding_events(self, owner_type: str, owner: str, namespace: Optional[str]) -> Iterator[None]:
+        """Log the binding changes of a block as a single event.
+
+        With aggregation enabled, RoleBinding and ClusterRoleBinding events
+        logged inside the block, including from threads started with
+        run_bounded, are collected and logged once the block ends as one
+        RBAC event with the affected bindings and counts per action.
+        Failures are still logged individually, and nested blocks join the
+        outermost one.
+
+        Args:
+            owner_type: Kind of the reconciled resource (User, Group)
+            owner: Name of the reconciled resource
+            namespace: Namespace of the reconciled resource
+        """
+        if not self.aggregate_bindings or _binding_aggregate.get() is not None:
+            yield
+            return
+        aggregate = BindingAggregate()
+        token = _binding_aggregate.set(aggregate)
+        try:
+            yield
+        finally:
+            _binding_aggregate.reset(token)
+            if aggregate.bindings:
+                self._log_event(self._binding_summary(owner_type, owner, namespace, aggregate))
+
+    def _binding_summary(self, owner_type: str, owner: str, namespace: Optional[str],
+                         aggregate: BindingAggregate) -> PendingEvent:
+        """Build the event summarizing collected binding changes."""
+        counts = {done.value: len(names) for done, names in aggregate.bindings.items()}
+        total = sum(counts.values())
+        action, verb = _AGGREGATE_ACTIONS.get(frozenset(aggregate.bindings), (EventAction.SYNC, "Reconciled"))
+        return self._create_event(
+            category=EventCategory.RBAC,
+            action=action,
+            outcome=EventOutcome.SUCCESS,
+            subject=Subject(type=owner_type, name=owner, namespace=namespace),
+            message=f"{verb} {total} binding(s) for {owner_type} '{owner}'",
+            details={
+                "count": total,
+                "counts": counts,
+                "bindings": {done.value: names for done, names in aggregate.bindings.items()},
+            },
+        )
 
     # ==================== User Events ====================
 
@@ -521,6 +784,46 @@ def generate_trace_id() -> str:
 _audit_logger: Optional[AuditLogger] = None
 
 
+def create_audit_pipeline(config: Optional[OperatorConfig] = None) -> Optional[AuditPipeline]:
+    """Create and start the audit pipeline selected by configuration.
+
+    With AUDIT_SPOOL_DIR set, the pipeline writes to the on-disk spool and
+    a replay reader forwards the spooled events to the configured sink.
+
+    Args:
+        config: Operator configuration; read from the environment if not provided
+
+    Returns:
+        The running pipeline, or None if AUDIT_QUEUE_SIZE is 0
+    """
+    config = config or get_config()
+    if config.audit_queue_size <= 0:
+        return None
+    sink: AuditSink = create_sink(config.audit_sink, config.audit_file_path, config.audit_http_url)
+    if config.audit_spool_dir:
+        replayer = SpoolReplayer(config.audit_spool_dir, sink, batch_size=config.audit_batch_size)
+        replayer.start()
+        sink = AuditSpool(
+            config.audit_spool_dir,
+            segment_bytes=config.audit_spool_segment_bytes,
+            segment_seconds=config.audit_spool_segment_seconds,
+            max_bytes=config.audit_spool_max_bytes,
+            retention_seconds=config.audit_spool_retention_seconds,
+            fsync_interval=config.audit_spool_fsync_interval_seconds,
+            replayer=replayer,
+        )
+    pipeline = AuditPipeline(
+        sink=sink,
+        serialize=encode_event,
+        max_queue=config.audit_queue_size,
+        batch_size=config.audit_batch_size,
+        flush_interval=config.audit_flush_interval_seconds,
+        overflow=config.audit_overflow_policy,
+    )
+    pipeline.start()
+    return pipeline
+
+
 def get_audit_logger() -> AuditLogger:
     """Get or create the global audit logger instance.
 
@@ -529,10 +832,22 @@ def get_audit_logger() -> AuditLogger:
     """
     global _audit_logger
     if _audit_logger is None:
-        _audit_logger = AuditLogger()
+        config = get_config()
+        _audit_logger = AuditLogger(
+            pipeline=create_audit_pipeline(config),
+            aggregate_bindings=config.audit_binding_events == "aggregate",
+        )
     return _audit_logger
 
 
+def shutdown_audit_logger() -> None:
+    """Write all queued audit events and stop the global pipeline."""
+    if _audit_logger is not None and _audit_logger.pipeline is not None:
+        _audit_logger.pipeline.stop()
+        # Anything logged after shutdown is written synchronously
+        _audit_logger.pipeline = None
+
+
 def configure_audit_logging(level: int = logging.INFO) -> None:
     """Configure the audit logger with appropriate handlers.
 
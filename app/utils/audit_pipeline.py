@@ -0,0 +1,317 @@
+"""Asynchronous, batched delivery of audit events.
+
+Audit events are captured on the reconcile thread as lightweight tuples
+and put on a bounded queue. A background writer drains the queue, turns
+the events into JSON lines in batches and hands each batch to a sink, so
+serialization and I/O never add to reconcile latency. When the queue is
+full, events are either dropped or the caller blocks for a bounded time,
+depending on the overflow policy.
+"""
+
+import json
+import logging
+import queue
+import sys
+import threading
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional, Protocol, TextIO
+
+from app.api.metrics import (
+    record_audit_events_dropped,
+    record_audit_events_written,
+    set_audit_queue_depth,
+)
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+
+_STOP = object()
+
+
+class AuditSink(Protocol):
+    """Destination of serialized audit events."""
+
+    name: str
+
+    def write(self, lines: List[str]) -> None:
+        """Write a batch of JSON lines."""
+        ...
+
+    def flush(self) -> None:
+        """Make written events durable; called while the writer is idle."""
+        ...
+
+    def close(self) -> None:
+        """Release the sink's resources."""
+        ...
+
+
+# Outcome of a failure event as both encoders write it. String values have
+# their quotes escaped, so this only matches the event's own outcome field.
+_FAILURE_OUTCOME = '"outcome": "failure", "actor": '
+
+
+class LogSink:
+    """Writes audit events through the "audit" logger.
+
+    Failure events are logged at ERROR and all others at INFO, as when
+    events were logged directly. The level is read from the line, so it
+    also survives a round trip through the spool.
+    """
+
+    name = "log"
+
+    def __init__(self, audit_logger: Optional[logging.Logger] = None):
+        """Initialize the sink.
+
+        Args:
+            audit_logger: Logger to write to; defaults to the "audit" logger
+        """
+        self._logger = audit_logger or logging.getLogger("audit")
+
+    def write(self, lines: List[str]) -> None:
+        """Log each line at the level of its outcome."""
+        for line in lines:
+            if _FAILURE_OUTCOME in line:
+                self._logger.error(line)
+            else:
+                self._logger.info(line)
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class StreamSink:
+    """Writes audit events as newline-delimited JSON to a stream."""
+
+    name = "stdout"
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Initialize the sink.
+
+        Args:
+            stream: Stream to write to; defaults to stdout
+        """
+        self._stream = stream or sys.stdout
+
+    def write(self, lines: List[str]) -> None:
+        """Write the batch and flush once."""
+        self._stream.write("\n".join(lines) + "\n")
+        self._stream.flush()
+
+    def flush(self) -> None:
+        """Nothing to flush; every batch is flushed when written."""
+
+    def close(self) -> None:
+        """Flush the stream."""
+        self._stream.flush()
+
+
+class FileSink(StreamSink):
+    """Appends audit events as newline-delimited JSON to a file."""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        """Initialize the sink.
+
+        Args:
+            path: Path of the file to append to
+        """
+        super().__init__(open(path, "a", encoding="utf-8"))
+        self.path = path
+
+    def close(self) -> None:
+        """Close the file."""
+        self._stream.close()
+
+
+class HttpSink:
+    """POSTs each batch of audit events as newline-delimited JSON."""
+
+    name = "http"
+
+    def __init__(self, url: str, timeout: float = 5.0,
+                 headers: Optional[Dict[str, str]] = None):
+        """Initialize the sink.
+
+        Args:
+            url: Endpoint receiving the batches
+            timeout: Request timeout in seconds
+            headers: Extra request headers (e.g. authorization)
+        """
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/x-ndjson", **(headers or {})}
+
+    def write(self, lines: List[str]) -> None:
+        """Send the batch in a single request.
+
+        Raises:
+            urllib.error.URLError: If the request fails or is rejected
+        """
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        request = urllib.request.Request(self.url, data=data, headers=self.headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def create_sink(kind: str, file_path: str = "", http_url: str = "") -> AuditSink:
+    """Create the sink selected by configuration.
+
+    Args:
+        kind: One of log, stdout, file, http
+        file_path: Path for the file sink
+        http_url: Endpoint for the http sink
+
+    Returns:
+        The sink
+
+    Raises:
+        ValueError: If the kind is unknown or its setting is missing
+    """
+    if kind == "log":
+        return LogSink()
+    if kind == "stdout":
+        return StreamSink()
+    if kind == "file":
+        if not file_path:
+            raise ValueError("AUDIT_FILE_PATH is required for the file audit sink")
+        return FileSink(file_path)
+    if kind == "http":
+        if not http_url:
+            raise ValueError("AUDIT_HTTP_URL is required for the http audit sink")
+        return HttpSink(http_url)
+    raise ValueError(f"Unknown audit sink '{kind}'")
+
+
+class AuditPipeline:
+    """Bounded queue of audit events drained by a background writer."""
+
+    def __init__(
+        self,
+        sink: AuditSink,
+        serialize: Callable[[Any], str] = json.dumps,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        overflow: str = OVERFLOW_DROP,
+        block_timeout: float = 5.0
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            sink: Destination of the serialized events
+            serialize: Function turning a queued event into a JSON line
+            max_queue: Maximum number of queued events
+            batch_size: Maximum number of events written at once
+            flush_interval: Longest time a queued event waits to be written
+            overflow: What to do when the queue is full: drop the event, or
+                      block the caller for up to block_timeout first
+            block_timeout: Seconds to wait for room with the block policy
+        """
+        if overflow not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f"Unknown audit overflow policy '{overflow}'")
+        self.sink = sink
+        self.serialize = serialize
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be written."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Write all queued events, then stop the writer and close the sink."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        self.sink.close()
+
+    def submit(self, event: Any) -> bool:
+        """Queue an event for writing.
+
+        Args:
+            event: Event to write; serialized on the writer thread
+
+        Returns:
+            True if queued, False if dropped because the queue was full
+        """
+        try:
+            if self.overflow == OVERFLOW_BLOCK:
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            record_audit_events_dropped("queue_full")
+            return False
+        return True
+
+    def _run(self) -> None:
+        """Write batches until a stop marker is drained."""
+        running = True
+        while running:
+            batch: List[Any] = []
+            try:
+                event = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush()
+                continue
+            while True:
+                if event is _STOP:
+                    running = False
+                    break
+                batch.append(event)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _flush(self) -> None:
+        """Let the sink flush while there is nothing to write."""
+        try:
+            self.sink.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush audit sink '{self.sink.name}': {e}")
+
+    def _write(self, batch: List[Any]) -> None:
+        """Serialize a batch and hand it to the sink."""
+        set_audit_queue_depth(self._queue.qsize())
+        if not batch:
+            return
+        try:
+            lines = [self.serialize(event) for event in batch]
+            self.sink.write(lines)
+        except Exception as e:
+            logger.warning(f"Dropped {len(batch)} audit event(s): {e}")
+            record_audit_events_dropped("sink_error", len(batch))
+            return
+        record_audit_events_written(self.sink.name, len(batch))
@@ -0,0 +1,363 @@
+"""Durable on-disk spool for audit events.
+
+The spool is an audit sink that appends events to numbered segment files
+in a local directory. A segment is sealed and a new one started once it
+reaches a size or age limit, and the oldest segments are deleted when the
+spool grows past its size or retention limits. Writes are handed to the
+OS once per batch and fsync'ed at most once per interval, so a slow disk
+doesn't add a sync per event.
+
+A replay reader streams the segments to the configured downstream sink
+and records how far it got in a checkpoint file. When the downstream sink
+is slow or down, events accumulate on disk instead of in memory and are
+delivered once it recovers. Delivery is at least once: events written
+after the last checkpoint are sent again after a restart.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from app.api.metrics import (
+    record_audit_events_dropped,
+    record_audit_events_written,
+    set_audit_spool_backlog,
+)
+from app.utils.audit_pipeline import AuditSink
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".ndjson"
+CHECKPOINT_FILE = "checkpoint"
+
+_WRITE_BUFFER_BYTES = 1024 * 1024
+
+
+def segment_name(sequence: int) -> str:
+    """Get the file name of a segment; names sort in write order."""
+    return f"{sequence:012d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str) -> List[str]:
+    """List the segment file names of a spool, oldest first."""
+    return sorted(
+        name for name in os.listdir(directory)
+        if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit()
+    )
+
+
+def read_checkpoint(directory: str) -> Tuple[str, int]:
+    """Get the segment and offset up to which a spool has been replayed.
+
+    Returns:
+        The segment name and byte offset, or ("", 0) if nothing was replayed
+    """
+    try:
+        with open(os.path.join(directory, CHECKPOINT_FILE), encoding="utf-8") as f:
+            segment, offset = f.read().split()
+        return segment, int(offset)
+    except (FileNotFoundError, ValueError):
+        return "", 0
+
+
+def _write_checkpoint(directory: str, segment: str, offset: int) -> None:
+    """Atomically record the replay position."""
+    path = os.path.join(directory, CHECKPOINT_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(f"{segment} {offset}\n")
+    os.replace(path + ".tmp", path)
+
+
+def _count_lines(path: str, offset: int = 0) -> int:
+    """Count the events in a segment after a byte offset."""
+    count = 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for chunk in iter(lambda: f.read(_WRITE_BUFFER_BYTES), b""):
+            count += chunk.count(b"\n")
+    return count
+
+
+class AuditSpool:
+    """Append-only, segment-rotated audit sink on local disk."""
+
+    name = "spool"
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 16 * 1024 * 1024,
+        segment_seconds: float = 300,
+        max_bytes: int = 1024 * 1024 * 1024,
+        retention_seconds: float = 7 * 24 * 3600,
+        fsync_interval: float = 1.0,
+        replayer: Optional["SpoolReplayer"] = None
+    ):
+        """Initialize the spool.
+
+        Args:
+            directory: Directory holding the segments, created if missing
+            segment_bytes: Size at which a segment is sealed
+            segment_seconds: Age at which a segment is sealed
+            max_bytes: Total size above which the oldest segments are deleted
+                       (0 for no limit)
+            retention_seconds: Age above which sealed segments are deleted
+                               (0 for no limit)
+            fsync_interval: Longest time written events stay unsynced
+            replayer: Replay reader of this spool, stopped when the spool
+                      is closed
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.max_bytes = max_bytes
+        self.retention_seconds = retention_seconds
+        self.fsync_interval = fsync_interval
+        self.replayer = replayer
+        existing = list_segments(directory)
+        # Never append to a segment of a previous run; it may end in a torn line
+        self._sequence = int(existing[-1][:-len(SEGMENT_SUFFIX)]) if existing else 0
+        self._file = None
+        self._segment = ""
+        self._size = 0
+        self._opened_at = 0.0
+        self._synced_at = 0.0
+        self._dirty = False
+
+    def write(self, lines: List[str]) -> None:
+        """Append a batch to the active segment."""
+        if self._file is None or self._size >= self.segment_bytes or \
+                time.monotonic() - self._opened_at >= self.segment_seconds:
+            self._rotate()
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        self._file.write(data)
+        # Hand the batch to the OS so the replay reader sees it
+        self._file.flush()
+        self._size += len(data)
+        self._dirty = True
+        if time.monotonic() - self._synced_at >= self.fsync_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Fsync events written since the last sync."""
+        if self._file is None or not self._dirty:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+        self._synced_at = time.monotonic()
+
+    def close(self) -> None:
+        """Seal the active segment, then stop the replay reader."""
+        self._seal()
+        if self.replayer is not None:
+            self.replayer.stop()
+
+    def _seal(self) -> None:
+        """Sync and close the active segment."""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start the next one."""
+        self._seal()
+        self._sequence += 1
+        self._segment = segment_name(self._sequence)
+        self._file = open(os.path.join(self.directory, self._segment), "ab", buffering=_WRITE_BUFFER_BYTES)
+        self._size = 0
+        self._opened_at = time.monotonic()
+        self._sync_directory()
+        self._enforce_retention()
+
+    def _sync_directory(self) -> None:
+        """Fsync the directory so a new segment survives a crash."""
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _enforce_retention(self) -> None:
+        """Delete the oldest sealed segments over the size or age limit.
+
+        Events in deleted segments that weren't replayed yet are counted
+        as dropped.
+        """
+        sizes = {}
+        for name in list_segments(self.directory):
+            if name == self._segment:
+                continue
+            try:
+                sizes[name] = os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                # Replayed and deleted meanwhile
+                continue
+        total = sum(sizes.values()) + self._size
+        cutoff = time.time() - self.retention_seconds
+        replayed_segment, replayed_offset = read_checkpoint(self.directory)
+        for name, size in sizes.items():
+            path = os.path.join(self.directory, name)
+            try:
+                too_big = self.max_bytes and total > self.max_bytes
+                too_old = self.retention_seconds and os.path.getmtime(path) < cutoff
+                if not (too_big or too_old):
+                    break
+                if name >= replayed_segment:
+                    offset = replayed_offset if name == replayed_segment else 0
+                    lost = _count_lines(path, offset)
+                    if lost:
+                        logger.warning(f"Deleting audit spool segment {name} with {lost} unreplayed event(s)")
+                        record_audit_events_dropped("retention", lost)
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class SpoolReplayer:
+    """Streams spooled audit events to a downstream sink."""
+
+    def __init__(
+        self,
+        directory: str,
+        sink: AuditSink,
+        batch_size: int = 200,
+        poll_interval: float = 1.0,
+        retry_interval: float = 5.0
+    ):
+        """Initialize the reader.
+
+        Args:
+            directory: Directory of the spool
+            sink: Downstream sink the events are replayed to
+            batch_size: Maximum number of events sent at once
+            poll_interval: Time between checks for new events
+            retry_interval: Time to wait after the sink failed
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.sink = sink
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self._segment, self._offset = read_checkpoint(directory)
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start replaying in the background."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-replay", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the reader, replay what is left and close the sink."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        try:
+            self.replay()
+        except Exception as e:
+            logger.warning(f"Audit events left in spool {self.directory}: {e}")
+        self.sink.close()
+
+    def replay(self) -> int:
+        """Send every complete event written so far to the sink.
+
+        A sealed segment is deleted once it has been fully sent. The active
+        segment is read up to its last complete line.
+
+        Returns:
+            The number of events sent
+
+        Raises:
+            Exception: Whatever the sink raised; the failed batch is sent
+                       again on the next call
+        """
+        sent = 0
+        while True:
+            pending = [name for name in list_segments(self.directory) if name >= self._segment]
+            if not pending:
+                break
+            if pending[0] != self._segment:
+                self._segment, self._offset = pending[0], 0
+            path = os.path.join(self.directory, self._segment)
+            lines, end = self._read(path)
+            if lines:
+                self.sink.write(lines)
+                self._offset = end
+                _write_checkpoint(self.directory, self._segment, self._offset)
+                record_audit_events_written(self.sink.name, len(lines))
+                sent += len(lines)
+                continue
+            if len(pending) == 1:
+                break
+            # A newer segment exists, so this one is sealed and fully sent
+            try:
+                if os.path.getsize(path) > self._offset:
+                    logger.warning(f"Discarding torn audit event at the end of spool segment {self._segment}")
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._segment, self._offset = pending[1], 0
+            _write_checkpoint(self.directory, self._segment, self._offset)
+        set_audit_spool_backlog(self.backlog())
+        return sent
+
+    def backlog(self) -> int:
+        """Get the number of spooled bytes not replayed yet."""
+        total = 0
+        for name in list_segments(self.directory):
+            if name < self._segment:
+                continue
+            try:
+                total += os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            if name == self._segment:
+                total -= self._offset
+        return max(0, total)
+
+    def _read(self, path: str) -> Tuple[List[str], int]:
+        """Read up to a batch of complete lines after the replay offset.
+
+        Returns:
+            The lines and the offset just after the last of them
+        """
+        lines: List[str] = []
+        end = self._offset
+        try:
+            with open(path, "rb") as f:
+                f.seek(self._offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    end += len(raw)
+                    lines.append(raw[:-1].decode("utf-8"))
+                    if len(lines) >= self.batch_size:
+                        break
+        except FileNotFoundError:
+            # Deleted by retention while being read
+            pass
+        return lines, end
+
+    def _run(self) -> None:
+        """Replay until stopped, backing off while the sink fails."""
+        while not self._stopping.is_set():
+            try:
+                sent = self.replay()
+            except Exception as e:
+                logger.warning(f"Failed to replay audit events to '{self.sink.name}': {e}")
+                self._stopping.wait(self.retry_interval)
+                continue
+            if not sent:
+                self._stopping.wait(self.poll_interval)
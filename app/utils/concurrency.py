@@ -0,0 +1,55 @@
+"""Bounded concurrent execution of independent reconcile steps.
+
+Reconciling a User or Group touches many independent objects (one binding
+per CRoles/Roles entry). This module runs those steps on a bounded thread
+pool and collects per-item failures instead of aborting on the first one.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Task = Tuple[str, Callable[[], None]]
+
+
+def run_bounded(tasks: Sequence[Task], max_workers: int) -> Dict[str, Exception]:
+    """Run independent tasks with at most max_workers in flight.
+
+    Every task is attempted even if others fail. With a single task or a
+    concurrency limit of 1 the tasks run inline on the calling thread.
+    Pooled tasks run in a copy of the caller's context, so they are
+    attributed to the caller's reconcile.
+
+    Args:
+        tasks: Sequence of (key, callable) pairs; keys identify failures
+        max_workers: Maximum number of tasks running at the same time
+
+    Returns:
+        Dict mapping the key of each failed task to its exception
+    """
+    failures: Dict[str, Exception] = {}
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        for key, task in tasks:
+            try:
+                task()
+            except Exception as e:
+                failures[key] = e
+        return failures
+
+    workers = min(max_workers, len(tasks))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reconcile") as pool:
+        futures = [
+            (key, pool.submit(contextvars.copy_context().run, task))
+            for key, task in tasks
+        ]
+        for key, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                failures[key] = e
+
+    return failures
@@ -0,0 +1,264 @@
+"""Per-reconcile instrumentation.
+
+Each handler invocation runs inside a reconcile context held in a context
+variable. Kopf runs sync handlers with a copy of the caller's context and
+``run_bounded`` copies it into its worker threads, so phases of the
+reconcile and the Kubernetes API calls it makes are attributed to it
+without passing it through every service and repository call.
+"""
+
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from app.api.metrics import (
+    observe_handler_duration,
+    observe_kube_api_request,
+    observe_reconcile_api_calls,
+    observe_reconcile_phase,
+    record_handler_error,
+    record_reconciliation,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconcileContext:
+    """Running totals of one handler invocation."""
+
+    handler: str
+    resource_type: str
+    action: str
+    api_calls: int = 0
+    outcome: str = "success"
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def count_api_call(self) -> None:
+        """Count one Kubernetes API call."""
+        with self._lock:
+            self.api_calls += 1
+
+    def fail(self, error_type: str) -> None:
+        """Mark the reconcile as failed."""
+        self.outcome = "error"
+        record_handler_error(self.handler, error_type)
+
+
+_current: ContextVar[Optional[ReconcileContext]] = ContextVar("reconcile_context", default=None)
+
+
+def current_reconcile() -> Optional[ReconcileContext]:
+    """Get the reconcile context of the running handler, if any."""
+    return _current.get()
+
+
+def reconcile_labels(kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    """Get the (resource_type, action) metric labels from Kopf kwargs.
+
+    Args:
+        kwargs: Keyword arguments Kopf passed to the handler
+
+    Returns:
+        The resource kind and the reason of the invocation
+    """
+    resource = kwargs.get("resource")
+    resource_type = getattr(resource, "kind", None) or getattr(resource, "plural", None) or "unknown"
+    reason = kwargs.get("reason")
+    action = getattr(reason, "value", reason) or "unknown"
+    return str(resource_type), str(action)
+
+
+def _failure(result: Any) -> Optional[str]:
+    """Get the error type of a failed handler result, or None on success.
+
+    Handlers report failures in their returned status rather than raising.
+    """
+    if not isinstance(result, dict):
+        return None
+    if "error" in result:
+        return "validation" if "field" in result else "reconcile"
+    if result.get("status") == "error":
+        return "reconcile"
+    return None
+
+
+@contextmanager
+def reconcile(handler: str, resource_type: str, action: str) -> Iterator[ReconcileContext]:
+    """Run a block as one reconcile, recording its duration and API calls.
+
+    Args:
+        handler: Name of the handler
+        resource_type: Kind of the reconciled resource
+        action: Reason of the invocation (create, update, delete, ...)
+
+    Yields:
+        The reconcile context
+    """
+    context = ReconcileContext(handler, resource_type, action)
+    token = _current.set(context)
+    start = time.monotonic()
+    try:
+        yield context
+    except Exception as e:
+        context.fail(type(e).__name__)
+        raise
+    finally:
+        _current.reset(token)
+        duration = time.monotonic() - start
+        observe_handler_duration(handler, action, duration)
+        record_reconciliation(resource_type, action, context.outcome, duration)
+        observe_reconcile_api_calls(resource_type, action, context.api_calls)
+
+
+def instrument(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator recording reconcile metrics for a blocking Kopf handler.
+
+    Failures returned in the handler's status dict count as errors, just
+    like raised exceptions.
+    """
+    name = handler.__name__
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        resource_type, action = reconcile_labels(kwargs)
+        with reconcile(name, resource_type, action) as context:
+            result = handler(*args, **kwargs)
+            error_type = _failure(result)
+            if error_type:
+                context.fail(error_type)
+            return result
+
+    return wrapper
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time one phase of the running reconcile.
+
+    Outside a reconcile (e.g. in the rotation CLI) nothing is recorded.
+
+    Args:
+        name: Phase name (validate, service_account, namespace, rbac, kubeconfig)
+    """
+    context = _current.get()
+    if context is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        observe_reconcile_phase(context.resource_type, name, time.monotonic() - start)
+
+
+# Verbs of the generated client methods, longest first so delete_collection wins
+_VERBS = ("delete_collection", "list", "read", "create", "patch", "replace", "delete")
+
+_span_events = False
+
+
+def enable_span_events() -> None:
+    """Attach an event to the current tracing span for every API call."""
+    global _span_events
+    _span_events = True
+
+
+def parse_operation(method: str) -> Tuple[str, str]:
+    """Get the (verb, resource) of a generated client method name.
+
+    For example ``list_namespaced_role_binding`` gives ``("list",
+    "role_binding")``. Custom object methods give the ``custom_object``
+    resource, which callers replace with the plural they were passed.
+
+    Args:
+        method: Name of the client method
+
+    Returns:
+        The verb and the resource
+    """
+    for verb in _VERBS:
+        if method.startswith(verb + "_"):
+            resource = method[len(verb) + 1:]
+            break
+    else:
+        return method, ""
+    if resource.startswith("namespaced_"):
+        resource = resource[len("namespaced_"):]
+    if resource == "cluster_custom_object":
+        resource = "custom_object"
+    if resource.endswith("_for_all_namespaces"):
+        resource = resource[:-len("_for_all_namespaces")]
+    return verb, resource
+
+
+def _status_code(error: Exception) -> str:
+    """Get the status code label of a failed API call."""
+    status = getattr(error, "status", None)
+    return str(status) if status else "error"
+
+
+class InstrumentedApi:
+    """Proxy around a Kubernetes API object instrumenting every call.
+
+    Each call is counted against the current reconcile and its latency is
+    observed by verb, resource and status code. Successful calls are
+    recorded as ``2xx`` since the client doesn't expose the exact code.
+    Wrapped methods keep their name and docstring, which the watch helper
+    reads to pick the return type.
+    """
+
+    def __init__(self, api: Any):
+        """Initialize the proxy.
+
+        Args:
+            api: Kubernetes API object, e.g. a CoreV1Api
+        """
+        self._api = api
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        verb, resource = parse_operation(name)
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            call_verb = "watch" if kwargs.get("watch") else verb
+            call_resource = kwargs.get("plural", resource) if resource == "custom_object" else resource
+            context = _current.get()
+            if context is not None:
+                context.count_api_call()
+
+            code = "2xx"
+            start = time.monotonic()
+            try:
+                return attr(*args, **kwargs)
+            except Exception as e:
+                code = _status_code(e)
+                raise
+            finally:
+                duration = time.monotonic() - start
+                observe_kube_api_request(call_verb, call_resource, code, duration)
+                if _span_events:
+                    _add_span_event(call_verb, call_resource, code, duration)
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
+
+
+def _add_span_event(verb: str, resource: str, code: str, duration: float) -> None:
+    """Record an API call on the current tracing span."""
+    from opentelemetry import trace
+
+    trace.get_current_span().add_event("k8s.api_call", {
+        "k8s.verb": verb,
+        "k8s.resource": resource,
+        "http.status_code": code,
+        "duration_ms": round(duration * 1000, 3),
+    })
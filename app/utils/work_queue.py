@@ -0,0 +1,148 @@
+"""Debounced, deduplicating work queue for reconciles.
+
+A burst of events (for example many namespaces created at once by a chart)
+can trigger the same reconcile many times. This module collects work items
+by key for a short window and processes each key once with its latest
+payload, so N events for the same owner collapse into a single reconcile.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from app.api.metrics import record_queue_enqueue, set_queue_depth
+
+logger = logging.getLogger(__name__)
+
+Processor = Callable[[Hashable, Any], None]
+
+
+class CoalescingQueue:
+    """Keyed work queue that merges items enqueued within a window.
+
+    The first enqueue of a key schedules it window_seconds in the future.
+    Further enqueues of the same key before then only replace the payload,
+    so latency is bounded by the window no matter how many events arrive.
+    """
+
+    def __init__(self, name: str, processor: Processor, window_seconds: float = 2.0):
+        """Initialize the queue.
+
+        Args:
+            name: Queue name used as the metric label and thread name
+            processor: Function called as processor(key, payload) per item
+            window_seconds: How long to wait for more events for a key
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self._processor = processor
+        self._pending: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"queue-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Work queue '{self.name}' started")
+
+    def stop(self) -> None:
+        """Stop the worker thread, processing whatever is still pending."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+        logger.info(f"Work queue '{self.name}' stopped")
+
+    # ==================== Queueing ====================
+
+    def enqueue(self, key: Hashable, payload: Any = None) -> bool:
+        """Add a work item, merging it with a pending item of the same key.
+
+        Args:
+            key: Identity of the work item (e.g. the owner object)
+            payload: Latest state to process for the key
+
+        Returns:
+            True if the item was newly queued, False if it was coalesced
+        """
+        with self._cond:
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._pending[key] = (payload, pending[1])
+                coalesced = True
+            else:
+                self._pending[key] = (payload, time.monotonic() + self.window_seconds)
+                coalesced = False
+                self._cond.notify_all()
+            depth = len(self._pending)
+
+        record_queue_enqueue(self.name, coalesced)
+        set_queue_depth(self.name, depth)
+        return not coalesced
+
+    @property
+    def depth(self) -> int:
+        """Number of keys waiting to be processed."""
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self) -> None:
+        """Process every pending item now, on the calling thread."""
+        self._process(self._take(due_only=False))
+
+    # ==================== Worker ====================
+
+    def _run(self) -> None:
+        """Worker loop processing items as their window expires."""
+        while True:
+            with self._cond:
+                while self._running:
+                    timeout = self._next_due_in()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+            self._process(self._take(due_only=True))
+
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest pending item is due, or None if empty."""
+        if not self._pending:
+            return None
+        return min(due for _, due in self._pending.values()) - time.monotonic()
+
+    def _take(self, due_only: bool) -> List[Tuple[Hashable, Any]]:
+        """Remove and return pending items, optionally only those that are due."""
+        now = time.monotonic()
+        with self._cond:
+            keys = [
+                key for key, (_, due) in self._pending.items()
+                if not due_only or due <= now
+            ]
+            items = [(key, self._pending.pop(key)[0]) for key in keys]
+            depth = len(self._pending)
+        if items:
+            set_queue_depth(self.name, depth)
+        return items
+
+    def _process(self, items: List[Tuple[Hashable, Any]]) -> None:
+        """Run the processor for each item, logging failures."""
+        for key, payload in items:
+            try:
+                self._processor(key, payload)
+            except Exception as e:
+                logger.exception(f"Work queue '{self.name}' failed to process {key}: {e}")
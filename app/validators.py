@@ -4,8 +4,12 @@ This module provides validation functions for CRD inputs,
 ensuring DNS compliance and security constraints.
 """
 
+import functools
 import re
-from typing import List, Optional, Set
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, List, Mapping, Optional, Set
 
 from app.exceptions import ValidationError
 
@@ -32,6 +36,21 @@ VALID_VERBS: Set[str] = {
     'deletecollection', 'use', 'bind', 'escalate', 'impersonate', '*',
 }
 
+# Kubernetes resource quantities (e.g., "4", "2000m", "8Gi")
+QUANTITY_PATTERN = re.compile(r'^[0-9]+(\.[0-9]+)?(m|Ki|Mi|Gi|Ti|Pi|Ei|k|M|G|T|P|E)?$')
+
+# Namespace quota fields that are validated
+QUOTA_FIELDS = (
+    "cpu", "memory", "pods", "services",
+    "persistentvolumeclaims", "secrets", "configmaps",
+)
+
+VALID_USER_TYPES: Set[str] = {"human", "serviceAccount"}
+VALID_NETWORK_POLICIES: Set[str] = {"none", "isolated", "restricted"}
+
+# Number of validated User/Group specs remembered
+SPEC_CACHE_SIZE = 256
+
 
 def validate_dns_label(value: str, field_name: str = "name") -> str:
     """Validate a DNS-1123 label (e.g., namespace name, service account name).
@@ -177,6 +196,26 @@ def validate_role_name(name: str) -> str:
     return validate_kubernetes_name(name, "role_name")
 
 
+def _memoized(validate: Callable[[str], str]) -> Callable[[Any], str]:
+    """Memoize a name validator for string values.
+
+    Specs repeat the same role, namespace and group names many times, and
+    the same names come back on every reconcile. Only valid names are
+    remembered; invalid ones raise again with a fresh error.
+    """
+    cached = functools.lru_cache(maxsize=4096)(validate)
+
+    def check(value: Any) -> str:
+        return cached(value) if isinstance(value, str) else validate(value)
+
+    return check
+
+
+_role_name = _memoized(validate_role_name)
+_group_name = _memoized(validate_group_name)
+_binding_namespace = _memoized(functools.partial(validate_namespace, allow_reserved=True))
+
+
 def validate_cluster_role_reference(cluster_role: str, namespace: Optional[str] = None) -> dict:
     """Validate a cluster role reference in CRoles spec.
 
@@ -235,7 +274,9 @@ def validate_croles_spec(croles: List[dict]) -> List[dict]:
         namespace = crole.get("namespace")
         group = crole.get("group")
 
-        entry = validate_cluster_role_reference(cluster_role, namespace)
+        entry = {"clusterRole": _role_name(cluster_role)}
+        if namespace:
+            entry["namespace"] = _binding_namespace(namespace)
 
         # Check for duplicates
         binding_key = (entry.get("namespace", ""), entry["clusterRole"])
@@ -247,7 +288,7 @@ def validate_croles_spec(croles: List[dict]) -> List[dict]:
         seen_bindings.add(binding_key)
 
         if group:
-            entry["group"] = validate_group_name(group)
+            entry["group"] = _group_name(group)
 
         validated.append(entry)
 
@@ -279,7 +320,7 @@ def validate_roles_spec(roles: List[str]) -> List[str]:
                 "Each role must be a string"
             )
 
-        validated_role = validate_role_name(role)
+        validated_role = _role_name(role)
 
         if validated_role in seen_roles:
             raise ValidationError(
@@ -388,11 +429,10 @@ def validate_user_type(user_type: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    valid_types = {"human", "serviceAccount"}
-    if user_type not in valid_types:
+    if user_type not in VALID_USER_TYPES:
         raise ValidationError(
             "type",
-            f"type must be one of: {', '.join(valid_types)}",
+            f"type must be one of: {', '.join(VALID_USER_TYPES)}",
             user_type
         )
     return user_type
@@ -411,11 +451,7 @@ def validate_resource_quantity(value: str, field_name: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    # Pattern for Kubernetes resource quantities
-    quantity_pattern = re.compile(
-        r'^[0-9]+(\.[0-9]+)?(m|Ki|Mi|Gi|Ti|Pi|Ei|k|M|G|T|P|E)?$'
-    )
-    if not quantity_pattern.match(value):
+    if not QUANTITY_PATTERN.match(value):
         raise ValidationError(
             field_name,
             f"Invalid resource quantity format: {value}",
@@ -460,11 +496,7 @@ def _validate_quota(quota: dict) -> dict:
     if not isinstance(quota, dict):
         raise ValidationError("namespaceConfig.quota", "quota must be an object")
     validated_quota = {}
-    quota_fields = [
-        "cpu", "memory", "pods", "services",
-        "persistentvolumeclaims", "secrets", "configmaps"
-    ]
-    for field in quota_fields:
+    for field in QUOTA_FIELDS:
         if field in quota:
             validated_quota[field] = validate_resource_quantity(
                 quota[field], f"namespaceConfig.quota.{field}"
@@ -484,11 +516,10 @@ def _validate_network_policy(network_policy: str) -> str:
     Raises:
         ValidationError: If validation fails
     """
-    valid_policies = {"none", "isolated", "restricted"}
-    if network_policy not in valid_policies:
+    if network_policy not in VALID_NETWORK_POLICIES:
         raise ValidationError(
             "namespaceConfig.networkPolicy",
-            f"networkPolicy must be one of: {', '.join(valid_policies)}",
+            f"networkPolicy must be one of: {', '.join(VALID_NETWORK_POLICIES)}",
             network_policy
         )
     return network_policy
@@ -526,18 +557,109 @@ def validate_namespace_config(config: dict) -> dict:
     return validated
 
 
-def validate_user_spec(spec: dict) -> dict:
+class SpecCache:
+    """LRU of validated specs, so unchanged objects skip validation."""
+
+    def __init__(self, max_entries: int = SPEC_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of validated specs remembered
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Mapping[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Mapping[str, Any]]:
+        """Get the validated spec stored under a key."""
+        with self._lock:
+            validated = self._entries.get(key)
+            if validated is not None:
+                self._entries.move_to_end(key)
+            return validated
+
+    def put(self, key: Hashable, validated: Mapping[str, Any]) -> None:
+        """Remember a validated spec, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = validated
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every validated spec."""
+        with self._lock:
+            self._entries.clear()
+
+
+_spec_cache = SpecCache()
+
+
+def _spec_key(kind: str, metadata: Optional[dict]) -> Optional[Hashable]:
+    """Get the memoization key of a spec.
+
+    The API server bumps metadata.generation on every spec change, so an
+    object's uid and generation identify its spec without reading it.
+    Hashing the spec instead would cost about as much as validating it.
+
+    Returns:
+        The key, or None without a uid and generation
+    """
+    if not metadata:
+        return None
+    uid, generation = metadata.get("uid"), metadata.get("generation")
+    if not uid or generation is None:
+        return None
+    return (kind, uid, generation)
+
+
+def _freeze(value: Any) -> Any:
+    """Make a validated spec read-only: dicts become mappings, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _memoized_spec(kind: str, validate: Callable[[Any], dict], spec: Any,
+                   metadata: Optional[dict]) -> Mapping[str, Any]:
+    """Validate a spec unless the same object generation was validated before.
+
+    Cached specs are frozen, since every caller for the same generation
+    gets the same object.
+    """
+    key = _spec_key(kind, metadata)
+    if key is None:
+        return validate(spec)
+    validated = _spec_cache.get(key)
+    if validated is None:
+        validated = _freeze(validate(spec))
+        _spec_cache.put(key, validated)
+    return validated
+
+
+def validate_user_spec(spec: dict, metadata: Optional[dict] = None) -> Mapping[str, Any]:
     """Validate a complete User CRD spec.
 
+    Valid specs are remembered by object uid and generation, so
+    reconciling an unchanged User again skips validation.
+
     Args:
         spec: The spec dict to validate
+        metadata: The object's metadata; its uid and generation key the cache
 
     Returns:
-        Validated spec dict
+        Validated spec; read-only and shared between calls when memoized
 
     Raises:
         ValidationError: If validation fails
     """
+    return _memoized_spec("User", _validate_user_spec, spec, metadata)
+
+
+def _validate_user_spec(spec: dict) -> dict:
+    """Validate a complete User CRD spec without memoization."""
     if not isinstance(spec, dict):
         raise ValidationError("spec", "spec must be an object")
 
@@ -575,18 +697,26 @@ def validate_user_spec(spec: dict) -> dict:
     return validated
 
 
-def validate_group_spec(spec: dict) -> dict:
+def validate_group_spec(spec: dict, metadata: Optional[dict] = None) -> Mapping[str, Any]:
     """Validate a complete Group CRD spec.
 
+    Memoized like validate_user_spec.
+
     Args:
         spec: The spec dict to validate
+        metadata: The object's metadata; its uid and generation key the cache
 
     Returns:
-        Validated spec dict
+        Validated spec; read-only and shared between calls when memoized
 
     Raises:
         ValidationError: If validation fails
     """
+    return _memoized_spec("Group", _validate_group_spec, spec, metadata)
+
+
+def _validate_group_spec(spec: dict) -> dict:
+    """Validate a complete Group CRD spec without memoization."""
     if not isinstance(spec, dict):
         raise ValidationError("spec", "spec must be an object")
 
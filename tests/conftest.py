@@ -58,6 +58,7 @@ def mock_secret_repo():
     mock_token = MagicMock()
     mock_token.data = {"token": "dGVzdC10b2tlbg=="}  # base64 of "test-token"
     repo.get.return_value = mock_token
+    repo.wait_for_token.return_value = mock_token.data["token"]
 
     # Mock CA configmap
     mock_ca = MagicMock()
@@ -79,6 +80,8 @@ def mock_rbac_repo():
     repo.find_cluster_role_bindings_for_subject.return_value = []
     repo.list_role_bindings.return_value = []
     repo.list_cluster_role_bindings.return_value = []
+    repo.create_or_update_role_binding.return_value = "created"
+    repo.create_or_update_cluster_role_binding.return_value = "created"
     return repo
 
 
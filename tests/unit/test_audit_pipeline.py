@@ -0,0 +1,125 @@
+"""Unit tests for the asynchronous audit pipeline."""
+
+import json
+import logging
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.utils.audit import AuditLogger, encode_event
+from app.utils.audit_pipeline import OVERFLOW_DROP, AuditPipeline, LogSink, create_sink
+
+
+class RecordingSink:
+    """Sink keeping every written batch."""
+
+    name = "recording"
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.closed = False
+
+    def write(self, lines):
+        if self.fail:
+            raise IOError("collector down")
+        self.batches.append(list(lines))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def dropped(reason):
+    """Read the dropped events counter."""
+    return REGISTRY.get_sample_value(
+        "k8s_iam_operator_audit_events_dropped_total", {"reason": reason}
+    ) or 0
+
+
+class TestAuditPipeline:
+    """Tests for queueing and batched writing."""
+
+    def test_stop_writes_queued_events_in_batches(self):
+        """Test that stopping drains the queue in batches and closes the sink."""
+        sink = RecordingSink()
+        pipeline = AuditPipeline(sink, serialize=str, batch_size=2, flush_interval=0.01)
+        for i in range(5):
+            pipeline.submit(i)
+
+        pipeline.start()
+        pipeline.stop()
+
+        assert [line for batch in sink.batches for line in batch] == ["0", "1", "2", "3", "4"]
+        assert max(len(batch) for batch in sink.batches) <= 2
+        assert sink.closed
+
+    def test_full_queue_drops_events(self):
+        """Test that the drop policy rejects events once the queue is full."""
+        pipeline = AuditPipeline(RecordingSink(), max_queue=1, overflow=OVERFLOW_DROP)
+        before = dropped("queue_full")
+
+        assert pipeline.submit("a") is True
+        assert pipeline.submit("b") is False
+        assert dropped("queue_full") - before == 1
+
+    def test_sink_errors_count_dropped_events(self):
+        """Test that a failing sink loses the batch without stopping the writer."""
+        pipeline = AuditPipeline(RecordingSink(fail=True), serialize=str, flush_interval=0.01)
+        before = dropped("sink_error")
+        pipeline.submit("a")
+
+        pipeline.start()
+        pipeline.stop()
+
+        assert dropped("sink_error") - before == 1
+
+    def test_unknown_policy_rejected(self):
+        """Test that a misspelled overflow policy fails fast."""
+        with pytest.raises(ValueError):
+            AuditPipeline(RecordingSink(), overflow="wait")
+
+    def test_unknown_sink_rejected(self):
+        """Test that unknown or incomplete sink settings fail fast."""
+        with pytest.raises(ValueError):
+            create_sink("kafka")
+        with pytest.raises(ValueError):
+            create_sink("http")
+
+
+class TestAuditLoggerPipeline:
+    """Tests for the AuditLogger side of the pipeline."""
+
+    def test_events_are_serialized_by_the_writer(self):
+        """Test that logging only queues the event and the writer encodes it."""
+        sink = RecordingSink()
+        pipeline = AuditPipeline(sink, serialize=encode_event, flush_interval=0.01)
+        audit = AuditLogger(pipeline=pipeline)
+
+        audit.log_delete(resource_type="RoleBinding", name="rb", namespace="ns")
+        assert pipeline.depth == 1
+
+        pipeline.start()
+        pipeline.stop()
+
+        event = json.loads(sink.batches[0][0])
+        assert event["subject"] == {"type": "RoleBinding", "name": "rb", "namespace": "ns", "uid": None}
+        assert event["action"] == "delete"
+        assert event["event_id"] and event["timestamp"]
+
+    def test_log_sink_keeps_failures_at_error(self, caplog):
+        """Test that failure events are still logged at ERROR through the pipeline."""
+        pipeline = AuditPipeline(LogSink(), serialize=encode_event, flush_interval=0.01)
+        audit = AuditLogger(pipeline=pipeline)
+
+        audit.log_error(operation="create", resource_type="User", name="alice", error="boom")
+        audit.log_delete(resource_type="RoleBinding", name="rb", namespace="ns",
+                         details={"outcome": "failure"})
+        with caplog.at_level(logging.INFO, logger="audit"):
+            pipeline.start()
+            pipeline.stop()
+
+        levels = [(json.loads(r.getMessage())["action"], r.levelno) for r in caplog.records]
+        assert levels == [("error", logging.ERROR), ("delete", logging.INFO)]
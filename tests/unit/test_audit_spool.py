@@ -0,0 +1,162 @@
+"""Unit tests for the on-disk audit spool and its replay reader."""
+
+import os
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.utils.audit_spool import (
+    AuditSpool,
+    SpoolReplayer,
+    list_segments,
+    read_checkpoint,
+    segment_name,
+)
+
+
+class RecordingSink:
+    """Sink keeping every written batch."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+        self.closed = False
+
+    def write(self, lines):
+        if self.fail:
+            raise IOError("collector down")
+        self.batches.append(list(lines))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    @property
+    def lines(self):
+        return [line for batch in self.batches for line in batch]
+
+
+class TestAuditSpool:
+    """Tests for writing, rotation and retention."""
+
+    def test_rotates_segments_by_size(self, tmp_path):
+        """Test that a full segment is sealed and the next batch starts a new one."""
+        spool = AuditSpool(str(tmp_path), segment_bytes=5)
+
+        spool.write(["event-1"])
+        spool.write(["event-2", "event-3"])
+        spool.close()
+
+        assert list_segments(str(tmp_path)) == [segment_name(1), segment_name(2)]
+        assert (tmp_path / segment_name(2)).read_text() == "event-2\nevent-3\n"
+
+    def test_restart_starts_new_segment(self, tmp_path):
+        """Test that a new spool never appends to a previous run's segment."""
+        (tmp_path / segment_name(7)).write_text("old\ntorn")
+
+        spool = AuditSpool(str(tmp_path))
+        spool.write(["new"])
+        spool.close()
+
+        assert list_segments(str(tmp_path)) == [segment_name(7), segment_name(8)]
+
+    def test_size_retention_drops_oldest_unreplayed_segments(self, tmp_path):
+        """Test that segments over the size limit are deleted and counted."""
+        before = REGISTRY.get_sample_value(
+            "k8s_iam_operator_audit_events_dropped_total", {"reason": "retention"}) or 0
+        spool = AuditSpool(str(tmp_path), segment_bytes=1, max_bytes=1)
+
+        for i in range(4):
+            spool.write([f"event-{i}"])
+        spool.close()
+
+        assert list_segments(str(tmp_path)) == [segment_name(4)]
+        assert REGISTRY.get_sample_value(
+            "k8s_iam_operator_audit_events_dropped_total", {"reason": "retention"}) - before == 3
+
+
+class TestSpoolReplayer:
+    """Tests for replaying spooled events."""
+
+    def test_replays_in_order_and_deletes_sealed_segments(self, tmp_path):
+        """Test that events reach the sink in order and delivered segments go away."""
+        directory = str(tmp_path)
+        sink = RecordingSink()
+        spool = AuditSpool(directory, segment_bytes=5)
+        replayer = SpoolReplayer(directory, sink, batch_size=2)
+
+        spool.write(["a", "b", "c"])
+        spool.write(["d"])
+
+        assert replayer.replay() == 4
+        assert sink.lines == ["a", "b", "c", "d"]
+        assert max(len(batch) for batch in sink.batches) <= 2
+        # The active segment is kept, the sealed one was delivered
+        assert list_segments(directory) == [segment_name(2)]
+        assert read_checkpoint(directory) == (segment_name(2), 2)
+        assert replayer.backlog() == 0
+
+    def test_failed_batch_is_sent_again(self, tmp_path):
+        """Test that events wait on disk while the sink is down."""
+        directory = str(tmp_path)
+        sink = RecordingSink()
+        spool = AuditSpool(directory)
+        replayer = SpoolReplayer(directory, sink)
+        spool.write(["a", "b"])
+
+        sink.fail = True
+        with pytest.raises(IOError):
+            replayer.replay()
+        assert replayer.backlog() == 4
+
+        sink.fail = False
+        replayer.replay()
+        assert sink.lines == ["a", "b"]
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        """Test that a new reader continues where the previous one stopped."""
+        directory = str(tmp_path)
+        spool = AuditSpool(directory)
+        spool.write(["a", "b"])
+        SpoolReplayer(directory, RecordingSink()).replay()
+        spool.write(["c"])
+
+        sink = RecordingSink()
+        SpoolReplayer(directory, sink).replay()
+
+        assert sink.lines == ["c"]
+
+    def test_skips_incomplete_line(self, tmp_path):
+        """Test that a partly written event is not replayed until complete."""
+        directory = str(tmp_path)
+        path = os.path.join(directory, segment_name(1))
+        with open(path, "w") as f:
+            f.write("a\npart")
+        sink = RecordingSink()
+        replayer = SpoolReplayer(directory, sink)
+
+        replayer.replay()
+        assert sink.lines == ["a"]
+
+        with open(path, "a") as f:
+            f.write("ial\n")
+        replayer.replay()
+        assert sink.lines == ["a", "partial"]
+
+    def test_closing_spool_replays_rest_and_closes_sink(self, tmp_path):
+        """Test that shutdown delivers what is left in the spool."""
+        directory = str(tmp_path)
+        sink = RecordingSink()
+        replayer = SpoolReplayer(directory, sink, poll_interval=60)
+        spool = AuditSpool(directory, replayer=replayer)
+        replayer.start()
+
+        spool.write(["a"])
+        spool.close()
+
+        assert sink.lines == ["a"]
+        assert sink.closed
@@ -0,0 +1,74 @@
+"""Unit tests for the cluster identity cache."""
+
+import base64
+from unittest.mock import MagicMock
+
+from app.repositories.cluster_identity import ClusterIdentityCache
+
+CA = "-----BEGIN CERTIFICATE-----\ntest\n-----END CERTIFICATE-----"
+
+
+def make_secret_repo(data):
+    """Build a secret repository mock serving the CA ConfigMap."""
+    repo = MagicMock()
+    repo.get_configmap.return_value = MagicMock(data=data)
+    repo.api_client.configuration.host = "https://kubernetes.default.svc"
+    return repo
+
+
+class TestClusterIdentityCache:
+    """Tests for ClusterIdentityCache."""
+
+    def test_reads_ca_once(self):
+        """Test that repeated lookups are served from memory."""
+        repo = make_secret_repo({"ca.crt": CA})
+        cache = ClusterIdentityCache(repo)
+
+        for _ in range(5):
+            identity = cache.get()
+
+        repo.get_configmap.assert_called_once_with(name="kube-root-ca.crt", namespace="kube-system")
+        assert identity.server == "https://kubernetes.default.svc"
+        assert base64.b64decode(identity.ca_data).decode() == CA
+
+    def test_invalidate_forces_reread(self):
+        """Test that invalidation reads the ConfigMap again."""
+        repo = make_secret_repo({"ca.crt": CA})
+        cache = ClusterIdentityCache(repo)
+
+        cache.get()
+        cache.invalidate()
+        cache.get()
+
+        assert repo.get_configmap.call_count == 2
+
+    def test_watch_events_invalidate(self):
+        """Test that a ConfigMap watch event drops the cached identity."""
+        repo = make_secret_repo({"ca.crt": CA})
+        cache = ClusterIdentityCache(repo)
+
+        cache.get()
+        cache._on_event("MODIFIED", MagicMock(), None)
+        cache.get()
+
+        assert repo.get_configmap.call_count == 2
+
+    def test_missing_ca_is_not_cached(self):
+        """Test that an empty CA is retried on the next lookup."""
+        repo = make_secret_repo({})
+        cache = ClusterIdentityCache(repo)
+
+        assert cache.get().ca_data == ""
+        cache.get()
+
+        assert repo.get_configmap.call_count == 2
+
+    def test_watches_only_the_ca_configmap(self):
+        """Test that the informer is scoped to kube-root-ca.crt in kube-system."""
+        core_api = MagicMock()
+        cache = ClusterIdentityCache(make_secret_repo({}), core_api)
+
+        assert cache._informer._list_kwargs == {
+            "namespace": "kube-system",
+            "field_selector": "metadata.name=kube-root-ca.crt",
+        }
@@ -0,0 +1,56 @@
+"""Unit tests for bounded concurrent execution."""
+
+import threading
+import time
+
+from app.utils.concurrency import run_bounded
+
+
+class TestRunBounded:
+    """Tests for run_bounded."""
+
+    def test_runs_all_tasks_and_collects_failures(self):
+        """Test that one failure doesn't stop the remaining tasks."""
+        done = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        failures = run_bounded([
+            ("a", lambda: done.append("a")),
+            ("b", fail),
+            ("c", lambda: done.append("c")),
+        ], max_workers=4)
+
+        assert sorted(done) == ["a", "c"]
+        assert list(failures) == ["b"]
+        assert str(failures["b"]) == "boom"
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_workers tasks run at once."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def task():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        run_bounded([(str(i), task) for i in range(12)], max_workers=3)
+
+        assert 1 < peak[0] <= 3
+
+    def test_limit_of_one_runs_inline(self):
+        """Test that a limit of 1 runs on the calling thread in order."""
+        threads = []
+
+        run_bounded(
+            [(str(i), lambda: threads.append(threading.current_thread())) for i in range(3)],
+            max_workers=1,
+        )
+
+        assert threads == [threading.current_thread()] * 3
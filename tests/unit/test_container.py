@@ -0,0 +1,23 @@
+"""Unit tests for the service container."""
+
+from unittest.mock import MagicMock
+
+from app.container import ServiceContainer
+
+
+class TestServiceContainerShutdown:
+    """Tests for stopping background workers."""
+
+    def test_shutdown_stops_rolebinding_index(self):
+        """Test that the RoleBinding informer is stopped with the other workers."""
+        container = ServiceContainer(audit_enabled=False)
+        index = MagicMock()
+        identity = MagicMock()
+        container._rolebinding_index = index
+        container._cluster_identity = identity
+
+        container.shutdown()
+
+        index.stop.assert_called_once()
+        identity.stop.assert_called_once()
+        assert container._rolebinding_index is None
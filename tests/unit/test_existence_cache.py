@@ -0,0 +1,116 @@
+"""Unit tests for the existence cache."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.rest import ApiException
+
+from app.api.metrics import EXISTENCE_CACHE_LOOKUPS
+from app.repositories.existence_cache import ExistenceCache
+from app.repositories.namespace_repository import NamespaceRepository
+from app.repositories.rbac_repository import RBACRepository
+
+
+def lookups(cache, result):
+    """Read the current value of the lookup counter."""
+    return EXISTENCE_CACHE_LOOKUPS.labels(cache=cache, result=result)._value.get()
+
+
+class TestExistenceCache:
+    """Tests for ExistenceCache."""
+
+    def test_lookup_memoizes_probe(self):
+        """Test that the probe only runs on a miss."""
+        cache = ExistenceCache("test-memo")
+        probe = MagicMock(return_value=True)
+
+        assert cache.lookup("ns", probe) is True
+        assert cache.lookup("ns", probe) is True
+
+        probe.assert_called_once()
+        assert lookups("test-memo", "hit") == 1
+        assert lookups("test-memo", "miss") == 1
+
+    def test_negative_results_are_cached(self):
+        """Test that 'does not exist' is cached too."""
+        cache = ExistenceCache("test-negative")
+        probe = MagicMock(return_value=False)
+
+        cache.lookup("ns", probe)
+
+        assert cache.get("ns") is False
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after the TTL."""
+        cache = ExistenceCache("test-ttl", ttl_seconds=10)
+        with patch("app.repositories.existence_cache.time.monotonic", return_value=100.0):
+            cache.set("ns", True)
+        with patch("app.repositories.existence_cache.time.monotonic", return_value=110.0):
+            assert cache.get("ns") is None
+
+    def test_invalidate(self):
+        """Test that invalidated keys are probed again."""
+        cache = ExistenceCache("test-invalidate")
+        probe = MagicMock(side_effect=[False, True])
+
+        assert cache.lookup("ns", probe) is False
+        cache.invalidate("ns")
+        assert cache.lookup("ns", probe) is True
+
+
+class TestRepositoriesWithExistenceCache:
+    """Tests for repositories using the existence cache."""
+
+    @pytest.fixture
+    def ns_repo(self):
+        repo = NamespaceRepository(api_client=MagicMock(), existence_cache=ExistenceCache("test-ns"))
+        repo._core_v1 = MagicMock()
+        return repo
+
+    @pytest.fixture
+    def rbac_repo(self):
+        repo = RBACRepository(api_client=MagicMock(), existence_cache=ExistenceCache("test-rbac"))
+        repo._rbac_v1 = MagicMock()
+        return repo
+
+    def test_namespace_exists_reads_once(self, ns_repo):
+        """Test that repeated namespace checks hit the API once."""
+        for _ in range(5):
+            assert ns_repo.exists("dev")
+
+        ns_repo._core_v1.read_namespace.assert_called_once_with(name="dev")
+
+    def test_namespace_create_marks_existing(self, ns_repo):
+        """Test that a namespace created by the operator is known to exist."""
+        ns_repo._core_v1.read_namespace.side_effect = ApiException(status=404)
+        assert not ns_repo.exists("dev")
+
+        ns_repo.create("dev")
+
+        assert ns_repo.exists("dev")
+        ns_repo._core_v1.read_namespace.assert_called_once()
+
+    def test_cluster_role_exists_reads_once(self, rbac_repo):
+        """Test that a ClusterRole bound in many namespaces is read once."""
+        for _ in range(50):
+            assert rbac_repo.cluster_role_exists("view")
+
+        rbac_repo._rbac_v1.read_cluster_role.assert_called_once_with(name="view")
+
+    def test_role_delete_invalidates(self, rbac_repo):
+        """Test that deleting a Role forgets its cached existence."""
+        assert rbac_repo.role_exists("reader", "dev")
+
+        rbac_repo.delete_role("reader", "dev")
+        rbac_repo._rbac_v1.read_namespaced_role.side_effect = ApiException(status=404)
+
+        assert not rbac_repo.role_exists("reader", "dev")
+
+    def test_namespace_ensure_exists_is_single_apply(self, ns_repo):
+        """Test that ensure_exists is one server-side apply and marks the namespace."""
+        ns_repo.ensure_exists("alice", labels={"a": "b"})
+
+        ns_repo._core_v1.patch_namespace.assert_called_once()
+        ns_repo._core_v1.read_namespace.assert_not_called()
+        ns_repo._core_v1.create_namespace.assert_not_called()
+        assert ns_repo.exists("alice")
@@ -0,0 +1,131 @@
+"""Unit tests for per-reconcile instrumentation."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+from prometheus_client import REGISTRY
+
+from app.utils.concurrency import run_bounded
+from app.utils.instrumentation import (
+    InstrumentedApi,
+    current_reconcile,
+    instrument,
+    parse_operation,
+    phase,
+    reconcile,
+)
+
+
+def kopf_kwargs(kind="User", reason="create"):
+    """Build the Kopf kwargs the labels are read from."""
+    return {"resource": SimpleNamespace(kind=kind), "reason": reason}
+
+
+def sample(name, **labels):
+    """Read a metric sample, treating a missing series as zero."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestInstrument:
+    """Tests for the handler decorator."""
+
+    def test_records_success_and_api_calls(self):
+        """Test that a reconcile counts its outcome and the API calls it made."""
+        api = InstrumentedApi(MagicMock())
+
+        def handler(**kwargs):
+            api.read_namespace(name="a")
+            api.read_namespace(name="b")
+            return {"state": "ready"}
+
+        labels = {"resource_type": "TestKind", "action": "create"}
+        before = sample("k8s_iam_operator_reconcile_api_calls_sum", **labels)
+
+        instrument(handler)(**kopf_kwargs("TestKind"))
+
+        assert sample("k8s_iam_operator_reconciliations_total", outcome="success", **labels) == 1
+        assert sample("k8s_iam_operator_reconcile_api_calls_sum", **labels) - before == 2
+
+    def test_error_status_counts_as_failure(self):
+        """Test that a failure reported in the returned status is an error outcome."""
+        handler = MagicMock(return_value={"error": "bad", "field": "spec"}, __name__="failing_fn")
+
+        result = instrument(handler)(**kopf_kwargs("ErrorKind", "update"))
+
+        assert result == {"error": "bad", "field": "spec"}
+        assert sample("k8s_iam_operator_reconciliations_total",
+                      resource_type="ErrorKind", action="update", outcome="error") == 1
+        assert sample("k8s_iam_operator_handler_errors_total",
+                      handler="failing_fn", error_type="validation") == 1
+
+    def test_context_is_cleared_afterwards(self):
+        """Test that API calls outside a handler aren't attributed to it."""
+        with reconcile("h", "Kind", "create"):
+            assert current_reconcile() is not None
+
+        assert current_reconcile() is None
+
+
+class TestPhase:
+    """Tests for phase timing."""
+
+    def test_records_phase_inside_reconcile(self):
+        """Test that phases are observed under the reconcile's resource type."""
+        with reconcile("h", "PhaseKind", "create"):
+            with phase("rbac"):
+                pass
+
+        assert sample("k8s_iam_operator_reconcile_phase_duration_seconds_count",
+                      resource_type="PhaseKind", phase="rbac") == 1
+
+    def test_no_op_outside_reconcile(self):
+        """Test that phases outside a reconcile run without recording."""
+        ran = []
+        with phase("kubeconfig"):
+            ran.append(True)
+
+        assert ran == [True]
+
+
+class TestContextPropagation:
+    """Tests for attributing fan-out work to the caller's reconcile."""
+
+    def test_run_bounded_counts_pooled_calls(self):
+        """Test that API calls from pooled tasks count towards the reconcile."""
+        api = InstrumentedApi(MagicMock())
+
+        with reconcile("h", "FanOutKind", "create") as context:
+            run_bounded([(str(i), lambda: api.patch_namespaced_role_binding()) for i in range(4)],
+                        max_workers=4)
+
+        assert context.api_calls == 4
+
+
+class TestInstrumentedApi:
+    """Tests for per-call API metrics."""
+
+    def test_parse_operation(self):
+        """Test that verbs and resources are read from client method names."""
+        assert parse_operation("list_namespaced_role_binding") == ("list", "role_binding")
+        assert parse_operation("delete_collection_namespaced_secret") == ("delete_collection", "secret")
+        assert parse_operation("list_role_binding_for_all_namespaces") == ("list", "role_binding")
+        assert parse_operation("patch_cluster_role") == ("patch", "cluster_role")
+        assert parse_operation("list_cluster_custom_object") == ("list", "custom_object")
+        assert parse_operation("read_namespace") == ("read", "namespace")
+
+    def test_observes_latency_by_verb_resource_and_code(self):
+        """Test that successful and failed calls land in separate series."""
+        api = MagicMock()
+        api.read_namespaced_secret.side_effect = ApiException(status=404)
+        proxy = InstrumentedApi(api)
+
+        proxy.list_cluster_custom_object(plural="probes")
+        with pytest.raises(ApiException):
+            proxy.read_namespaced_secret(name="missing", namespace="ns")
+
+        assert sample("k8s_iam_operator_kube_api_request_duration_seconds_count",
+                      verb="list", resource="probes", code="2xx") == 1
+        assert sample("k8s_iam_operator_kube_api_request_duration_seconds_count",
+                      verb="read", resource="secret", code="404") >= 1
@@ -0,0 +1,153 @@
+"""Unit tests for bulk kubeconfig rotation."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from app.services.kubeconfig_rotation import KubeconfigRotator, RotationCheckpoint
+from app.utils.rate_limit import TokenBucket
+
+
+def make_user(name, human=True):
+    """Build a User body."""
+    return {
+        "metadata": {"name": name, "namespace": "iam"},
+        "spec": {"type": "human" if human else "serviceAccount"},
+    }
+
+
+def make_custom_api(*pages):
+    """Build a CustomObjectsApi mock serving the given pages of Users."""
+    api = MagicMock()
+    responses = []
+    for i, items in enumerate(pages):
+        token = f"page-{i + 1}" if i + 1 < len(pages) else None
+        responses.append({"items": items, "metadata": {"continue": token}})
+    api.list_cluster_custom_object.side_effect = responses
+    return api
+
+
+@pytest.fixture
+def kubeconfig_service():
+    """Create a kubeconfig service mock without an identity cache."""
+    return MagicMock(cluster_identity=None)
+
+
+class TestKubeconfigRotator:
+    """Tests for KubeconfigRotator."""
+
+    def test_rotates_only_human_users_across_pages(self, kubeconfig_service):
+        """Test that all pages are streamed and service accounts skipped."""
+        api = make_custom_api([make_user("alice"), make_user("bot", human=False)], [make_user("bob")])
+        rotator = KubeconfigRotator(kubeconfig_service, api, rate_per_second=0)
+
+        progress = rotator.rotate()
+
+        names = sorted(c.args[0].name for c in kubeconfig_service.create_kubeconfig_secret.call_args_list)
+        assert names == ["alice", "bob"]
+        assert (progress.seen, progress.rotated, progress.failed) == (2, 2, 0)
+        assert api.list_cluster_custom_object.call_args_list[1].kwargs["_continue"] == "page-1"
+
+    def test_malformed_user_counts_as_failure(self, kubeconfig_service):
+        """Test that a User that can't be parsed doesn't stop the rotation."""
+        broken = {"metadata": {"name": "broken", "namespace": "iam"}, "spec": {"type": "robot"}}
+        api = make_custom_api([make_user("alice"), broken], [make_user("bob")])
+        rotator = KubeconfigRotator(kubeconfig_service, api, rate_per_second=0)
+
+        progress = rotator.rotate()
+
+        assert kubeconfig_service.create_kubeconfig_secret.call_count == 2
+        assert (progress.rotated, progress.failed) == (2, 1)
+        assert list(progress.failures) == ["iam/broken"]
+
+    def test_expired_continue_token_restarts_list(self, kubeconfig_service):
+        """Test that a 410 mid-rotation relists without rotating anyone twice."""
+        api = MagicMock()
+        api.list_cluster_custom_object.side_effect = [
+            {"items": [make_user("alice")], "metadata": {"continue": "page-1"}},
+            ApiException(status=410, reason="Gone"),
+            {"items": [make_user("alice")], "metadata": {"continue": "page-2"}},
+            {"items": [make_user("bob")], "metadata": {}},
+        ]
+        rotator = KubeconfigRotator(kubeconfig_service, api, rate_per_second=0)
+
+        progress = rotator.rotate()
+
+        assert kubeconfig_service.create_kubeconfig_secret.call_count == 2
+        assert (progress.seen, progress.rotated, progress.failed) == (2, 2, 0)
+
+    def test_resumes_from_checkpoint(self, kubeconfig_service, tmp_path):
+        """Test that users completed by a previous run are skipped."""
+        checkpoint = RotationCheckpoint(str(tmp_path / "ckpt"))
+        checkpoint.mark_done("iam/alice")
+        api = make_custom_api([make_user("alice"), make_user("bob")])
+        rotator = KubeconfigRotator(kubeconfig_service, api, checkpoint=checkpoint, rate_per_second=0)
+
+        progress = rotator.rotate()
+
+        kubeconfig_service.create_kubeconfig_secret.assert_called_once()
+        assert (progress.rotated, progress.resumed) == (1, 1)
+
+    def test_failures_keep_checkpoint(self, kubeconfig_service, tmp_path):
+        """Test that a failed run keeps the checkpoint for a retry."""
+        checkpoint = RotationCheckpoint(str(tmp_path / "ckpt"))
+
+        def rotate(user, force=False):
+            if user.name == "bob":
+                raise RuntimeError("boom")
+
+        kubeconfig_service.create_kubeconfig_secret.side_effect = rotate
+        api = make_custom_api([make_user("alice"), make_user("bob")])
+        rotator = KubeconfigRotator(kubeconfig_service, api, checkpoint=checkpoint, rate_per_second=0)
+
+        progress = rotator.rotate()
+
+        assert progress.failures.keys() == {"iam/bob"}
+        assert checkpoint.load() == {"iam/alice"}
+
+    def test_success_clears_checkpoint(self, kubeconfig_service, tmp_path):
+        """Test that a complete run removes the checkpoint file."""
+        checkpoint = RotationCheckpoint(str(tmp_path / "ckpt"))
+        api = make_custom_api([make_user("alice")])
+        rotator = KubeconfigRotator(kubeconfig_service, api, checkpoint=checkpoint, rate_per_second=0)
+
+        rotator.rotate()
+
+        assert not (tmp_path / "ckpt").exists()
+
+    def test_invalidates_cluster_identity(self):
+        """Test that a rotation doesn't reuse a cached CA."""
+        service = MagicMock()
+        rotator = KubeconfigRotator(service, make_custom_api([]), rate_per_second=0)
+
+        rotator.rotate()
+
+        service.cluster_identity.invalidate.assert_called_once()
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_waits_for_refill(self):
+        """Test that tokens beyond the capacity wait at the configured rate."""
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert sleeps == [pytest.approx(0.5)]
+
+    def test_zero_rate_disables_limit(self):
+        """Test that a non-positive rate never blocks."""
+        bucket = TokenBucket(rate=0, sleep=lambda s: pytest.fail("should not sleep"))
+
+        for _ in range(100):
+            assert bucket.acquire() == 0
@@ -3,9 +3,19 @@
 import pytest
 import json
 import base64
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
-from app.services.kubeconfig_service import KubeconfigService
+from app.services.kubeconfig_service import (
+    CLUSTER_HASH_ANNOTATION,
+    KUBECONFIG_HASH_ANNOTATION,
+    TOKEN_EXPIRES_ANNOTATION,
+    TOKEN_ISSUED_ANNOTATION,
+    KubeconfigService,
+    cluster_hash,
+    kubeconfig_hash,
+)
+from app.repositories.cluster_identity import ClusterIdentityCache
 from app.models.user import User
 from app.exceptions import KubeconfigGenerationError, ResourceNotFoundError
 
@@ -45,9 +55,7 @@ class TestKubeconfigServiceGenerate:
         self, kubeconfig_service, sample_user, mock_secret_repo
     ):
         """Test that missing token raises error."""
-        mock_token = MagicMock()
-        mock_token.data = {}  # No token
-        mock_secret_repo.get.return_value = mock_token
+        mock_secret_repo.wait_for_token.return_value = None  # No token in time
 
         with pytest.raises(KubeconfigGenerationError) as exc_info:
             kubeconfig_service.generate_kubeconfig(sample_user)
@@ -67,6 +75,26 @@ class TestKubeconfigServiceGenerate:
 
         assert "CA certificate" in exc_info.value.message
 
+    def test_generate_kubeconfig_uses_cluster_identity_cache(
+        self, sample_user, mock_secret_repo, mock_audit_logger
+    ):
+        """Test that bulk generation reads the CA only once."""
+        mock_secret_repo.api_client = MagicMock()
+        mock_secret_repo.api_client.configuration.host = "https://kubernetes.default.svc"
+        service = KubeconfigService(
+            secret_repo=mock_secret_repo,
+            audit_logger=mock_audit_logger,
+            cluster_identity=ClusterIdentityCache(mock_secret_repo)
+        )
+
+        for _ in range(3):
+            kubeconfig = json.loads(service.generate_kubeconfig(sample_user))
+
+        mock_secret_repo.get_configmap.assert_called_once()
+        cluster = kubeconfig["clusters"][0]["cluster"]
+        assert cluster["server"] == "https://kubernetes.default.svc"
+        assert base64.b64decode(cluster["certificate-authority-data"]).startswith(b"-----BEGIN")
+
 
 class TestKubeconfigServiceCreate:
     """Tests for kubeconfig secret creation."""
@@ -89,6 +117,44 @@ class TestKubeconfigServiceCreate:
 
         mock_audit_logger.log_create.assert_called_once()
 
+    def test_create_kubeconfig_secret_stamps_content_hash(self, kubeconfig_service, sample_user,
+                                                          mock_secret_repo):
+        """Test that the written secret carries the kubeconfig hash."""
+        kubeconfig_service.create_kubeconfig_secret(sample_user)
+
+        expected = kubeconfig_hash(kubeconfig_service.generate_kubeconfig(sample_user))
+        annotations = mock_secret_repo.ensure_kubeconfig_secret.call_args[1]["annotations"]
+        assert annotations == {KUBECONFIG_HASH_ANNOTATION: expected}
+
+    def test_create_kubeconfig_secret_skips_unchanged(self, kubeconfig_service, sample_user,
+                                                      mock_secret_repo, mock_audit_logger):
+        """Test that a matching content hash skips the write."""
+        content_hash = kubeconfig_hash(kubeconfig_service.generate_kubeconfig(sample_user))
+        mock_secret_repo.get.return_value.metadata.annotations = {
+            KUBECONFIG_HASH_ANNOTATION: content_hash
+        }
+
+        kubeconfig_service.create_kubeconfig_secret(sample_user)
+
+        mock_secret_repo.ensure_kubeconfig_secret.assert_not_called()
+        mock_audit_logger.log_create.assert_not_called()
+
+    def test_create_kubeconfig_secret_writes_when_missing(self, kubeconfig_service, sample_user,
+                                                          mock_secret_repo):
+        """Test that a missing kubeconfig secret is written."""
+        token_secret = mock_secret_repo.get.return_value
+
+        def get_secret(name, namespace):
+            if name == sample_user.token_secret_name:
+                return token_secret
+            raise ResourceNotFoundError("Secret", name, namespace)
+
+        mock_secret_repo.get.side_effect = get_secret
+
+        kubeconfig_service.create_kubeconfig_secret(sample_user)
+
+        mock_secret_repo.ensure_kubeconfig_secret.assert_called_once()
+
 
 class TestKubeconfigServiceDelete:
     """Tests for kubeconfig secret deletion."""
@@ -132,3 +198,93 @@ class TestKubeconfigServiceExists:
         mock_secret_repo.exists.return_value = False
 
         assert kubeconfig_service.kubeconfig_exists(sample_user) is False
+
+
+class TestKubeconfigServiceTokenRequest:
+    """Tests for kubeconfigs built from TokenRequest tokens."""
+
+    @pytest.fixture
+    def sa_repo(self):
+        """Create a service account repository issuing bound tokens."""
+        repo = MagicMock()
+        repo.create_token.return_value = MagicMock(
+            token="bound-token",
+            expiration_timestamp=datetime.now(timezone.utc) + timedelta(hours=24)
+        )
+        return repo
+
+    @pytest.fixture
+    def service(self, kubeconfig_service, mock_secret_repo, sa_repo):
+        """Create a kubeconfig service in TokenRequest mode."""
+        return KubeconfigService(
+            secret_repo=mock_secret_repo,
+            sa_repo=sa_repo,
+            token_expiration_seconds=86400
+        )
+
+    def test_uses_requested_token(self, service, sample_user, mock_secret_repo, sa_repo):
+        """Test that the token comes from TokenRequest, not a token secret."""
+        mock_secret_repo.get.side_effect = ResourceNotFoundError("Secret", "x", "y")
+
+        service.create_kubeconfig_secret(sample_user)
+
+        sa_repo.create_token.assert_called_once_with(
+            name=sample_user.service_account_name,
+            namespace=sample_user.namespace,
+            expiration_seconds=86400
+        )
+        call = mock_secret_repo.ensure_kubeconfig_secret.call_args[1]
+        kubeconfig = json.loads(base64.b64decode(call["kubeconfig_data"]))
+        assert kubeconfig["users"][0]["user"]["token"] == "bound-token"
+        assert TOKEN_EXPIRES_ANNOTATION in call["annotations"]
+
+    def test_valid_token_is_not_renewed(self, service, sample_user, mock_secret_repo, sa_repo):
+        """Test that an unexpired token for the same cluster skips the write."""
+        identity = service._get_cluster_identity()
+        expires = datetime.now(timezone.utc) + timedelta(hours=23)
+        mock_secret_repo.get.return_value.metadata.annotations = {
+            TOKEN_EXPIRES_ANNOTATION: expires.isoformat(),
+            CLUSTER_HASH_ANNOTATION: cluster_hash(identity),
+        }
+
+        service.create_kubeconfig_secret(sample_user)
+
+        sa_repo.create_token.assert_not_called()
+        mock_secret_repo.ensure_kubeconfig_secret.assert_not_called()
+
+    def test_token_needs_refresh_near_expiry(self, service):
+        """Test that tokens are renewed in the last fifth of their lifetime."""
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert service.token_needs_refresh((now + timedelta(hours=5)).isoformat(), now) is False
+        assert service.token_needs_refresh((now + timedelta(hours=4)).isoformat(), now) is True
+        assert service.token_needs_refresh(None, now) is True
+        assert service.token_needs_refresh("garbage", now) is True
+
+    def test_token_needs_refresh_uses_issued_lifetime(self, service):
+        """Test that a lifetime capped by the server sets the refresh margin."""
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # 24h were requested, the server issued 1h
+        expires = (now + timedelta(minutes=30)).isoformat()
+        issued = (now - timedelta(minutes=30)).isoformat()
+        assert service.token_needs_refresh(expires, now, issued_at=issued) is False
+
+        expires = (now + timedelta(minutes=10)).isoformat()
+        issued = (now - timedelta(minutes=50)).isoformat()
+        assert service.token_needs_refresh(expires, now, issued_at=issued) is True
+
+    def test_capped_token_is_not_renewed_every_reconcile(self, service, sample_user,
+                                                         mock_secret_repo, sa_repo):
+        """Test that a token capped at 1h is reused right after it was minted."""
+        mock_secret_repo.get.side_effect = ResourceNotFoundError("Secret", "x", "y")
+        sa_repo.create_token.return_value.expiration_timestamp = \
+            datetime.now(timezone.utc) + timedelta(hours=1)
+        service.create_kubeconfig_secret(sample_user)
+        annotations = mock_secret_repo.ensure_kubeconfig_secret.call_args[1]["annotations"]
+
+        mock_secret_repo.get.side_effect = None
+        mock_secret_repo.get.return_value.metadata.annotations = annotations
+        service.create_kubeconfig_secret(sample_user)
+
+        assert TOKEN_ISSUED_ANNOTATION in annotations
+        sa_repo.create_token.assert_called_once()
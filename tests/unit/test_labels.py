@@ -0,0 +1,78 @@
+"""Unit tests for operator ownership labels."""
+
+import re
+
+from app.utils.labels import (
+    MANAGED_BY_LABEL,
+    label_value,
+    owner_labels,
+    owner_selector,
+    selector_matches,
+    unmanaged_selector,
+)
+
+
+class TestOwnerLabels:
+    """Tests for ownership label helpers."""
+
+    def test_owner_labels(self):
+        """Test that owner labels carry managed-by, kind, name and namespace."""
+        labels = owner_labels("User", "alice", "iam")
+
+        assert labels == {
+            "app.kubernetes.io/managed-by": "k8s-iam-operator",
+            "k8sio.auth/owner-kind": "User",
+            "k8sio.auth/owner-name": "alice",
+            "k8sio.auth/owner-namespace": "iam",
+        }
+
+    def test_owner_labels_cluster_scoped(self):
+        """Test that cluster-scoped owners have no namespace label."""
+        assert "k8sio.auth/owner-namespace" not in owner_labels("ClusterRole", "viewer")
+
+    def test_owner_selector_is_stable(self):
+        """Test that the selector is sorted and matches its own labels."""
+        selector = owner_selector("Group", "ops", "iam")
+
+        assert selector == ",".join(sorted(selector.split(",")))
+        assert selector_matches(selector, owner_labels("Group", "ops", "iam"))
+
+    def test_long_owner_name_fits_label_value(self):
+        """Test that names over 63 characters are hashed into a valid label value."""
+        name = "a" * 100 + ".b" * 50
+        labels = owner_labels("ClusterRole", name)
+        value = labels["k8sio.auth/owner-name"]
+
+        assert len(value) <= 63
+        assert re.fullmatch(r"[a-z0-9]([-a-z0-9_.]*[a-z0-9])?", value)
+        assert value == label_value(name)
+        assert value != label_value(name + "c")
+        assert selector_matches(owner_selector("ClusterRole", name), labels)
+
+    def test_short_owner_name_kept(self):
+        """Test that names within the limit are stored unchanged."""
+        assert label_value("x" * 63) == "x" * 63
+
+
+class TestSelectorMatches:
+    """Tests for client-side selector evaluation."""
+
+    def test_empty_selector_matches_everything(self):
+        """Test that no selector matches any labels."""
+        assert selector_matches(None, None)
+        assert selector_matches("", {"a": "b"})
+
+    def test_equality_terms(self):
+        """Test key=value terms."""
+        assert selector_matches("a=1,b=2", {"a": "1", "b": "2", "c": "3"})
+        assert not selector_matches("a=1,b=2", {"a": "1"})
+
+    def test_non_existence_term(self):
+        """Test !key terms."""
+        assert selector_matches(unmanaged_selector(), {"a": "1"})
+        assert not selector_matches(unmanaged_selector(), {MANAGED_BY_LABEL: "x"})
+
+    def test_existence_term(self):
+        """Test bare key terms."""
+        assert selector_matches("a", {"a": ""})
+        assert not selector_matches("a", {})
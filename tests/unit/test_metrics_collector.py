@@ -0,0 +1,148 @@
+"""Unit tests for the watch-based metrics collector."""
+
+from unittest.mock import MagicMock
+
+from app.metrics_collector import OVERFLOW_NAMESPACE, ResourceCounter, user_bucket
+from app.repositories.informer import Informer
+from app.utils.labels import USER_TYPE_LABEL
+
+
+def make_user(name, namespace="iam", human=False):
+    """Build a User dict."""
+    return {
+        "metadata": {"name": name, "namespace": namespace, "resourceVersion": "1"},
+        "spec": {"type": "human"} if human else {},
+    }
+
+
+def make_counter(max_series=0):
+    """Build a User counter recording the exported series."""
+    gauge = {}
+    counter = ResourceCounter(
+        "users", "users", user_bucket, gauge.__setitem__, gauge.pop, max_series
+    )
+    return counter, gauge
+
+
+class TestResourceCounter:
+    """Tests for incremental gauge maintenance."""
+
+    def test_relist_sets_full_counts(self):
+        """Test that a LIST recounts every bucket."""
+        counter, gauge = make_counter()
+
+        counter.on_relist([counter.reduce(make_user("a")), counter.reduce(make_user("b", human=True))])
+
+        assert gauge == {("iam", "serviceAccount"): 1, ("iam", "human"): 1}
+
+    def test_events_adjust_counts(self):
+        """Test that add, modify and delete events move the gauges."""
+        counter, gauge = make_counter()
+        alice = counter.reduce(make_user("alice"))
+        human_alice = counter.reduce(make_user("alice", human=True))
+
+        counter.on_event("ADDED", alice, None)
+        counter.on_event("MODIFIED", human_alice, alice)
+        assert gauge == {("iam", "human"): 1}
+
+        counter.on_event("DELETED", human_alice, human_alice)
+        assert gauge == {}
+
+    def test_relist_removes_vanished_series(self):
+        """Test that series missing from a recount are removed."""
+        counter, gauge = make_counter()
+        counter.on_relist([counter.reduce(make_user("a", namespace="old"))])
+
+        counter.on_relist([counter.reduce(make_user("b", namespace="new"))])
+
+        assert gauge == {("new", "serviceAccount"): 1}
+
+    def test_cap_aggregates_overflow_into_other(self):
+        """Test that buckets beyond the cap share the overflow series."""
+        counter, gauge = make_counter(max_series=1)
+        users = [counter.reduce(make_user(name, namespace=name)) for name in ("a", "b", "c")]
+
+        counter.on_relist(users)
+
+        assert gauge == {("a", "serviceAccount"): 1, (OVERFLOW_NAMESPACE, "serviceAccount"): 2}
+
+    def test_overflow_series_removed_when_empty(self):
+        """Test that events drain the overflow series and then remove it."""
+        counter, gauge = make_counter(max_series=1)
+        a = counter.reduce(make_user("a", namespace="a"))
+        b = counter.reduce(make_user("b", namespace="b"))
+        counter.on_event("ADDED", a, None)
+        counter.on_event("ADDED", b, None)
+        assert gauge == {("a", "serviceAccount"): 1, (OVERFLOW_NAMESPACE, "serviceAccount"): 1}
+
+        counter.on_event("DELETED", b, b)
+
+        assert gauge == {("a", "serviceAccount"): 1}
+
+    def test_relist_keeps_exported_buckets_stable(self):
+        """Test that a recount doesn't reshuffle which buckets have own series."""
+        counter, gauge = make_counter(max_series=1)
+        counter.on_event("ADDED", counter.reduce(make_user("z", namespace="z")), None)
+
+        counter.on_relist([
+            counter.reduce(make_user("a", namespace="a")),
+            counter.reduce(make_user("z", namespace="z")),
+        ])
+
+        assert gauge == {("z", "serviceAccount"): 1, (OVERFLOW_NAMESPACE, "serviceAccount"): 1}
+
+    def test_reduce_keeps_only_metadata_and_bucket(self):
+        """Test that stored objects don't carry the full spec."""
+        counter, _ = make_counter()
+
+        reduced = counter.reduce(make_user("alice", human=True))
+
+        assert set(reduced) == {"metadata", "bucket"}
+        assert reduced["bucket"] == ("iam", "human")
+
+
+class TestUserBucket:
+    """Tests for bucketing Users from metadata."""
+
+    def test_reads_type_from_label(self):
+        """Test that metadata-only Users are bucketed by their user-type label."""
+        obj = {"metadata": {"namespace": "iam", "labels": {USER_TYPE_LABEL: "human"}}}
+
+        assert user_bucket(obj) == ("iam", "human")
+
+    def test_falls_back_to_spec(self):
+        """Test that full objects without the label use the spec."""
+        assert user_bucket(make_user("alice", human=True)) == ("iam", "human")
+
+
+class TestInformerTransformAndRelist:
+    """Tests for the informer hooks the collector relies on."""
+
+    def test_transform_applies_to_listed_items(self):
+        """Test that listed objects are stored in reduced form."""
+        list_func = MagicMock(return_value={"items": [make_user("alice")], "metadata": {}})
+        informer = Informer(list_func, "users", transform=lambda obj: {"metadata": obj["metadata"]})
+
+        informer._relist()
+
+        assert informer.get("iam", "alice") == {"metadata": make_user("alice")["metadata"]}
+
+    def test_metadata_only_requests_partial_objects(self):
+        """Test that metadata-only informers send the PartialObjectMetadata Accept header."""
+        list_func = MagicMock(return_value={"items": [], "metadata": {}})
+        informer = Informer(list_func, "users", metadata_only=True)
+
+        informer._relist()
+
+        accept = list_func.call_args.kwargs["_headers"]["Accept"]
+        assert accept.startswith("application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1")
+
+    def test_request_relist_stops_current_watch(self):
+        """Test that a requested relist ends the running watch."""
+        informer = Informer(MagicMock(), "users")
+        informer._watch = MagicMock()
+
+        informer.request_relist()
+
+        informer._watch.stop.assert_called_once()
+        assert informer._relist_requested is True
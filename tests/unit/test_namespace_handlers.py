@@ -0,0 +1,83 @@
+"""Unit tests for namespace event handlers."""
+
+from unittest.mock import MagicMock, patch
+
+from app.kopf_handlers import namespace_handlers
+from app.kopf_handlers.namespace_handlers import (
+    namespace_created_handler,
+    target_namespace_index,
+)
+
+
+def make_body(name, namespaces):
+    """Build a User/Group body with CRoles targeting the given namespaces."""
+    spec = {"CRoles": [{"namespace": ns, "clusterRole": "view"} for ns in namespaces]}
+    return {"metadata": {"name": name, "namespace": "iam"}, "spec": spec}
+
+
+class TestTargetNamespaceIndex:
+    """Tests for the namespace reverse index function."""
+
+    def test_keys_by_each_target_namespace(self):
+        """Test that every targeted namespace points to the object."""
+        body = make_body("alice", ["dev", "prod"])
+
+        index = target_namespace_index(body, body["spec"])
+
+        assert set(index) == {"dev", "prod"}
+        assert index["dev"]["metadata"]["name"] == "alice"
+        assert index["dev"]["spec"] == body["spec"]
+
+    def test_skips_cluster_wide_roles(self):
+        """Test that CRoles without a namespace are not indexed."""
+        body = {"metadata": {"name": "alice"}, "spec": {"CRoles": [{"clusterRole": "view"}]}}
+
+        assert target_namespace_index(body, body["spec"]) == {}
+
+    def test_handles_missing_croles(self):
+        """Test that objects without CRoles produce no entries."""
+        assert target_namespace_index({"metadata": {}}, {}) == {}
+
+
+class TestNamespaceCreatedHandler:
+    """Tests for namespace-create reconciliation."""
+
+    def test_reconciles_only_indexed_objects(self):
+        """Test that index entries are reconciled without listing CRs."""
+        container = MagicMock()
+        with patch.object(namespace_handlers, "get_container", return_value=container), \
+                patch.object(namespace_handlers.client, "CustomObjectsApi") as custom_api:
+            namespace_created_handler(
+                "dev",
+                users=[make_body("alice", ["dev"])],
+                groups=[make_body("ops", ["dev"])],
+            )
+
+        custom_api.assert_not_called()
+        keys = [c.args[0] for c in container.reconcile_queue.enqueue.call_args_list]
+        assert keys == [("User", "iam", "alice"), ("Group", "iam", "ops")]
+
+    def test_reconciles_inline_without_queue(self):
+        """Test that owners are reconciled immediately when debouncing is off."""
+        container = MagicMock(reconcile_queue=None)
+        with patch.object(namespace_handlers, "get_container", return_value=container):
+            namespace_created_handler("dev", users=[make_body("alice", ["dev"])], groups=[])
+
+        container.reconcile_owner_bindings.assert_called_once()
+        assert container.reconcile_owner_bindings.call_args.args[0] == ("User", "iam", "alice")
+
+    def test_falls_back_to_listing_without_index(self):
+        """Test that all objects are listed and filtered without index entries."""
+        container = MagicMock(reconcile_queue=None)
+        api = MagicMock()
+        api.list_cluster_custom_object.return_value = {"items": [
+            make_body("alice", ["dev"]),
+            make_body("bob", ["prod"]),
+        ]}
+        with patch.object(namespace_handlers, "get_container", return_value=container), \
+                patch.object(namespace_handlers.client, "CustomObjectsApi", return_value=api):
+            namespace_created_handler("dev")
+
+        keys = [c.args[0] for c in container.reconcile_owner_bindings.call_args_list]
+        assert ("User", "iam", "alice") in keys
+        assert ("User", "iam", "bob") not in keys
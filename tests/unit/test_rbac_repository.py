@@ -0,0 +1,226 @@
+"""Unit tests for RBACRepository."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from app.repositories.rbac_repository import RBACRepository
+
+
+def make_binding(name, namespace, subject_kind, subject_name):
+    """Build a V1RoleBinding with a single subject."""
+    return client.V1RoleBinding(
+        metadata=client.V1ObjectMeta(name=name, namespace=namespace),
+        role_ref=client.V1RoleRef(
+            api_group="rbac.authorization.k8s.io", kind="ClusterRole", name="view"
+        ),
+        subjects=[client.RbacV1Subject(kind=subject_kind, name=subject_name)],
+    )
+
+
+def make_page(items, continue_token=None):
+    """Build a V1RoleBindingList page."""
+    return client.V1RoleBindingList(
+        items=items,
+        metadata=client.V1ListMeta(_continue=continue_token),
+    )
+
+
+@pytest.fixture
+def repo():
+    """Create an RBACRepository with a mocked RBAC API."""
+    repository = RBACRepository(api_client=MagicMock())
+    repository._rbac_v1 = MagicMock()
+    return repository
+
+
+class TestRBACRepositoryPagination:
+    """Tests for paginated cluster-wide listings."""
+
+    def test_iter_role_bindings_follows_continue_tokens(self, repo):
+        """Test that all pages are fetched with limit/continue."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.side_effect = [
+            make_page([make_binding("a", "dev", "User", "x")], "token-1"),
+            make_page([make_binding("b", "prod", "User", "y")], None),
+        ]
+
+        names = [b.metadata.name for b in repo.iter_role_bindings(page_size=1)]
+
+        assert names == ["a", "b"]
+        calls = repo._rbac_v1.list_role_binding_for_all_namespaces.call_args_list
+        assert calls[0].kwargs == {"limit": 1}
+        assert calls[1].kwargs == {"limit": 1, "_continue": "token-1"}
+
+    def test_iter_role_bindings_restarts_on_expired_continue_token(self, repo):
+        """Test that a 410 mid-list starts the list over without touching the kwargs."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.side_effect = [
+            make_page([make_binding("a", "dev", "User", "x")], "token-1"),
+            ApiException(status=410, reason="Gone"),
+            make_page([make_binding("a", "dev", "User", "x")], "token-2"),
+            make_page([make_binding("b", "prod", "User", "y")], None),
+        ]
+
+        names = [b.metadata.name for b in repo.iter_role_bindings(label_selector="app=x", page_size=1)]
+
+        assert names == ["a", "a", "b"]
+        calls = repo._rbac_v1.list_role_binding_for_all_namespaces.call_args_list
+        assert calls[2].kwargs == {"limit": 1, "label_selector": "app=x"}
+        assert calls[3].kwargs == {"limit": 1, "label_selector": "app=x", "_continue": "token-2"}
+
+    def test_iter_pages_gives_up_after_repeated_expiry(self, repo):
+        """Test that a list whose token keeps expiring raises."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.side_effect = [
+            make_page([], "token"), ApiException(status=410, reason="Gone"),
+        ] * 4
+
+        with pytest.raises(ApiException):
+            list(repo.iter_role_bindings())
+
+    def test_iter_role_bindings_is_lazy(self, repo):
+        """Test that later pages are only fetched when consumed."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.side_effect = [
+            make_page([make_binding("a", "dev", "User", "x")], "token-1"),
+            make_page([make_binding("b", "prod", "User", "y")], None),
+        ]
+
+        iterator = repo.iter_role_bindings()
+        next(iterator)
+
+        assert repo._rbac_v1.list_role_binding_for_all_namespaces.call_count == 1
+
+    def test_iter_role_bindings_passes_label_selector(self, repo):
+        """Test that the label selector is sent on every page."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.return_value = make_page([])
+
+        list(repo.iter_role_bindings(label_selector="app=x"))
+
+        repo._rbac_v1.list_role_binding_for_all_namespaces.assert_called_once_with(
+            limit=RBACRepository.LIST_PAGE_SIZE, label_selector="app=x"
+        )
+
+    def test_find_bindings_for_subject_uses_single_cluster_wide_list(self, repo):
+        """Test that the all-namespaces lookup doesn't list namespaces."""
+        repo._rbac_v1.list_role_binding_for_all_namespaces.return_value = make_page([
+            make_binding("match", "dev", "ServiceAccount", "alice"),
+            make_binding("other", "dev", "ServiceAccount", "bob"),
+            make_binding("group", "dev", "Group", "alice"),
+        ])
+
+        bindings = repo.find_bindings_for_subject("alice", "ServiceAccount")
+
+        assert [b.metadata.name for b in bindings] == ["match"]
+        repo._rbac_v1.list_namespaced_role_binding.assert_not_called()
+
+    def test_find_cluster_role_bindings_for_subject_paginates(self, repo):
+        """Test that ClusterRoleBinding lookups are paginated."""
+        repo._rbac_v1.list_cluster_role_binding.return_value = client.V1ClusterRoleBindingList(
+            items=[client.V1ClusterRoleBinding(
+                metadata=client.V1ObjectMeta(name="crb"),
+                role_ref=client.V1RoleRef(
+                    api_group="rbac.authorization.k8s.io", kind="ClusterRole", name="view"
+                ),
+                subjects=[client.RbacV1Subject(kind="Group", name="ops")],
+            )],
+            metadata=client.V1ListMeta(),
+        )
+
+        bindings = repo.find_cluster_role_bindings_for_subject("ops", "Group")
+
+        assert [b.metadata.name for b in bindings] == ["crb"]
+        repo._rbac_v1.list_cluster_role_binding.assert_called_once_with(
+            limit=RBACRepository.LIST_PAGE_SIZE
+        )
+
+
+class TestRBACRepositoryDiffApply:
+    """Tests for diff-based create-or-update of bindings."""
+
+    @staticmethod
+    def desired(repo, role="view", subject="alice"):
+        return dict(
+            name="alice-dev-view",
+            namespace="dev",
+            role_ref=repo.create_cluster_role_ref(role),
+            subjects=[repo.create_service_account_subject(subject, "iam")],
+            labels={"k8sio.auth/owner-name": "alice"},
+        )
+
+    @staticmethod
+    def actual(repo, role="view", subject="alice", labels=None):
+        return client.V1RoleBinding(
+            metadata=client.V1ObjectMeta(
+                name="alice-dev-view", namespace="dev",
+                labels={"k8sio.auth/owner-name": "alice", "extra": "x"} if labels is None else labels,
+            ),
+            role_ref=repo.create_cluster_role_ref(role),
+            subjects=[repo.create_service_account_subject(subject, "iam")],
+        )
+
+    def test_unchanged_binding_is_not_written(self, repo):
+        """Test that a matching binding produces zero writes."""
+        repo._rbac_v1.read_namespaced_role_binding.return_value = self.actual(repo)
+
+        assert repo.create_or_update_role_binding(**self.desired(repo)) == "skipped"
+        repo._rbac_v1.create_namespaced_role_binding.assert_not_called()
+        repo._rbac_v1.patch_namespaced_role_binding.assert_not_called()
+
+    def test_missing_binding_is_created(self, repo):
+        """Test that a missing binding is created directly."""
+        repo._rbac_v1.read_namespaced_role_binding.side_effect = ApiException(status=404)
+
+        assert repo.create_or_update_role_binding(**self.desired(repo)) == "created"
+        repo._rbac_v1.patch_namespaced_role_binding.assert_called_once()
+        repo._rbac_v1.create_namespaced_role_binding.assert_not_called()
+
+    def test_changed_subjects_are_patched(self, repo):
+        """Test that a subject change is a single patch."""
+        repo._rbac_v1.read_namespaced_role_binding.return_value = self.actual(repo, subject="bob")
+
+        assert repo.create_or_update_role_binding(**self.desired(repo)) == "patched"
+        repo._rbac_v1.patch_namespaced_role_binding.assert_called_once()
+        repo._rbac_v1.create_namespaced_role_binding.assert_not_called()
+
+    def test_missing_labels_are_patched(self, repo):
+        """Test that unlabelled bindings get their owner labels."""
+        repo._rbac_v1.read_namespaced_role_binding.return_value = self.actual(repo, labels={})
+
+        repo.create_or_update_role_binding(**self.desired(repo))
+
+        repo._rbac_v1.patch_namespaced_role_binding.assert_called_once()
+
+    def test_changed_role_ref_is_replaced(self, repo):
+        """Test that an immutable roleRef change deletes and recreates."""
+        repo._rbac_v1.read_namespaced_role_binding.return_value = self.actual(repo, role="edit")
+
+        repo.create_or_update_role_binding(**self.desired(repo))
+
+        repo._rbac_v1.delete_namespaced_role_binding.assert_called_once_with(
+            name="alice-dev-view", namespace="dev"
+        )
+        repo._rbac_v1.patch_namespaced_role_binding.assert_called_once()
+
+    def test_writes_use_server_side_apply(self, repo):
+        """Test that binding writes are a single forced apply by the operator."""
+        repo._rbac_v1.read_namespaced_role_binding.side_effect = ApiException(status=404)
+
+        repo.create_or_update_role_binding(**self.desired(repo))
+
+        kwargs = repo._rbac_v1.patch_namespaced_role_binding.call_args.kwargs
+        assert kwargs["field_manager"] == "k8s-iam-operator"
+        assert kwargs["force"] is True
+        assert kwargs["_content_type"] == "application/apply-patch+yaml"
+        assert kwargs["body"].kind == "RoleBinding"
+        assert kwargs["body"].api_version == "rbac.authorization.k8s.io/v1"
+
+    def test_synced_index_avoids_get(self, repo):
+        """Test that the RoleBinding index serves the read."""
+        repo.binding_index = MagicMock(has_synced=True)
+        repo.binding_index.get.return_value = self.actual(repo)
+
+        repo.create_or_update_role_binding(**self.desired(repo))
+
+        repo.binding_index.get.assert_called_once_with("alice-dev-view", "dev")
+        repo._rbac_v1.read_namespaced_role_binding.assert_not_called()
+        repo._rbac_v1.patch_namespaced_role_binding.assert_not_called()
@@ -7,6 +7,8 @@ from kubernetes import client
 
 from app.services.rbac_service import RBACService
 from app.models.user import User, UserSpec, ClusterRoleBinding
+from app.exceptions import RBACReconcileError
+from app.utils.audit import AuditLogger, EventAction
 
 
 class TestRBACServiceUserBindings:
@@ -159,3 +161,177 @@ class TestRBACServiceCleanup:
         mock_rbac_repo.delete_role_binding.assert_called_once_with(
             "old-binding", "staging"
         )
+
+
+class TestRBACServiceOwnershipLabels:
+    """Tests for ownership labels on managed RBAC objects."""
+
+    def test_bindings_are_created_with_owner_labels(self, rbac_service, sample_user,
+                                                    mock_rbac_repo):
+        """Test that created bindings carry the user's owner labels."""
+        mock_rbac_repo.cluster_role_exists.return_value = True
+
+        rbac_service.create_user_role_bindings(sample_user)
+
+        for created in mock_rbac_repo.create_or_update_role_binding.call_args_list:
+            assert created.kwargs["labels"] == sample_user.owner_labels
+
+    def test_unchanged_bindings_are_not_audited(self, rbac_service, mock_rbac_repo,
+                                                mock_audit_logger, sample_user):
+        """Test that only bindings actually written reach the audit trail."""
+        mock_rbac_repo.cluster_role_exists.return_value = True
+        mock_rbac_repo.create_or_update_role_binding.return_value = "skipped"
+
+        rbac_service.create_user_role_bindings(sample_user)
+
+        assert mock_rbac_repo.create_or_update_role_binding.called
+        mock_audit_logger.log_create.assert_not_called()
+        mock_audit_logger.log_update.assert_not_called()
+
+    def test_patched_bindings_are_audited_as_updates(self, rbac_service, mock_rbac_repo,
+                                                     mock_audit_logger, sample_user):
+        """Test that a drifted binding is recorded as an update, not a create."""
+        mock_rbac_repo.cluster_role_exists.return_value = True
+        mock_rbac_repo.create_or_update_role_binding.return_value = "patched"
+
+        rbac_service.create_user_role_bindings(sample_user)
+
+        assert mock_audit_logger.log_update.call_count == \
+            mock_rbac_repo.create_or_update_role_binding.call_count
+        mock_audit_logger.log_create.assert_not_called()
+
+    def test_lookups_use_owner_selector(self, rbac_service, mock_rbac_repo, sample_user):
+        """Test that cleanup lookups only list the owner's bindings by default."""
+        mock_rbac_repo.find_bindings_for_subject.return_value = []
+        mock_rbac_repo.find_cluster_role_bindings_for_subject.return_value = []
+
+        rbac_service.delete_user_role_bindings(sample_user)
+
+        mock_rbac_repo.find_bindings_for_subject.assert_called_once_with(
+            subject_name=sample_user.name,
+            subject_kind="ServiceAccount",
+            label_selector=sample_user.owner_selector
+        )
+
+    def test_adoption_also_matches_unlabelled_bindings(self, mock_rbac_repo, mock_ns_repo,
+                                                       sample_user):
+        """Test that legacy bindings are found once and deleted once."""
+        rbac_service = RBACService(mock_rbac_repo, mock_ns_repo, adopt_unlabelled=True)
+        legacy = MagicMock()
+        legacy.metadata.name = "legacy"
+        legacy.metadata.namespace = "dev"
+        mock_rbac_repo.find_bindings_for_subject.side_effect = [[], [legacy]]
+        mock_rbac_repo.find_cluster_role_bindings_for_subject.return_value = []
+
+        rbac_service.delete_user_role_bindings(sample_user)
+
+        selectors = [
+            c.kwargs["label_selector"]
+            for c in mock_rbac_repo.find_bindings_for_subject.call_args_list
+        ]
+        assert selectors == [sample_user.owner_selector, "!app.kubernetes.io/managed-by"]
+        mock_rbac_repo.delete_role_binding.assert_called_once_with("legacy", "dev")
+
+
+class TestRBACServiceFanOut:
+    """Tests for concurrent binding reconciliation."""
+
+    def test_failures_are_aggregated(self, rbac_service, mock_rbac_repo, mock_ns_repo):
+        """Test that every binding is attempted and failures are reported together."""
+        user = User.from_dict({
+            "metadata": {"name": "alice", "namespace": "iam"},
+            "spec": {
+                "CRoles": [
+                    {"namespace": "dev", "clusterRole": "view"},
+                    {"namespace": "prod", "clusterRole": "view"},
+                    {"namespace": "qa", "clusterRole": "view"},
+                ],
+                "Roles": []
+            }
+        })
+        mock_rbac_repo.cluster_role_exists.return_value = True
+
+        def apply(name, namespace, **kwargs):
+            if namespace == "prod":
+                raise RuntimeError("forbidden")
+            return "created"
+
+        mock_rbac_repo.create_or_update_role_binding.side_effect = apply
+
+        with pytest.raises(RBACReconcileError) as exc_info:
+            rbac_service.create_user_role_bindings(user)
+
+        assert mock_rbac_repo.create_or_update_role_binding.call_count == 3
+        assert list(exc_info.value.failures) == ["prod/view"]
+        assert "1 of 3 bindings failed" in exc_info.value.message
+
+
+class RecordingPipeline:
+    """Audit pipeline keeping every submitted event."""
+
+    def __init__(self):
+        self.events = []
+
+    def submit(self, event):
+        self.events.append(event)
+        return True
+
+
+def binding(name, namespace=None):
+    """Build a binding as returned by the subject lookups."""
+    found = MagicMock()
+    found.metadata.name = name
+    found.metadata.namespace = namespace
+    return found
+
+
+class TestRBACServiceAuditAggregation:
+    """Tests for auditing bulk binding changes as one event."""
+
+    def make_service(self, mock_rbac_repo, mock_ns_repo, aggregate):
+        pipeline = RecordingPipeline()
+        audit = AuditLogger(pipeline=pipeline, aggregate_bindings=aggregate)
+        service = RBACService(rbac_repo=mock_rbac_repo, ns_repo=mock_ns_repo, audit_logger=audit)
+        mock_rbac_repo.find_bindings_for_subject.return_value = [
+            binding(f"devops-ns{i}-view", f"ns{i}") for i in range(50)
+        ]
+        mock_rbac_repo.find_cluster_role_bindings_for_subject.return_value = [binding("devops-admin")]
+        return service, pipeline
+
+    def test_group_teardown_is_one_event(self, mock_rbac_repo, mock_ns_repo, sample_group):
+        """Test that deleting many bindings logs a single summary event."""
+        service, pipeline = self.make_service(mock_rbac_repo, mock_ns_repo, aggregate=True)
+
+        service.delete_group_role_bindings(sample_group)
+
+        assert mock_rbac_repo.delete_role_binding.call_count == 50
+        [event] = pipeline.events
+        assert event.action == EventAction.UNBIND
+        assert event.subject.name == "devops"
+        assert event.details["count"] == 51
+        assert event.details["counts"] == {"delete": 51}
+        assert event.details["bindings"]["delete"][0] == "ns0/devops-ns0-view"
+        assert event.details["bindings"]["delete"][-1] == "devops-admin"
+
+    def test_update_mixes_deletes_and_creates(self, mock_rbac_repo, mock_ns_repo, sample_group):
+        """Test that nested cleanup and create steps share one summary event."""
+        service, pipeline = self.make_service(mock_rbac_repo, mock_ns_repo, aggregate=True)
+        for found in mock_rbac_repo.find_bindings_for_subject.return_value:
+            found.subjects = [MagicMock()]
+            found.role_ref.kind = "ClusterRole"
+            found.role_ref.name = "edit"
+
+        service.update_group_role_bindings(sample_group)
+
+        [event] = pipeline.events
+        assert event.action == EventAction.SYNC
+        assert event.details["counts"]["delete"] == 51
+        assert event.details["counts"]["create"] == 3
+
+    def test_full_fidelity_logs_every_binding(self, mock_rbac_repo, mock_ns_repo, sample_group):
+        """Test that without aggregation each binding gets its own event."""
+        service, pipeline = self.make_service(mock_rbac_repo, mock_ns_repo, aggregate=False)
+
+        service.delete_group_role_bindings(sample_group)
+
+        assert len(pipeline.events) == 51
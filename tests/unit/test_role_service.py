@@ -48,6 +48,19 @@ class TestRoleServiceCreate:
         assert result["clusterRole"] == "custom-cluster-role"
         mock_rbac_repo.create_cluster_role.assert_called_once()
 
+    def test_create_cluster_role_long_name(self, role_service, sample_cluster_role_body,
+                                            sample_role_spec, mock_rbac_repo):
+        """Test that a name over 63 characters stays whole in the annotation only."""
+        name = "cluster-role-" + "x" * 100
+        sample_cluster_role_body["metadata"]["name"] = name
+        mock_rbac_repo.cluster_role_exists.return_value = False
+
+        role_service.create_role(sample_cluster_role_body, sample_role_spec, "default")
+
+        _, _, labels, annotations = mock_rbac_repo.create_cluster_role.call_args.args
+        assert len(labels["k8sio.auth/owner-name"]) <= 63
+        assert annotations == {"k8sio.auth/owner-name": name}
+
     def test_create_role_waits_for_namespace(self, role_service, sample_role_body,
                                               sample_role_spec, mock_ns_repo,
                                               mock_rbac_repo):
@@ -0,0 +1,175 @@
+"""Unit tests for the Informer and RoleBindingIndex."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from app.repositories.informer import Informer, HTTP_GONE
+from app.repositories.rolebinding_index import RoleBindingIndex
+from app.repositories.rbac_repository import RBACRepository
+
+
+def make_binding(name, namespace, subjects, resource_version="1"):
+    """Build a V1RoleBinding with the given (kind, name) subjects."""
+    return client.V1RoleBinding(
+        metadata=client.V1ObjectMeta(
+            name=name, namespace=namespace, resource_version=resource_version
+        ),
+        role_ref=client.V1RoleRef(
+            api_group="rbac.authorization.k8s.io", kind="ClusterRole", name="view"
+        ),
+        subjects=[
+            client.RbacV1Subject(kind=kind, name=subject_name, namespace=namespace)
+            for kind, subject_name in subjects
+        ],
+    )
+
+
+def make_list(items, resource_version="100"):
+    """Build a V1RoleBindingList."""
+    return client.V1RoleBindingList(
+        items=items,
+        metadata=client.V1ListMeta(resource_version=resource_version),
+    )
+
+
+@pytest.fixture
+def rbac_api():
+    """Create a mock RBAC API with an initial RoleBinding list."""
+    api = MagicMock()
+    api.list_role_binding_for_all_namespaces.return_value = make_list([
+        make_binding("alice-dev-view", "dev", [("ServiceAccount", "alice")]),
+        make_binding("alice-prod-view", "prod", [("ServiceAccount", "alice")]),
+        make_binding("ops-dev-view", "dev", [("Group", "ops"), ("ServiceAccount", "alice")]),
+    ])
+    return api
+
+
+@pytest.fixture
+def index(rbac_api):
+    """Create a RoleBindingIndex populated from the initial list."""
+    idx = RoleBindingIndex(rbac_api)
+    idx._informer._relist()
+    return idx
+
+
+class TestInformer:
+    """Tests for the generic list/watch informer."""
+
+    def test_relist_populates_store_and_syncs(self, rbac_api):
+        """Test that the initial LIST fills the store."""
+        informer = Informer(rbac_api.list_role_binding_for_all_namespaces, name="rb")
+
+        assert not informer.has_synced
+        resource_version = informer._relist()
+
+        assert informer.has_synced
+        assert resource_version == "100"
+        assert len(informer.list()) == 3
+        assert informer.get("dev", "alice-dev-view") is not None
+
+    def test_handle_event_returns_resource_version(self, rbac_api):
+        """Test that watch events advance the resourceVersion."""
+        informer = Informer(rbac_api.list_role_binding_for_all_namespaces, name="rb")
+        informer._relist()
+
+        binding = make_binding("new", "dev", [("User", "bob")], resource_version="101")
+        assert informer._handle_event({"type": "ADDED", "object": binding}) == "101"
+        assert informer.get("dev", "new") is binding
+
+    def test_raw_dict_objects_are_supported(self):
+        """Test that custom object (dict) responses are handled."""
+        list_func = MagicMock(return_value={
+            "metadata": {"resourceVersion": "7"},
+            "items": [{"metadata": {"name": "u1", "namespace": "iam"}}],
+        })
+        informer = Informer(list_func, name="users")
+
+        assert informer._relist() == "7"
+        assert informer.get("iam", "u1") == {"metadata": {"name": "u1", "namespace": "iam"}}
+
+    def test_watch_expiry_triggers_relist(self, rbac_api):
+        """Test that a 410 Gone during watch leads to a fresh LIST."""
+        informer = Informer(rbac_api.list_role_binding_for_all_namespaces, name="rb")
+        calls = []
+
+        def fake_watch(resource_version):
+            calls.append(resource_version)
+            if len(calls) == 1:
+                raise ApiException(status=HTTP_GONE)
+            informer._running = False
+            return resource_version
+
+        informer._watch_from = fake_watch
+        informer._running = True
+        informer._run()
+
+        assert rbac_api.list_role_binding_for_all_namespaces.call_count == 2
+        assert calls == ["100", "100"]
+
+
+class TestRoleBindingIndex:
+    """Tests for subject lookups on the RoleBinding index."""
+
+    def test_find_by_subject(self, index):
+        """Test lookup of all bindings for a subject."""
+        names = {b.metadata.name for b in index.find_by_subject("ServiceAccount", "alice")}
+
+        assert names == {"alice-dev-view", "alice-prod-view", "ops-dev-view"}
+
+    def test_find_by_subject_kind_must_match(self, index):
+        """Test that subject kind is part of the key."""
+        assert index.find_by_subject("Group", "alice") == []
+        assert len(index.find_by_subject("Group", "ops")) == 1
+
+    def test_find_by_subject_in_namespace(self, index):
+        """Test lookup restricted to a namespace."""
+        names = {b.metadata.name for b in index.find_by_subject("ServiceAccount", "alice", "prod")}
+
+        assert names == {"alice-prod-view"}
+
+    def test_modified_event_reindexes_subjects(self, index):
+        """Test that a subject removed from a binding is unindexed."""
+        updated = make_binding("ops-dev-view", "dev", [("Group", "ops")], "101")
+
+        index._informer._handle_event({"type": "MODIFIED", "object": updated})
+
+        names = {b.metadata.name for b in index.find_by_subject("ServiceAccount", "alice")}
+        assert "ops-dev-view" not in names
+        assert index.find_by_subject("Group", "ops") == [updated]
+
+    def test_deleted_event_removes_binding(self, index):
+        """Test that deleted bindings disappear from the index."""
+        deleted = make_binding("alice-prod-view", "prod", [("ServiceAccount", "alice")], "102")
+
+        index._informer._handle_event({"type": "DELETED", "object": deleted})
+
+        assert index.find_by_subject("ServiceAccount", "alice", "prod") == []
+        assert index.get("alice-prod-view", "prod") is None
+
+
+class TestRBACRepositoryWithIndex:
+    """Tests for RBACRepository subject lookups through the index."""
+
+    def test_uses_index_when_synced(self, index):
+        """Test that no API call is made once the index has synced."""
+        repo = RBACRepository(api_client=MagicMock(), binding_index=index)
+        repo._rbac_v1 = MagicMock()
+
+        bindings = repo.find_bindings_for_subject("alice", "ServiceAccount")
+
+        assert len(bindings) == 3
+        repo._rbac_v1.list_namespaced_role_binding.assert_not_called()
+
+    def test_falls_back_to_api_before_sync(self, rbac_api):
+        """Test that an unsynced index is bypassed."""
+        unsynced = RoleBindingIndex(rbac_api)
+        repo = RBACRepository(api_client=MagicMock(), binding_index=unsynced)
+        repo._rbac_v1 = MagicMock()
+        repo._rbac_v1.list_namespaced_role_binding.return_value = make_list([])
+
+        repo.find_bindings_for_subject("alice", "ServiceAccount", namespace="dev")
+
+        repo._rbac_v1.list_namespaced_role_binding.assert_called_once_with(namespace="dev")
@@ -0,0 +1,39 @@
+"""Unit tests for the kubeconfig rotation command."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import rotate_kubeconfigs
+
+
+@pytest.fixture
+def container(monkeypatch):
+    """Replace the container and API client used by the command."""
+    container = MagicMock()
+    monkeypatch.setattr(rotate_kubeconfigs, "get_container", lambda: container)
+    monkeypatch.setattr(rotate_kubeconfigs, "BaseRepository", MagicMock())
+    return container
+
+
+class TestRotateKubeconfigsMain:
+    """Tests for the command's lifecycle."""
+
+    def test_shuts_down_container_after_rotation(self, container, monkeypatch, tmp_path):
+        """Test that audit events are flushed once the rotation is done."""
+        rotator = MagicMock()
+        rotator.return_value.rotate.return_value = MagicMock(failed=0, failures={})
+        monkeypatch.setattr(rotate_kubeconfigs, "KubeconfigRotator", rotator)
+
+        assert rotate_kubeconfigs.main(["--checkpoint", str(tmp_path / "ckpt")]) == 0
+        container.shutdown.assert_called_once()
+
+    def test_shuts_down_container_when_rotation_fails(self, container, monkeypatch, tmp_path):
+        """Test that the container is shut down even if the rotation raises."""
+        rotator = MagicMock()
+        rotator.return_value.rotate.side_effect = RuntimeError("boom")
+        monkeypatch.setattr(rotate_kubeconfigs, "KubeconfigRotator", rotator)
+
+        with pytest.raises(RuntimeError):
+            rotate_kubeconfigs.main(["--checkpoint", str(tmp_path / "ckpt")])
+        container.shutdown.assert_called_once()
@@ -0,0 +1,67 @@
+"""Unit tests for SecretRepository."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes import client
+
+from app.repositories import secret_repository
+from app.repositories.secret_repository import SecretRepository
+
+
+def make_secret(token=None, resource_version="1"):
+    """Build a token secret, optionally populated."""
+    return client.V1Secret(
+        metadata=client.V1ObjectMeta(name="alice-token", namespace="iam",
+                                     resource_version=resource_version),
+        data={"token": token} if token else None,
+    )
+
+
+@pytest.fixture
+def repo():
+    """Create a SecretRepository with a mocked core API."""
+    repository = SecretRepository(api_client=MagicMock())
+    repository._core_v1 = MagicMock()
+    return repository
+
+
+class TestWaitForToken:
+    """Tests for waiting on the token controller."""
+
+    def test_populated_secret_returns_without_watch(self, repo):
+        """Test that an existing token is returned from the first read."""
+        repo._core_v1.read_namespaced_secret.return_value = make_secret("dG9rZW4=")
+
+        with patch.object(secret_repository.watch, "Watch") as watch_cls:
+            assert repo.wait_for_token("alice-token", "iam") == "dG9rZW4="
+
+        watch_cls.assert_not_called()
+
+    def test_watches_single_secret_from_read_version(self, repo):
+        """Test that the watch is scoped to the secret and resumes at its version."""
+        repo._core_v1.read_namespaced_secret.return_value = make_secret(resource_version="42")
+        w = MagicMock()
+        w.stream.return_value = iter([
+            {"type": "MODIFIED", "object": make_secret(resource_version="43")},
+            {"type": "MODIFIED", "object": make_secret("dG9rZW4=", "44")},
+        ])
+
+        with patch.object(secret_repository.watch, "Watch", return_value=w):
+            token = repo.wait_for_token("alice-token", "iam", timeout_seconds=5)
+
+        assert token == "dG9rZW4="
+        kwargs = w.stream.call_args.kwargs
+        assert kwargs["field_selector"] == "metadata.name=alice-token"
+        assert kwargs["resource_version"] == "42"
+        assert kwargs["timeout_seconds"] == 5
+        w.stop.assert_called_once()
+
+    def test_returns_none_on_timeout(self, repo):
+        """Test that a token that never appears yields None."""
+        repo._core_v1.read_namespaced_secret.return_value = make_secret()
+        w = MagicMock()
+        w.stream.return_value = iter([])
+
+        with patch.object(secret_repository.watch, "Watch", return_value=w):
+            assert repo.wait_for_token("alice-token", "iam") is None
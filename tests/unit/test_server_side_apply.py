@@ -0,0 +1,75 @@
+"""Unit tests for server-side apply of objects shared with other managers."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from app.exceptions import ResourceAlreadyExistsError
+from app.repositories.base import conflicting_fields, drop_field
+from app.repositories.namespace_repository import NamespaceRepository
+
+
+def conflict(*fields):
+    """Build the 409 an apply gets for fields owned by another manager."""
+    e = ApiException(status=409, reason="Conflict")
+    e.body = json.dumps({"details": {"causes": [
+        {"type": "FieldManagerConflict", "message": 'conflict with "kubectl"', "field": field}
+        for field in fields
+    ]}})
+    return e
+
+
+@pytest.fixture
+def ns_repo():
+    """Create a NamespaceRepository with a mocked core API."""
+    repo = NamespaceRepository(api_client=MagicMock())
+    repo._core_v1 = MagicMock()
+    return repo
+
+
+class TestSharedApply:
+    """Tests for applies that leave other managers' fields alone."""
+
+    def test_namespace_apply_is_not_forced(self, ns_repo):
+        """Test that ensuring a namespace doesn't take over fields."""
+        ns_repo.ensure_exists("alice", labels={"team": "a"})
+
+        assert ns_repo._core_v1.patch_namespace.call_args.kwargs["force"] is False
+
+    def test_conflicting_labels_are_left_to_their_owner(self, ns_repo):
+        """Test that a label set by someone else keeps its value."""
+        ns_repo._core_v1.patch_namespace.side_effect = [conflict(".metadata.labels.app.io/team"), "applied"]
+
+        result = ns_repo.ensure_exists("alice", labels={"app.io/team": "a", "owner": "op"})
+
+        assert result == "applied"
+        body = ns_repo._core_v1.patch_namespace.call_args.kwargs["body"]
+        assert body["metadata"]["labels"] == {"owner": "op"}
+
+    def test_conflict_without_fields_raises(self, ns_repo):
+        """Test that other conflicts are not retried."""
+        ns_repo._core_v1.patch_namespace.side_effect = ApiException(status=409, reason="Conflict")
+
+        with pytest.raises(ResourceAlreadyExistsError):
+            ns_repo.ensure_exists("alice")
+        ns_repo._core_v1.patch_namespace.assert_called_once()
+
+
+class TestConflictFields:
+    """Tests for reading and dropping conflicting fields."""
+
+    def test_conflicting_fields(self):
+        """Test that only field manager conflicts are returned."""
+        assert conflicting_fields(conflict(".spec.x")) == [".spec.x"]
+        assert conflicting_fields(ApiException(status=422)) == []
+
+    def test_drop_field(self):
+        """Test that nested fields and dotted label keys are removed."""
+        body = {"metadata": {"annotations": {"a.b/c": "1", "d": "2"}}, "automountServiceAccountToken": True}
+
+        drop_field(body, ".metadata.annotations.a.b/c")
+        drop_field(body, ".automountServiceAccountToken")
+
+        assert body == {"metadata": {"annotations": {"d": "2"}}}
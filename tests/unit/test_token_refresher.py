@@ -0,0 +1,59 @@
+"""Unit tests for the bound token refresher."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from app.services.kubeconfig_service import TOKEN_EXPIRES_ANNOTATION, KubeconfigService
+from app.services.token_refresher import TokenRefresher
+from app.utils.labels import owner_labels
+
+
+def make_secret(owner, expires_in):
+    """Build a kubeconfig secret owned by a User, with a token expiry."""
+    expires = datetime.now(timezone.utc) + expires_in
+    return client.V1Secret(metadata=client.V1ObjectMeta(
+        name=f"{owner}-cluster-config",
+        labels=owner_labels("User", owner, "iam"),
+        annotations={TOKEN_EXPIRES_ANNOTATION: expires.isoformat()},
+    ))
+
+
+def make_refresher(secrets):
+    """Build a refresher over the given kubeconfig secrets."""
+    service = KubeconfigService(secret_repo=MagicMock(), sa_repo=MagicMock(),
+                                token_expiration_seconds=3600)
+    service.create_kubeconfig_secret = MagicMock()
+    secret_repo = MagicMock()
+    secret_repo.iter_kubeconfig_secrets.return_value = secrets
+    custom_api = MagicMock()
+    custom_api.get_namespaced_custom_object.side_effect = lambda **kw: {
+        "metadata": {"name": kw["name"], "namespace": kw["namespace"]},
+        "spec": {"type": "human"},
+    }
+    return TokenRefresher(service, secret_repo, custom_api), service, custom_api
+
+
+class TestTokenRefresher:
+    """Tests for TokenRefresher."""
+
+    def test_refreshes_only_expiring_tokens(self):
+        """Test that only kubeconfigs close to expiry are regenerated."""
+        refresher, service, _ = make_refresher([
+            make_secret("alice", timedelta(minutes=5)),
+            make_secret("bob", timedelta(minutes=50)),
+        ])
+
+        assert refresher.refresh_due() == 1
+        user = service.create_kubeconfig_secret.call_args.args[0]
+        assert (user.namespace, user.name) == ("iam", "alice")
+
+    def test_skips_deleted_users(self):
+        """Test that a kubeconfig whose User is gone is left alone."""
+        refresher, service, custom_api = make_refresher([make_secret("alice", timedelta(0))])
+        custom_api.get_namespaced_custom_object.side_effect = ApiException(status=404)
+
+        assert refresher.refresh_due() == 0
+        service.create_kubeconfig_secret.assert_not_called()
@@ -0,0 +1,69 @@
+"""Unit tests for User Kopf handlers."""
+
+import asyncio
+
+import kopf
+
+from app import kopf_handlers
+from app.kopf_handlers.user_handlers import user_type_label_handler
+from app.utils.labels import USER_TYPE_LABEL
+
+
+class TestUserTypeLabelHandler:
+    """Tests for mirroring the User type into a label."""
+
+    def test_labels_human_user(self):
+        """Test that a human User gets the human label."""
+        patch = {}
+
+        user_type_label_handler({"type": "human"}, {}, patch)
+
+        assert patch == {"metadata": {"labels": {USER_TYPE_LABEL: "human"}}}
+
+    def test_legacy_enabled_user_is_human(self):
+        """Test that the legacy enabled flag maps to human."""
+        patch = {}
+
+        user_type_label_handler({"enabled": True}, None, patch)
+
+        assert patch["metadata"]["labels"][USER_TYPE_LABEL] == "human"
+
+    def test_matching_label_is_not_patched(self):
+        """Test that an up to date label produces no patch."""
+        patch = {}
+
+        user_type_label_handler({}, {USER_TYPE_LABEL: "serviceAccount"}, patch)
+
+        assert patch == {}
+
+    def test_invalid_type_is_ignored(self):
+        """Test that an invalid spec doesn't raise."""
+        patch = {}
+
+        user_type_label_handler({"type": "robot"}, {}, patch)
+
+        assert patch == {}
+
+
+class TestUserHandlerRegistration:
+    """Tests for how the User handlers are registered with Kopf."""
+
+    def test_label_changes_do_not_trigger_update(self):
+        """Test that the update handler only reacts to spec changes.
+
+        The user-type label patch changes the object's essence; reacting to
+        it would run a full reconcile after every create and resume.
+        """
+        registry = kopf.get_default_registry()
+        [handler] = [
+            h for h in registry._changing.get_all_handlers()
+            if h.fn is kopf_handlers.update_user_fn
+        ]
+
+        assert handler.field == ("spec",)
+
+    def test_reconcile_handlers_run_on_kopf_executor(self):
+        """Test that blocking handlers are sync, so Kopf runs them on its executor."""
+        for fn in (kopf_handlers.create_user_fn, kopf_handlers.update_user_fn,
+                   kopf_handlers.delete_user_fn, kopf_handlers.namespace_created_fn):
+            assert not asyncio.iscoroutinefunction(fn)
@@ -1,10 +1,12 @@
 """Unit tests for UserService."""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, call, ANY
 
 from app.services.user_service import UserService
 from app.exceptions import ValidationError, ResourceNotFoundError
+from app.utils.labels import owner_labels
 
 
 class TestUserServiceCreate:
@@ -19,7 +21,7 @@ class TestUserServiceCreate:
 
         assert result["state"] == "ready"
         assert result["serviceAccount"] == "test-user"
-        mock_sa_repo.create.assert_called_once()
+        mock_sa_repo.ensure_exists.assert_called_once()
 
     def test_create_user_enabled_creates_token(self, user_service, sample_user_body,
                                                  sample_user_spec, mock_secret_repo):
@@ -88,6 +90,24 @@ class TestUserServiceCreate:
         mock_ns_repo.ensure_exists.assert_called_once()
         mock_secret_repo.ensure_service_account_token.assert_called_once()
 
+    def test_create_human_user_with_token_request_skips_token_secret(
+        self, user_service, mock_sa_repo, mock_secret_repo
+    ):
+        """Test that TokenRequest mode doesn't create a legacy token secret."""
+        mock_sa_repo.create_token.return_value = MagicMock(
+            token="bound-token", expiration_timestamp=datetime.now(timezone.utc)
+        )
+        user_service.kubeconfig_service.sa_repo = mock_sa_repo
+        body = {
+            "metadata": {"name": "human-user", "namespace": "iam"},
+            "spec": {"type": "human", "CRoles": [], "Roles": []}
+        }
+
+        user_service.create_user(body, body["spec"], "iam")
+
+        mock_secret_repo.ensure_service_account_token.assert_not_called()
+        mock_sa_repo.create_token.assert_called_once()
+
     def test_create_user_with_type_serviceaccount(self, user_service, mock_sa_repo,
                                                     mock_ns_repo, mock_secret_repo):
         """Test creating user with explicit type: serviceAccount."""
@@ -119,9 +139,10 @@ class TestUserServiceCreate:
         result = user_service.create_user(body, spec, "iam")
 
         # SA should be created in targetNamespace
-        mock_sa_repo.create.assert_called_once_with(
+        mock_sa_repo.ensure_exists.assert_called_once_with(
             name="app-sa",
-            namespace="production"
+            namespace="production",
+            labels=owner_labels("User", "app-sa", "iam")
         )
         assert result["namespace"] == "production"
 
@@ -129,28 +150,23 @@ class TestUserServiceCreate:
 class TestUserServiceUpdate:
     """Tests for UserService.update_user method."""
 
-    def test_update_user_patches_sa(self, user_service, sample_user_body,
-                                     sample_user_spec, mock_sa_repo):
-        """Test that update patches service account."""
+    def test_update_user_applies_sa(self, user_service, sample_user_body,
+                                    sample_user_spec, mock_sa_repo):
+        """Test that update applies the service account."""
         result = user_service.update_user(
             sample_user_body, sample_user_spec, "default"
         )
 
         assert result["state"] == "ready"
-        mock_sa_repo.update.assert_called_once()
-
-    def test_update_user_recreates_deleted_sa(self, user_service, sample_user_body,
-                                               sample_user_spec, mock_sa_repo):
-        """Test that deleted SA is recreated on update."""
-        mock_sa_repo.update.side_effect = ResourceNotFoundError(
-            "ServiceAccount", "test-user", "default"
-        )
+        mock_sa_repo.ensure_exists.assert_called_once()
 
-        result = user_service.update_user(
-            sample_user_body, sample_user_spec, "default"
-        )
+    def test_update_user_applies_sa_in_one_request(self, user_service, sample_user_body,
+                                                   sample_user_spec, mock_sa_repo):
+        """Test that a deleted SA is recreated without a patch-then-create fallback."""
+        user_service.update_user(sample_user_body, sample_user_spec, "default")
 
-        mock_sa_repo.create.assert_called_once()
+        mock_sa_repo.update.assert_not_called()
+        mock_sa_repo.create.assert_not_called()
 
     def test_update_user_disabled_deletes_namespace(self, user_service, mock_ns_repo):
         """Test that disabling user deletes namespace."""
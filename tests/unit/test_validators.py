@@ -1,8 +1,12 @@
 """Unit tests for validators module."""
 
+import timeit
+
 import pytest
 
+from app import validators
 from app.validators import (
+    SpecCache,
     validate_dns_label,
     validate_kubernetes_name,
     validate_namespace,
@@ -293,3 +297,81 @@ class TestValidateGroupSpec:
         result = validate_group_spec(spec)
         assert result["CRoles"] == []
         assert result["Roles"] == []
+
+
+def large_group_spec(size=1000):
+    """Build a Group spec with many CRoles entries."""
+    return {
+        "CRoles": [{"namespace": f"team-{i}", "clusterRole": f"role-{i % 7}"} for i in range(size)],
+        "Roles": [f"custom-{i}" for i in range(50)],
+    }
+
+
+class TestSpecMemoization:
+    """Tests for skipping validation of unchanged objects."""
+
+    def test_same_generation_skips_validation(self, monkeypatch):
+        """Test that an unchanged object is validated once."""
+        calls = []
+        validate = validators._validate_group_spec
+        monkeypatch.setattr(validators, "_validate_group_spec",
+                            lambda spec: calls.append(spec) or validate(spec))
+        metadata = {"uid": "memo-uid-1", "generation": 1}
+
+        first = validate_group_spec({"Roles": ["role1"]}, metadata)
+        second = validate_group_spec({"Roles": ["role1"]}, metadata)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_cached_spec_is_read_only(self):
+        """Test that a shared cached spec can't be changed by a caller."""
+        metadata = {"uid": "memo-uid-4", "generation": 1}
+        validated = validate_group_spec({"Roles": ["role1"]}, metadata)
+
+        with pytest.raises(TypeError):
+            validated["Roles"] = []
+        with pytest.raises(AttributeError):
+            validated["Roles"].append("role2")
+        assert validate_group_spec({"Roles": ["role1"]}, metadata)["Roles"] == ("role1",)
+
+    def test_new_generation_is_validated(self):
+        """Test that a changed spec is validated again."""
+        validate_group_spec({"Roles": ["role1"]}, {"uid": "memo-uid-2", "generation": 1})
+
+        with pytest.raises(ValidationError):
+            validate_group_spec({"Roles": ["role1", "role1"]}, {"uid": "memo-uid-2", "generation": 2})
+
+    def test_invalid_spec_is_not_remembered(self):
+        """Test that failures raise on every call."""
+        metadata = {"uid": "memo-uid-3", "generation": 1}
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_user_spec({"enabled": "yes"}, metadata)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within its size."""
+        cache = SpecCache(max_entries=2)
+        cache.put("a", {"a": 1})
+        cache.put("b", {"b": 1})
+        cache.get("a")
+        cache.put("c", {"c": 1})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"a": 1}
+
+
+@pytest.mark.slow
+class TestSpecValidationBenchmark:
+    """Benchmark of validating a spec with 1,000 CRoles entries."""
+
+    def test_memoized_reconcile_skips_validation(self):
+        """Test that revalidating an unchanged object is far cheaper than validating it."""
+        spec = large_group_spec()
+        metadata = {"uid": "bench-uid", "generation": 1}
+        validate_group_spec(spec, metadata)
+
+        full = min(timeit.repeat(lambda: validators._validate_group_spec(spec), number=20, repeat=3)) / 20
+        memoized = min(timeit.repeat(lambda: validate_group_spec(spec, metadata), number=20, repeat=3)) / 20
+
+        assert full / memoized >= 100
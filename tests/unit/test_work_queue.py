@@ -0,0 +1,77 @@
+"""Unit tests for the coalescing work queue."""
+
+import threading
+
+from app.utils.work_queue import CoalescingQueue
+
+
+class Recorder:
+    """Processor recording calls and signalling when one happens."""
+
+    def __init__(self):
+        self.calls = []
+        self.called = threading.Event()
+
+    def __call__(self, key, payload):
+        self.calls.append((key, payload))
+        self.called.set()
+
+
+class TestCoalescingQueue:
+    """Tests for CoalescingQueue."""
+
+    def test_merges_items_with_same_key(self):
+        """Test that repeated enqueues collapse into one item with the latest payload."""
+        recorder = Recorder()
+        queue = CoalescingQueue("test", recorder, window_seconds=60)
+
+        assert queue.enqueue("alice", 1) is True
+        assert queue.enqueue("alice", 2) is False
+        assert queue.enqueue("bob", 3) is True
+        assert queue.depth == 2
+
+        queue.flush()
+
+        assert recorder.calls == [("alice", 2), ("bob", 3)]
+        assert queue.depth == 0
+
+    def test_worker_processes_after_window(self):
+        """Test that the worker processes an item once its window expires."""
+        recorder = Recorder()
+        queue = CoalescingQueue("test", recorder, window_seconds=0.01)
+        queue.start()
+        try:
+            queue.enqueue("alice", 1)
+            assert recorder.called.wait(timeout=2)
+        finally:
+            queue.stop()
+
+        assert recorder.calls == [("alice", 1)]
+
+    def test_stop_flushes_pending_items(self):
+        """Test that stopping processes items still inside their window."""
+        recorder = Recorder()
+        queue = CoalescingQueue("test", recorder, window_seconds=60)
+        queue.start()
+        queue.enqueue("alice", 1)
+
+        queue.stop()
+
+        assert recorder.calls == [("alice", 1)]
+
+    def test_processor_errors_do_not_stop_processing(self):
+        """Test that a failing item doesn't block the rest."""
+        calls = []
+
+        def processor(key, payload):
+            calls.append(key)
+            if key == "alice":
+                raise RuntimeError("boom")
+
+        queue = CoalescingQueue("test", processor, window_seconds=60)
+        queue.enqueue("alice")
+        queue.enqueue("bob")
+
+        queue.flush()
+
+        assert calls == ["alice", "bob"]